@@ -4,14 +4,26 @@ import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from re import compile as regexp
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
+import semantic_release
+from semantic_release.changelog.section_cache import (
+    ReleaseSectionCache,
+    ReleaseSectionCacheExtension,
+)
+from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+
 if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+    from typing import Iterable
+
     from jinja2 import Environment
 
     from semantic_release.changelog.release_history import Release, ReleaseHistory
+    from semantic_release.commit_parser._base import CommitParser
     from semantic_release.hvcs._base import HvcsBase
     from semantic_release.version.version import Version
 
@@ -56,12 +68,19 @@ class ChangelogContext:
     changelog_insertion_flag: str
     mask_initial_release: bool
     filters: tuple[Callable[..., Any], ...] = ()
+    section_cache: ReleaseSectionCache | None = None
 
     def bind_to_environment(self, env: Environment) -> Environment:
         env.globals["context"] = self
         env.globals["ctx"] = self
         for f in self.filters:
             env.filters[f.__name__] = f
+
+        if ReleaseSectionCacheExtension.identifier not in env.extensions:
+            env.add_extension(ReleaseSectionCacheExtension)
+
+        section_cache_ext = env.extensions[ReleaseSectionCacheExtension.identifier]
+        section_cache_ext.cache = self.section_cache  # type: ignore[attr-defined]
         return env
 
 
@@ -72,6 +91,9 @@ def make_changelog_context(
     prev_changelog_file: Path,
     insertion_flag: str,
     mask_initial_release: bool,
+    section_cache_dir: Path | None = None,
+    commit_parser: CommitParser | None = None,
+    exclude_commit_patterns: Iterable[Pattern[str]] = (),
 ) -> ChangelogContext:
     return ChangelogContext(
         repo_name=hvcs_client.repo_name,
@@ -86,7 +108,41 @@ def make_changelog_context(
             *hvcs_client.get_changelog_context_filters(),
             read_file,
             convert_md_to_rst,
+            convert_md_to_rst_bulk,
             autofit_text_width,
+            autofit_text_width_bulk,
+        ),
+        section_cache=ReleaseSectionCache(
+            cache_dir=section_cache_dir,
+            namespace=str.join(
+                " ",
+                [
+                    # the filters which the templates call belong to this version
+                    semantic_release.__version__,
+                    hvcs_client.__class__.__name__.lower(),
+                    # links within a section are all relative to the repository url
+                    hvcs_client.create_repo_url(repo_path="")
+                    if isinstance(hvcs_client, RemoteHvcsBase)
+                    else f"{hvcs_client.owner}/{hvcs_client.repo_name}",
+                    # the parser & exclusions decide which commits make a section,
+                    # and how each of them is described
+                    *(
+                        [
+                            str.join(
+                                ".",
+                                [
+                                    commit_parser.__class__.__module__,
+                                    commit_parser.__class__.__qualname__,
+                                ],
+                            ),
+                            repr(commit_parser.options),
+                        ]
+                        if commit_parser is not None
+                        else []
+                    ),
+                    *(pattern.pattern for pattern in exclude_commit_patterns),
+                ],
+            ),
         ),
     )
 
@@ -104,32 +160,66 @@ def read_file(filepath: str) -> str:
         return ""
 
 
+# Ordered markdown to reStructuredText conversions as
+# (substring required for a match, pattern, replacement)
+md_to_rst_conversions: tuple[tuple[str, Pattern[str], str], ...] = (
+    # Replace markdown doubleunder bold with rst bold
+    ("__", regexp(r"(?<=\s)__(.+?)__(?=\s|$)"), r"**\1**"),
+    # Replace markdown italics with rst italics
+    ("_", regexp(r"(?<=\s)_([^_].+?[^_])_(?=\s|$)"), r"*\1*"),
+    # Replace markdown bullets with rst bullets
+    ("-", regexp(r"^(\s*)-(\s)"), r"\1*\2"),
+    # Replace markdown inline raw content with rst inline raw content
+    ("`", regexp(r"(?<=\s)(`[^`]+`)(?![`_])"), r"`\1`"),
+    # Replace markdown inline link with rst inline link
+    (
+        "](",
+        regexp(r"(?<=\s)\[([^\]]+)\]\(([^)]+)\)(?=\s|$)"),
+        r"`\1 <\2>`_",
+    ),
+)
+
+
 def convert_md_to_rst(md_content: str) -> str:
     rst_content = md_content
-    replacements = {
-        # Replace markdown doubleunder bold with rst bold
-        "bold-inline": (regexp(r"(?<=\s)__(.+?)__(?=\s|$)"), r"**\1**"),
-        # Replace markdown italics with rst italics
-        "italic-inline": (regexp(r"(?<=\s)_([^_].+?[^_])_(?=\s|$)"), r"*\1*"),
-        # Replace markdown bullets with rst bullets
-        "bullets": (regexp(r"^(\s*)-(\s)"), r"\1*\2"),
-        # Replace markdown inline raw content with rst inline raw content
-        "raw-inline": (regexp(r"(?<=\s)(`[^`]+`)(?![`_])"), r"`\1`"),
-        # Replace markdown inline link with rst inline link
-        "link-inline": (
-            regexp(r"(?<=\s)\[([^\]]+)\]\(([^)]+)\)(?=\s|$)"),
-            r"`\1 <\2>`_",
-        ),
-    }
-
-    for pattern, replacement in replacements.values():
-        rst_content = pattern.sub(replacement, rst_content)
+    for required_substr, pattern, replacement in md_to_rst_conversions:
+        # Skip the regex scan when the content cannot possibly match
+        if required_substr in rst_content:
+            rst_content = pattern.sub(replacement, rst_content)
 
     return rst_content
 
 
+def convert_md_to_rst_bulk(md_contents: Iterable[str]) -> list[str]:
+    """
+    Convert many markdown blocks (ex. every commit description of a release) to
+    reStructuredText at once, returning the converted blocks in the same order.
+    """
+    md_blocks = list(md_contents)
+    section = str.join("\n", md_blocks)
+    if not any(
+        required_substr in section for required_substr, _, _ in md_to_rst_conversions
+    ):
+        return md_blocks
+
+    return [convert_md_to_rst(md_block) for md_block in md_blocks]
+
+
 def autofit_text_width(text: str, maxwidth: int = 100, indent_size: int = 0) -> str:
     """Format the description text to fit within a specified width"""
+    return _autofit_text_width(text, maxwidth, indent_size)
+
+
+def autofit_text_width_bulk(
+    texts: Iterable[str], maxwidth: int = 100, indent_size: int = 0
+) -> list[str]:
+    """Format each of the description texts to fit within a specified width"""
+    return [_autofit_text_width(text, maxwidth, indent_size) for text in texts]
+
+
+# Typed so that markup safe strings are never returned for plain strings & vice versa
+@lru_cache(maxsize=4096, typed=True)
+def _autofit_text_width(text: str, maxwidth: int, indent_size: int) -> str:
     input_text = text.strip()
 
     if len(input_text) <= maxwidth:
@@ -141,36 +231,43 @@ def autofit_text_width(text: str, maxwidth: int = 100, indent_size: int = 0) ->
 
     # Re-format text to fit within the maxwidth
     for paragraph in input_text.split("\n\n"):
-        formatted_paragraph = []
-
         # Split the paragraph into words with no empty strings
-        words = list(
-            filter(
-                None, paragraph.replace("\r", "").replace("\n", " ").strip().split(" ")
-            )
-        )
-
-        # Initialize the line for each paragraph
-        line = words[0]
-        next_line = ""
+        words = [
+            word
+            for word in paragraph.replace("\r", "")
+            .replace("\n", " ")
+            .strip()
+            .split(" ")
+            if word
+        ]
+
+        # Find where each line starts by only tracking the length of the current
+        # line, the lines are assembled afterwards
+        line_starts = [0]
+        line_width = len(words[0])
+
+        for i in range(1, len(words)):
+            word_width = len(words[i])
 
-        for word in words[1:]:
             # Check if the current line + the next word (and a space) will fit within the maxwidth
-            # If it does, then update the current line
-            next_line = f"{line} {word}"
-            if len(next_line) <= maxwidth:
-                line = next_line
+            if line_width + 1 + word_width <= maxwidth:
+                line_width += 1 + word_width
                 continue
 
-            # Add the current line to the paragraph and start a new line
-            formatted_paragraph.append(line)
-            line = f"{indent}{word}"
-
-        # Store the last line in the paragraph since it hasn't reached the maxwidth yet
-        formatted_paragraph.append(line)
-
-        #
-        formatted_description.append(str.join("\n", formatted_paragraph))
+            # Start a new (indented) line with the word
+            line_starts.append(i)
+            line_width = indent_size + word_width
+
+        line_starts.append(len(words))
+        formatted_description.append(
+            str.join(
+                f"\n{indent}",
+                [
+                    str.join(" ", words[line_start:line_end])
+                    for line_start, line_end in zip(line_starts, line_starts[1:])
+                ],
+            )
+        )
 
     # Print the formatted description
     return str.join("\n\n", formatted_description).strip()
@@ -9,12 +9,17 @@ from git.objects.tag import TagObject
 
 from semantic_release.commit_parser import ParseError
 from semantic_release.enums import LevelBump
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.version.algorithm import (
+    commits_touching_paths,
+    tags_and_versions,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
-    from typing import Iterable, Iterator
+    from typing import Iterable, Iterator, Sequence
 
+    from git.objects.commit import Commit
+    from git.refs.tag import Tag
     from git.repo.base import Repo
     from git.util import Actor
 
@@ -37,7 +42,15 @@ class ReleaseHistory:
         translator: VersionTranslator,
         commit_parser: CommitParser[ParseResult, ParserOptions],
         exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        path_filters: Sequence[str] = (),
     ) -> ReleaseHistory:
+        """
+        Build the release history from every commit of the current branch.
+
+        When ``path_filters`` are given, only the commits which change a file matched
+        by one of these pathspecs are included in the history. The filtering is done
+        by git, so the other commits are never loaded nor parsed.
+        """
         all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
         unreleased: dict[str, list[ParseResult]] = defaultdict(list)
         released: dict[Version, Release] = {}
@@ -61,6 +74,10 @@ class ReleaseHistory:
 
         the_version: Version | None = None
 
+        shas_touching_paths = (
+            commits_touching_paths(repo, "HEAD", path_filters) if path_filters else None
+        )
+
         for commit in repo.iter_commits("HEAD", topo_order=True):
             # Determine if we have found another release
             log.debug("checking if commit %s matches any tags", commit.hexsha[:7])
@@ -75,67 +92,21 @@ class ReleaseHistory:
                 # so we create a new Release entry
                 log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
 
-                # tag.object is a Commit if the tag is lightweight, otherwise
-                # it is a TagObject with additional metadata about the tag
-                if isinstance(tag.object, TagObject):
-                    tagger = tag.object.tagger
-                    committer = tag.object.tagger.committer()
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
-                    tagged_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
-                else:
-                    # For some reason, sometimes tag.object is a Commit
-                    tagger = tag.object.author
-                    committer = tag.object.author
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
-                    tagged_date = datetime.fromtimestamp(
-                        tag.object.committed_date, tz=_tz
-                    )
-
-                release = Release(
-                    tagger=tagger,
-                    committer=committer,
-                    tagged_date=tagged_date,
-                    elements=defaultdict(list),
-                    version=the_version,
-                )
-
+                release = _release_from_tag(tag, the_version)
                 released.setdefault(the_version, release)
 
-            # mypy will be happy if we make this an explicit string
-            commit_message = str(commit.message)
-
-            log.info(
-                "parsing commit [%s] %s",
-                commit.hexsha[:8],
-                commit_message.replace("\n", " ")[:54],
-            )
-            parse_result = commit_parser.parse(commit)
-            commit_type = (
-                "unknown" if isinstance(parse_result, ParseError) else parse_result.type
-            )
-
-            has_exclusion_match = any(
-                pattern.match(commit_message) for pattern in exclude_commit_patterns
-            )
-
-            commit_level_bump = (
-                LevelBump.NO_RELEASE
-                if isinstance(parse_result, ParseError)
-                else parse_result.bump
-            )
+            if (
+                shas_touching_paths is not None
+                and commit.hexsha not in shas_touching_paths
+            ):
+                continue
 
-            # Skip excluded commits except for any commit causing a version bump
-            # Reasoning: if a commit causes a version bump, and no other commits
-            # are included, then the changelog will be empty. Even if ther was other
-            # commits included, the true reason for a version bump would be missing.
-            if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
-                log.info(
-                    "Excluding commit [%s] %s",
-                    commit.hexsha[:8],
-                    commit_message.replace("\n", " ")[:50],
-                )
+            parsed = _parse_commit(commit, commit_parser, exclude_commit_patterns)
+            if parsed is None:
                 continue
 
+            commit_type, parse_result = parsed
+
             if the_version is None:
                 log.info(
                     "[Unreleased] adding '%s' commit(%s) to list",
@@ -156,6 +127,80 @@ class ReleaseHistory:
 
         return cls(unreleased=unreleased, released=released)
 
+    @classmethod
+    def from_release_tag(
+        cls,
+        repo: Repo,
+        version: Version,
+        translator: VersionTranslator,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        path_filters: Sequence[str] = (),
+    ) -> ReleaseHistory:
+        """
+        Build the history of a single release without walking the entire git history.
+
+        Only the commits reachable from the tag of ``version`` that are not reachable
+        from the tag of any earlier version are parsed. Every other tagged version is
+        included as a release without any commits so that the history still reports
+        the same versions as one built by ``from_git_history()``.
+
+        If no tag exists for ``version``, it will not be found in ``released``. When
+        ``path_filters`` are given, only the commits which change a file matched by one
+        of these pathspecs are parsed.
+        """
+        all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
+        released: dict[Version, Release] = {
+            tag_version: _release_from_tag(tag, tag_version)
+            for tag, tag_version in all_git_tags_and_versions
+        }
+
+        release_tag = next(
+            (
+                tag
+                for tag, tag_version in all_git_tags_and_versions
+                if tag_version == version
+            ),
+            None,
+        )
+
+        if release_tag is None:
+            log.info("no tag found for version %s", version)
+            return cls(unreleased={}, released=released)
+
+        # Exclude the history of all previous releases rather than only the nearest one
+        # so that commits of releases on other branches (ex. maintenance releases)
+        # that were merged in are not attributed to this release
+        prev_release_shas = {
+            tag.commit.hexsha
+            for tag, tag_version in all_git_tags_and_versions
+            if tag_version < version
+        }
+        prev_release_shas.discard(release_tag.commit.hexsha)
+
+        # GitPython passes a list of revisions through to `git rev-list` as is
+        for commit in repo.iter_commits(
+            [release_tag.commit.hexsha, *(f"^{sha}" for sha in prev_release_shas)],  # type: ignore[arg-type]
+            paths=list(path_filters),
+            topo_order=True,
+        ):
+            parsed = _parse_commit(commit, commit_parser, exclude_commit_patterns)
+            if parsed is None:
+                continue
+
+            commit_type, parse_result = parsed
+
+            log.info(
+                "[%s] adding '%s' commit(%s) to release",
+                version,
+                commit_type,
+                commit.hexsha[:8],
+            )
+
+            released[version]["elements"][commit_type].append(parse_result)
+
+        return cls(unreleased={}, released=released)
+
     def __init__(
         self, unreleased: dict[str, list[ParseResult]], released: dict[Version, Release]
     ) -> None:
@@ -210,3 +255,71 @@ class Release(TypedDict):
     tagged_date: datetime
     elements: dict[str, list[ParseResult]]
     version: Version
+
+
+def _release_from_tag(tag: Tag, version: Version) -> Release:
+    # tag.object is a Commit if the tag is lightweight, otherwise
+    # it is a TagObject with additional metadata about the tag
+    if isinstance(tag.object, TagObject):
+        tagger = tag.object.tagger
+        committer = tag.object.tagger.committer()
+        _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
+        tagged_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
+    else:
+        # For some reason, sometimes tag.object is a Commit
+        tagger = tag.object.author
+        committer = tag.object.author
+        _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
+        tagged_date = datetime.fromtimestamp(tag.object.committed_date, tz=_tz)
+
+    return Release(
+        tagger=tagger,
+        committer=committer,
+        tagged_date=tagged_date,
+        elements=defaultdict(list),
+        version=version,
+    )
+
+
+def _parse_commit(
+    commit: Commit,
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    exclude_commit_patterns: Iterable[Pattern[str]],
+) -> tuple[str, ParseResult] | None:
+    """Parse a commit into its changelog type, or return None if it is excluded"""
+    # mypy will be happy if we make this an explicit string
+    commit_message = str(commit.message)
+
+    log.info(
+        "parsing commit [%s] %s",
+        commit.hexsha[:8],
+        commit_message.replace("\n", " ")[:54],
+    )
+    parse_result = commit_parser.parse(commit)
+    commit_type = (
+        "unknown" if isinstance(parse_result, ParseError) else parse_result.type
+    )
+
+    has_exclusion_match = any(
+        pattern.match(commit_message) for pattern in exclude_commit_patterns
+    )
+
+    commit_level_bump = (
+        LevelBump.NO_RELEASE
+        if isinstance(parse_result, ParseError)
+        else parse_result.bump
+    )
+
+    # Skip excluded commits except for any commit causing a version bump
+    # Reasoning: if a commit causes a version bump, and no other commits
+    # are included, then the changelog will be empty. Even if ther was other
+    # commits included, the true reason for a version bump would be missing.
+    if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
+        log.info(
+            "Excluding commit [%s] %s",
+            commit.hexsha[:8],
+            commit_message.replace("\n", " ")[:50],
+        )
+        return None
+
+    return commit_type, parse_result
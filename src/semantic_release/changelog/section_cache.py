@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+from jinja2 import TemplateNotFound, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import Any, Callable
+
+    from jinja2 import Environment
+    from jinja2.parser import Parser
+
+    from semantic_release.changelog.release_history import Release
+
+
+log = logging.getLogger(__name__)
+
+
+class ReleaseSectionCache:
+    """
+    Store of rendered changelog sections for releases.
+
+    Sections are always kept in memory for the lifetime of the cache and, when a
+    ``cache_dir`` is provided, also persisted to disk so that subsequent runs can
+    skip rendering releases which have not changed.
+
+    The ``namespace`` is included in every key and should describe any
+    configuration which influences the rendered output but is not part of the
+    template source (ex. the HVCS repository url). The sections of a namespace are
+    stored in their own directory, and the first section written by a cache removes
+    the sections of every other namespace, which can never be read again once the
+    configuration has changed.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, namespace: str = "") -> None:
+        self.cache_dir = cache_dir
+        self.namespace = namespace
+        self._sections: dict[str, str] = {}
+        self._pruned = False
+
+    def make_key(self, *parts: str) -> str:
+        digest = sha256(self.namespace.encode("utf-8"))
+        for part in parts:
+            # Separate each part so that ("ab", "c") and ("a", "bc") never collide
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        if key in self._sections:
+            return self._sections[key]
+
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with self._section_file(key).open(encoding="utf-8", newline="") as rfd:
+                section = rfd.read()
+        except OSError:
+            return None
+
+        self._sections[key] = section
+        return section
+
+    def set(self, key: str, section: str) -> None:
+        self._sections[key] = section
+
+        if self.cache_dir is None:
+            return
+
+        if not self._pruned:
+            self._prune_other_namespaces()
+
+        try:
+            self._namespace_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that an interrupted run never leaves
+            # a partial section behind that would be served on the next run
+            with NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                newline="",
+                dir=self._namespace_dir,
+                prefix=f".{key}.",
+                delete=False,
+            ) as wfd:
+                wfd.write(section)
+            os.replace(wfd.name, self._section_file(key))
+        except OSError as err:
+            log.warning("Unable to write changelog section cache: %s", err)
+
+    @property
+    def _namespace_dir(self) -> Path:
+        # cache_dir is checked by the caller
+        namespace_digest = sha256(self.namespace.encode("utf-8")).hexdigest()
+        return self.cache_dir / namespace_digest[:16]  # type: ignore[operator]
+
+    def _section_file(self, key: str) -> Path:
+        return self._namespace_dir / f"{key}.txt"
+
+    def _prune_other_namespaces(self) -> None:
+        self._pruned = True
+        try:
+            entries = list(self.cache_dir.iterdir())  # type: ignore[union-attr]
+        except OSError:
+            return
+
+        for entry in entries:
+            if entry.name == self._namespace_dir.name:
+                continue
+            log.debug("Removing stale changelog sections %s", entry)
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            elif entry.suffix == ".txt":
+                # A section of the flat layout used before namespace directories
+                try:
+                    entry.unlink()
+                except OSError as err:
+                    log.warning("Unable to remove stale changelog section: %s", err)
+
+
+def release_section_key_parts(release: Release) -> list[str]:
+    """Describe the contents of a release that determine its rendered section"""
+    return [
+        str(release["version"]),
+        release["tagged_date"].isoformat(),
+        *sorted(
+            f"{commit_type}:{parse_result.commit.hexsha}"
+            for commit_type, parse_results in release["elements"].items()
+            for parse_result in parse_results
+        ),
+    ]
+
+
+class ReleaseSectionCacheExtension(Extension):
+    """
+    Jinja extension that adds the ``cached_release`` block tag.
+
+    The body of the block is rendered once per unique release and the output is
+    reused from the bound :py:class:`ReleaseSectionCache` afterwards. The cache key
+    is made of the release version, its tag date, the commits of the release, the
+    template sources of the environment and any additional values provided to the
+    tag::
+
+        {% cached_release release, loop.last and ctx.mask_initial_release %}
+          {% include "versioned_changes.md.j2" %}
+        {% endcached_release %}
+
+    When no cache is bound to the environment, the body is rendered every time.
+    """
+
+    tags = {"cached_release"}  # noqa: RUF012 (declared by jinja2.ext.Extension)
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        self.cache: ReleaseSectionCache | None = None
+        self._template_digest: str | None = None
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+
+        key_args = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            key_args.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcached_release",), drop_needle=True)
+
+        return nodes.CallBlock(
+            self.call_method("_render_section", [nodes.List(key_args)]),
+            [],
+            [],
+            body,
+        ).set_lineno(lineno)
+
+    def _render_section(self, key_args: list[Any], caller: Callable[[], str]) -> str:
+        if self.cache is None:
+            return caller()
+
+        release, *extra_args = key_args
+        key = self.cache.make_key(
+            self.template_digest,
+            *release_section_key_parts(release),
+            *map(repr, extra_args),
+        )
+
+        if (section := self.cache.get(key)) is not None:
+            log.debug("Using cached changelog section for %s", release["version"])
+            # The section was already escaped (if applicable) when it was rendered
+            return Markup(section)
+
+        section = caller()
+        self.cache.set(key, section)
+        return section
+
+    @property
+    def template_digest(self) -> str:
+        """Hash of the environment syntax settings and every template it can load"""
+        if self._template_digest is not None:
+            return self._template_digest
+
+        env = self.environment
+        digest = sha256(
+            repr(
+                (
+                    env.block_start_string,
+                    env.block_end_string,
+                    env.variable_start_string,
+                    env.variable_end_string,
+                    env.comment_start_string,
+                    env.comment_end_string,
+                    env.line_statement_prefix,
+                    env.line_comment_prefix,
+                    env.trim_blocks,
+                    env.lstrip_blocks,
+                    env.newline_sequence,
+                    env.keep_trailing_newline,
+                    sorted(env.filters),
+                )
+            ).encode("utf-8")
+        )
+
+        if env.loader is not None:
+            for template_name in sorted(env.loader.list_templates()):
+                try:
+                    source, _, _ = env.loader.get_source(env, template_name)
+                except (TemplateNotFound, UnicodeDecodeError):
+                    # Not a text file, so it cannot be part of a section
+                    continue
+
+                digest.update(f"\0{template_name}\0{source}".encode())
+
+        self._template_digest = digest.hexdigest()
+        return self._template_digest
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from jinja2 import FileSystemLoader
 from jinja2.sandbox import SandboxedEnvironment
 
+from semantic_release.changelog.section_cache import ReleaseSectionCacheExtension
 from semantic_release.helpers import dynamic_import
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -69,7 +70,7 @@ def environment(
         lstrip_blocks=lstrip_blocks,
         newline_sequence=newline_sequence,
         keep_trailing_newline=keep_trailing_newline,
-        extensions=extensions,
+        extensions=(*extensions, ReleaseSectionCacheExtension),
         autoescape=autoescape_value,
         loader=FileSystemLoader(template_dir, encoding="utf-8"),
     )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from glob import glob
+from hashlib import sha256
+from pathlib import Path
+from tempfile import TemporaryDirectory, mkdtemp
+from typing import TYPE_CHECKING
+
+from git.repo.base import Repo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable, Mapping, Sequence
+
+
+log = logging.getLogger(__name__)
+
+
+def release_tree_hash(repo_dir: Path, paths: Iterable[str]) -> str:
+    """
+    Hash of the tree of the release commit, ie. of HEAD with the current content of
+    ``paths`` staged, without touching the index of the repository
+    """
+    with TemporaryDirectory() as tmp_dir, Repo(str(repo_dir)) as git_repo:
+        env = {"GIT_INDEX_FILE": str(Path(tmp_dir, "index"))}
+        git_repo.git.read_tree("HEAD", env=env)
+        if paths := list(paths):
+            git_repo.git.add("--all", "--", *paths, env=env)
+        return str(git_repo.git.write_tree(env=env))
+
+
+class BuildCache:
+    """
+    Store of the distributions built by the build command.
+
+    Every entry holds the files matched by ``dist_glob_patterns`` once the build
+    command has run for the given ``key``, which should describe everything that the
+    build depends on (see :py:meth:`make_key`). When an entry exists, the files are
+    restored instead of running the build command again.
+
+    Files that already exist before the build are only stored if the build changes
+    them, see :py:meth:`snapshot`.
+    """
+
+    def __init__(
+        self, cache_dir: Path, key: str, dist_glob_patterns: Sequence[str]
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.key = key
+        self.dist_glob_patterns = dist_glob_patterns
+        self._snapshot: dict[str, tuple[int, int]] = {}
+
+    @staticmethod
+    def make_key(
+        tree_hash: str, build_command: str, build_env: Mapping[str, str]
+    ) -> str:
+        """
+        :param tree_hash: Hash of the tree of the release commit
+        :param build_command: The build command(s) to run
+        :param build_env: The whole environment the build command runs with
+        """
+        digest = sha256(tree_hash.encode("utf-8"))
+        for part in (
+            build_command,
+            *sorted(f"{k}={v}" for k, v in build_env.items()),
+        ):
+            # Separate each part so that ("ab", "c") and ("a", "bc") never collide
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    @property
+    def entry_dir(self) -> Path:
+        return self.cache_dir / self.key
+
+    def restore(self) -> list[str] | None:
+        """
+        Copy the files of the entry back to where they were built.
+
+        :return: The paths of the restored files, or None if there is no entry
+        """
+        try:
+            manifest = json.loads(
+                (self.entry_dir / "manifest.json").read_text(encoding="utf-8")
+            )
+            for index, file_path in enumerate(manifest):
+                Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.entry_dir / str(index), file_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            log.warning("Unable to restore the build from the cache: %s", err)
+            return None
+
+        log.info(
+            "Restored %s files of build %s from the cache", len(manifest), self.key
+        )
+        return manifest
+
+    def _dist_files(self) -> list[str]:
+        return sorted(
+            {
+                file_path
+                for pattern in self.dist_glob_patterns
+                for file_path in glob(pattern, recursive=True)
+                if os.path.isfile(file_path)
+            }
+        )
+
+    @staticmethod
+    def _file_state(file_path: str) -> tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def snapshot(self) -> None:
+        """
+        Record the files matched by the ``dist_glob_patterns`` before the build, so
+        that the leftovers of previous builds (ex. the distributions of an older
+        version) are not stored with this build
+        """
+        self._snapshot = {
+            file_path: self._file_state(file_path) for file_path in self._dist_files()
+        }
+
+    def store(self) -> None:
+        """
+        Copy the files matched by the ``dist_glob_patterns`` that are new or were
+        changed since the :py:meth:`snapshot` into a new entry
+        """
+        file_paths = [
+            file_path
+            for file_path in self._dist_files()
+            if self._snapshot.get(file_path) != self._file_state(file_path)
+        ]
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Fill a temporary directory first so that an interrupted run never leaves
+            # a partial entry behind that would be restored on the next run
+            tmp_dir = Path(mkdtemp(dir=self.cache_dir, prefix=f".{self.key}."))
+        except OSError as err:
+            log.warning("Unable to store the build in the cache: %s", err)
+            return
+
+        try:
+            for index, file_path in enumerate(file_paths):
+                shutil.copy2(file_path, tmp_dir / str(index))
+            (tmp_dir / "manifest.json").write_text(
+                json.dumps(file_paths), encoding="utf-8"
+            )
+            # Replace any entry which could not be restored
+            shutil.rmtree(self.entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, self.entry_dir)
+        except OSError as err:
+            log.warning("Unable to store the build in the cache: %s", err)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        log.info("Stored %s files of build %s in the cache", len(file_paths), self.key)
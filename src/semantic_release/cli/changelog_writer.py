@@ -179,6 +179,9 @@ def write_changelog_files(
         insertion_flag=runtime_ctx.changelog_insertion_flag,
         prev_changelog_file=runtime_ctx.changelog_file,
         mask_initial_release=runtime_ctx.changelog_mask_initial_release,
+        section_cache_dir=runtime_ctx.changelog_cache_dir,
+        commit_parser=runtime_ctx.commit_parser,
+        exclude_commit_patterns=runtime_ctx.changelog_excluded_commit_patterns,
     )
 
     user_templates = []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -12,10 +13,14 @@ from semantic_release.cli.changelog_writer import (
     write_changelog_files,
 )
 from semantic_release.cli.util import noop_report
+from semantic_release.hvcs.async_client import AsyncRemoteHvcs
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Awaitable, Iterable
+
     from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import RuntimeContext
 
 
 log = logging.getLogger(__name__)
@@ -49,43 +54,153 @@ def post_release_notes(
     )
 
 
-@click.command(
-    short_help="Generate a changelog",
-    context_settings={
-        "help_option_names": ["-h", "--help"],
-    },
-)
-@click.option(
-    "--post-to-release-tag",
-    "release_tag",
-    default=None,
-    help="Post the generated release notes to the remote VCS's release for this tag",
-)
-@click.pass_obj
-def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
-    """Generate and optionally publish a changelog for your project"""
-    ctx = click.get_current_context()
-    runtime = cli_ctx.runtime_ctx
-    translator = runtime.version_translator
-    hvcs_client = runtime.hvcs_client
+def _normalize_release_notes(release_notes: str) -> str:
+    return release_notes.replace("\r\n", "\n").strip()
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=runtime.commit_parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+
+def diff_release_notes(
+    release_notes: dict[str, str],
+    existing_releases: Iterable[dict[str, Any]],
+) -> tuple[list[str], dict[str, int]]:
+    """
+    Compare the release notes of each tag with the releases of the remote VCS
+
+    :param release_notes: The desired release notes by tag
+    :param existing_releases: The release objects of the remote VCS api
+
+    :return: The tags which have no release yet, and the ids (by tag) of the
+        releases whose notes differ from the desired release notes
+    """
+    existing_by_tag = {
+        release["tag_name"]: release
+        for release in existing_releases
+        if "tag_name" in release and "id" in release
+    }
+
+    missing_tags: list[str] = []
+    outdated_release_ids: dict[str, int] = {}
+    for tag, notes in release_notes.items():
+        if (release := existing_by_tag.get(tag)) is None:
+            missing_tags.append(tag)
+        elif _normalize_release_notes(
+            release.get("body") or ""
+        ) != _normalize_release_notes(notes):
+            outdated_release_ids[tag] = release["id"]
+
+    return missing_tags, outdated_release_ids
+
+
+async def backfill_release_notes(
+    hvcs_client: RemoteHvcsBase,
+    release_notes: dict[str, tuple[str, bool]],
+    max_concurrency: int = 4,
+    noop: bool = False,
+) -> int:
+    """
+    Create the missing releases and update the releases with outdated notes, for
+    every tag at once.
+
+    The existing releases are listed once, so that only the releases that need a
+    change cost any further requests. Clients that cannot list their releases fall
+    back to creating or updating the release of every tag.
+
+    :param hvcs_client: The client of the remote VCS
+    :param release_notes: The release notes and prerelease flag by tag
+    :param max_concurrency: Maximum number of requests in progress at the same time
+    :param noop: Only report what would be changed
+
+    :return: The number of releases that failed to be created or updated
+    """
+    async with AsyncRemoteHvcs(
+        hvcs_client, max_connections=max_concurrency
+    ) as async_hvcs_client:
+        existing_releases = await async_hvcs_client.list_releases()
+
+        outdated_release_ids: dict[str, int] = {}
+        if existing_releases is None:
+            missing_tags = list(release_notes)
+        else:
+            missing_tags, outdated_release_ids = diff_release_notes(
+                {tag: notes for tag, (notes, _) in release_notes.items()},
+                existing_releases,
+            )
+
+        log.info(
+            "%s releases up to date, %s to create, %s to update",
+            len(release_notes) - len(missing_tags) - len(outdated_release_ids),
+            len(missing_tags),
+            len(outdated_release_ids),
         )
 
-    write_changelog_files(
-        runtime_ctx=runtime,
-        release_history=release_history,
-        hvcs_client=hvcs_client,
-        noop=runtime.global_cli_options.noop,
-    )
+        if noop:
+            noop_report(
+                str.join(
+                    "\n",
+                    [
+                        "would have created releases for the following tags:",
+                        *missing_tags,
+                        "would have updated the releases of the following tags:",
+                        *outdated_release_ids,
+                    ],
+                )
+            )
+            return 0
+
+        operations: dict[str, Awaitable[Any]] = {}
+        for tag in missing_tags:
+            notes, prerelease = release_notes[tag]
+            # Without a list of releases, a release may exist for any of the tags
+            operations[tag] = (
+                async_hvcs_client.create_release(tag, notes, prerelease)
+                if existing_releases is not None
+                else async_hvcs_client.create_or_update_release(tag, notes, prerelease)
+            )
+
+        for tag, release_id in outdated_release_ids.items():
+            operations[tag] = async_hvcs_client.edit_release_notes(
+                release_id, release_notes[tag][0]
+            )
+
+        results = await asyncio.gather(*operations.values(), return_exceptions=True)
+
+    failures = 0
+    for tag, result in zip(operations, results):
+        if isinstance(result, Exception):
+            failures += 1
+            log.error("Failed to post release notes for tag %s", tag, exc_info=result)
+
+    return failures
+
+
+def _release_notes_by_tag(
+    runtime: RuntimeContext,
+    hvcs_client: RemoteHvcsBase,
+    release_history: ReleaseHistory,
+) -> dict[str, tuple[str, bool]]:
+    return {
+        version.as_tag(): (
+            generate_release_notes(
+                hvcs_client,
+                release,
+                runtime.template_dir,
+                release_history,
+                style=runtime.changelog_style,
+                mask_initial_release=runtime.changelog_mask_initial_release,
+            ),
+            version.is_prerelease,
+        )
+        for version, release in release_history.released.items()
+    }
 
-    if not release_tag:
-        return
+
+def _post_release_tag_notes(
+    ctx: click.Context,
+    runtime: RuntimeContext,
+    release_tag: str,
+    release_history: ReleaseHistory | None = None,
+) -> None:
+    translator = runtime.version_translator
+    hvcs_client = runtime.hvcs_client
 
     if not isinstance(hvcs_client, RemoteHvcsBase):
         click.echo(
@@ -107,6 +222,18 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         )
         ctx.exit(1)
 
+    if release_history is None:
+        # Only the commits of the requested release are needed for its notes
+        with Repo(str(runtime.repo_dir)) as git_repo:
+            release_history = ReleaseHistory.from_release_tag(
+                repo=git_repo,
+                version=version,
+                translator=translator,
+                commit_parser=runtime.commit_parser,
+                exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+                path_filters=runtime.path_filters,
+            )
+
     try:
         release = release_history.released[version]
     except KeyError:
@@ -134,3 +261,129 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         log.exception(e)
         click.echo("Failed to post release notes to remote", err=True)
         ctx.exit(1)
+
+
+@click.command(
+    short_help="Generate a changelog",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+)
+@click.option(
+    "--post-to-release-tag",
+    "release_tag",
+    default=None,
+    help="Post the generated release notes to the remote VCS's release for this tag",
+)
+@click.option(
+    "--release-notes-only",
+    "release_notes_only",
+    is_flag=True,
+    default=False,
+    help=str.join(
+        " ",
+        [
+            "With --post-to-release-tag, only post the release notes of the tag",
+            "(reading only the commits of its release) and leave the changelog",
+            "file as it is",
+        ],
+    ),
+)
+@click.option(
+    "--post-to-all-release-tags",
+    "all_release_tags",
+    is_flag=True,
+    default=False,
+    help=str.join(
+        " ",
+        [
+            "Create or update the remote VCS's release of every tag in the history",
+            "whose release notes are missing or out of date",
+        ],
+    ),
+)
+@click.option(
+    "--jobs",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of releases posted at the same time with --post-to-all-release-tags",
+)
+@click.pass_obj
+def changelog(
+    cli_ctx: CliContextObj,
+    release_tag: str | None,
+    release_notes_only: bool,
+    all_release_tags: bool,
+    jobs: int,
+) -> None:
+    """Generate and optionally publish a changelog for your project"""
+    ctx = click.get_current_context()
+    runtime = cli_ctx.runtime_ctx
+    translator = runtime.version_translator
+    hvcs_client = runtime.hvcs_client
+
+    if release_tag and all_release_tags:
+        click.echo(
+            "--post-to-release-tag and --post-to-all-release-tags are mutually exclusive",
+            err=True,
+        )
+        ctx.exit(1)
+
+    if release_notes_only and not release_tag:
+        click.echo("--release-notes-only requires --post-to-release-tag", err=True)
+        ctx.exit(1)
+
+    if release_tag and release_notes_only:
+        # Only the commits of the requested release are walked for its notes, so the
+        # changelog file, which needs the full history, is left as it is
+        _post_release_tag_notes(ctx, runtime, release_tag)
+        return
+
+    with Repo(str(runtime.repo_dir)) as git_repo:
+        release_history = ReleaseHistory.from_git_history(
+            repo=git_repo,
+            translator=translator,
+            commit_parser=runtime.commit_parser,
+            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            path_filters=runtime.path_filters,
+        )
+
+    write_changelog_files(
+        runtime_ctx=runtime,
+        release_history=release_history,
+        hvcs_client=hvcs_client,
+        noop=runtime.global_cli_options.noop,
+    )
+
+    if release_tag:
+        _post_release_tag_notes(ctx, runtime, release_tag, release_history)
+        return
+
+    if all_release_tags:
+        if not isinstance(hvcs_client, RemoteHvcsBase):
+            click.echo(
+                "Remote does not support releases. Skipping release notes update...",
+                err=True,
+            )
+            return
+
+        # The history is walked only once for the release notes of every tag
+        failures = asyncio.run(
+            backfill_release_notes(
+                hvcs_client=hvcs_client,
+                release_notes=_release_notes_by_tag(
+                    runtime, hvcs_client, release_history
+                ),
+                max_concurrency=jobs,
+                noop=runtime.global_cli_options.noop,
+            )
+        )
+        if failures:
+            click.echo(
+                f"Failed to post release notes of {failures} releases to remote",
+                err=True,
+            )
+            ctx.exit(1)
+        return
@@ -87,6 +87,12 @@ class Cli(click.MultiCommand):
     default=False,
     help="Enable strict mode",
 )
+@click.option(
+    "--project",
+    "project",
+    default=None,
+    help="Release one of the projects of a monorepo, as configured in 'projects'",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
@@ -94,6 +100,7 @@ def main(
     verbosity: int = 0,
     noop: bool = False,
     strict: bool = False,
+    project: str | None = None,
 ) -> None:
     """
     Python Semantic Release
@@ -133,7 +140,11 @@ def main(
         )
 
     cli_options = GlobalCommandLineOptions(
-        noop=noop, verbosity=verbosity, config_file=config_file, strict=strict
+        noop=noop,
+        verbosity=verbosity,
+        config_file=config_file,
+        strict=strict,
+        project=project,
     )
 
     logger.debug("global cli options: %s", cli_options)
@@ -37,8 +37,9 @@ def publish_distributions(
         return
 
     log.info("Uploading distributions to release")
-    for pattern in dist_glob_patterns:
-        hvcs_client.upload_dists(tag=tag, dist_glob=pattern)  # type: ignore[attr-defined]
+    # The files of all the patterns are uploaded together, so that a file matched by
+    # several (overlapping) patterns is only uploaded once
+    hvcs_client.upload_dists(tag=tag, dist_glob=dist_glob_patterns)
 
 
 @click.command(
@@ -62,6 +63,13 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
     translator = runtime.version_translator
     dist_glob_patterns = runtime.dist_glob_patterns
 
+    if (
+        isinstance(hvcs_client, RemoteHvcsBase)
+        and hvcs_client.rate_limit_scheduler is not None
+    ):
+        # Reported however the command ends, ex. after a failed upload
+        ctx.call_on_close(hvcs_client.rate_limit_scheduler.log_metrics)
+
     with Repo(str(runtime.repo_dir)) as git_repo:
         repo_tags = git_repo.tags
 
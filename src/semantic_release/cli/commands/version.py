@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import subprocess
 import sys
+import threading
 from collections import defaultdict
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
@@ -15,11 +18,13 @@ from git import Repo
 from requests import HTTPError
 
 from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.cli.build_cache import BuildCache, release_tree_hash
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
     write_changelog_files,
 )
 from semantic_release.cli.github_actions_output import VersionGitHubActionsOutput
+from semantic_release.cli.pipeline import Pipeline
 from semantic_release.cli.util import noop_report, rprint
 from semantic_release.const import DEFAULT_SHELL, DEFAULT_VERSION
 from semantic_release.enums import LevelBump
@@ -34,17 +39,21 @@ from semantic_release.version.algorithm import (
     next_version,
     tags_and_versions,
 )
+from semantic_release.version.declaration import stamp_version
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
 if TYPE_CHECKING:  # pragma: no cover
-    from pathlib import Path
     from typing import Iterable, Mapping
 
     from git.refs.tag import Tag
 
     from semantic_release.cli.cli_context import CliContextObj
-    from semantic_release.version.declaration import VersionDeclarationABC
+    from semantic_release.cli.config import BuildCommandConfig
+    from semantic_release.version.declaration import (
+        GlobVersionDeclaration,
+        VersionDeclarationABC,
+    )
 
 
 log = logging.getLogger(__name__)
@@ -126,7 +135,18 @@ def apply_version_to_source_files(
     version_declarations: Iterable[VersionDeclarationABC],
     version: Version,
     noop: bool = False,
+    version_declaration_globs: Iterable[GlobVersionDeclaration] = (),
 ) -> list[str]:
+    # Like the paths of the other declarations, glob patterns are relative to
+    # the current directory
+    version_declarations = [
+        *version_declarations,
+        *(
+            declaration
+            for declaration_glob in version_declaration_globs
+            for declaration in declaration_glob.expand(Path.cwd())
+        ),
+    ]
     paths = [
         str(declaration.path.resolve().relative_to(repo_dir))
         for declaration in version_declarations
@@ -140,15 +160,17 @@ def apply_version_to_source_files(
         return paths
 
     log.debug("writing version %s to source paths %s", version, paths)
-    for declaration in version_declarations:
-        new_content = declaration.replace(new_version=version)
-        declaration.path.write_text(new_content)
+    stamp_version(version_declarations, version)
 
     return paths
 
 
 def shell(
-    cmd: str, *, env: Mapping[str, str] | None = None, check: bool = True
+    cmd: str,
+    *,
+    env: Mapping[str, str] | None = None,
+    check: bool = True,
+    capture_output: bool = False,
 ) -> subprocess.CompletedProcess:
     shell: str | None
     try:
@@ -170,6 +192,17 @@ def shell(
         },
     )
 
+    if capture_output:
+        # The output of the command is captured as text, stderr included
+        return subprocess.run(  # noqa: S603
+            [shell, shell_cmd_param[shell], cmd],
+            env=(env or {}),
+            check=check,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+
     return subprocess.run(  # noqa: S603
         [shell, shell_cmd_param[shell], cmd],
         env=(env or {}),
@@ -211,33 +244,11 @@ def get_windows_env() -> Mapping[str, str | None]:
     }
 
 
-def build_distributions(
-    build_command: str | None,
+def build_env_vars(
     build_command_env: Mapping[str, str] | None = None,
-    noop: bool = False,
-) -> None:
-    """
-    Run the build command to build the distributions.
-
-    :param build_command: The build command to run.
-    :param build_command_env: The environment variables to use when running the
-        build command.
-    :param noop: Whether or not to run the build command.
-
-    :raises: BuildDistributionsError: if the build command fails
-    """
-    if not build_command:
-        rprint("[green]No build command specified, skipping")
-        return
-
-    if noop:
-        noop_report(f"would have run the build_command {build_command}")
-        return
-
-    log.info("Running build command %s", build_command)
-    rprint(f"[bold green]:hammer_and_wrench: Running build command: {build_command}")
-
-    build_env_vars: dict[str, str] = dict(
+) -> dict[str, str]:
+    """The environment of the build commands, with the values of the user on top"""
+    return dict(
         filter(
             lambda k_v: k_v[1] is not None,  # type: ignore[arg-type]
             {
@@ -264,8 +275,73 @@ def build_distributions(
         )
     )
 
+
+def run_build_commands(
+    build_commands: Mapping[str, BuildCommandConfig],
+    env: Mapping[str, str],
+    jobs: int = 1,
+) -> None:
+    """
+    Run the named build commands, each one as soon as the commands it runs after have
+    finished and with at most ``jobs`` commands running at the same time.
+
+    :raises: BuildDistributionsError: with the output of the commands which failed
+    """
+    failed_logs: dict[str, str] = {}
+    output_lock = threading.Lock()
+
+    def run(name: str, command: str) -> None:
+        log.info("Running build command %s: %s", name, command)
+        try:
+            result = shell(command, env=env, check=True, capture_output=True)
+        except subprocess.CalledProcessError as exc:
+            log.error(  # noqa: TRY400
+                "Build command %s failed with exit code %s", name, exc.returncode
+            )
+            failed_logs[name] = exc.output or ""
+            raise
+
+        # The output of a command is printed once it has finished, so that the output
+        # of the commands which run at the same time is never interleaved
+        with output_lock:
+            rprint(
+                f"[bold green]:hammer_and_wrench: Ran build command {name}: {command}"
+            )
+            click.echo(result.stdout, nl=False)
+
+    pipeline = Pipeline(max_workers=jobs)
+    for name, build_command in build_commands.items():
+        pipeline.add(
+            name,
+            functools.partial(run, name, build_command.command),
+            after=build_command.after,
+        )
+
+    try:
+        pipeline.run()
+    except subprocess.CalledProcessError as exc:
+        raise BuildDistributionsError(
+            str.join(
+                "\n",
+                [
+                    f"Build command {name!r} failed:\n{output}"
+                    for name, output in failed_logs.items()
+                ],
+            )
+        ) from exc
+
+
+def run_build_command(build_command: str, env: Mapping[str, str]) -> None:
+    """
+    Run the single build command with its output going straight to the console.
+
+    :raises: BuildDistributionsError: if the build command fails
+    """
+    log.info("Running build command %s", build_command)
+    rprint(f"[bold green]:hammer_and_wrench: Running build command: {build_command}")
+
     try:
-        shell(build_command, env=build_env_vars, check=True)
+        shell(build_command, env=env, check=True)
         rprint("[bold green]Build completed successfully!")
     except subprocess.CalledProcessError as exc:
         log.exception(exc)
@@ -273,6 +349,60 @@ def build_distributions(
         raise BuildDistributionsError from exc
 
 
+def build_distributions(
+    build_command: str | None,
+    build_command_env: Mapping[str, str] | None = None,
+    noop: bool = False,
+    build_cache: BuildCache | None = None,
+    build_commands: Mapping[str, BuildCommandConfig] | None = None,
+    jobs: int = 1,
+) -> None:
+    """
+    Run the build command to build the distributions.
+
+    :param build_command: The build command to run.
+    :param build_command_env: The environment variables to use when running the
+        build command.
+    :param noop: Whether or not to run the build command.
+    :param build_cache: The cache entry of this build, the distributions are restored
+        from it instead of running the build command when it exists.
+    :param build_commands: The named build commands to run instead of a single
+        build command, see :py:func:`run_build_commands`.
+    :param jobs: The maximum number of build commands to run at the same time.
+
+    :raises: BuildDistributionsError: if the build command fails
+    """
+    if not build_command and not build_commands:
+        rprint("[green]No build command specified, skipping")
+        return
+
+    if noop:
+        if build_command:
+            noop_report(f"would have run the build_command {build_command}")
+        for name, command in (build_commands or {}).items():
+            noop_report(f"would have run the build command {name}: {command.command}")
+        return
+
+    if build_cache is not None and build_cache.restore() is not None:
+        rprint(
+            "[bold green]:recycle: Restored the distributions of an identical build "
+            "from the cache"
+        )
+        return
+
+    if build_cache is not None:
+        build_cache.snapshot()
+
+    if build_commands:
+        run_build_commands(build_commands, build_env_vars(build_command_env), jobs)
+        rprint("[bold green]Build completed successfully!")
+    elif build_command:
+        run_build_command(build_command, build_env_vars(build_command_env))
+
+    if build_cache is not None:
+        build_cache.store()
+
+
 @click.command(
     short_help="Detect and apply a new version",
     context_settings={
@@ -378,6 +508,14 @@ def build_distributions(
     is_flag=True,
     help="Skip building the current project",
 )
+@click.option(
+    "--jobs",
+    "jobs",
+    default=os.cpu_count() or 1,
+    type=click.IntRange(min=1),
+    show_default="number of CPUs",
+    help="Maximum number of build commands to run at the same time",
+)
 @click.pass_obj
 def version(  # noqa: C901
     cli_ctx: CliContextObj,
@@ -394,6 +532,7 @@ def version(  # noqa: C901
     make_vcs_release: bool,
     build_metadata: str | None,
     skip_build: bool,
+    jobs: int,
     force_level: str | None = None,
 ) -> None:
     """
@@ -447,6 +586,13 @@ def version(  # noqa: C901
     opts = runtime.global_cli_options
     gha_output = VersionGitHubActionsOutput(released=False)
 
+    if (
+        isinstance(hvcs_client, RemoteHvcsBase)
+        and hvcs_client.rate_limit_scheduler is not None
+    ):
+        # Reported however the command ends, ex. after a failed upload
+        ctx.call_on_close(hvcs_client.rate_limit_scheduler.log_metrics)
+
     forced_level_bump = None if not force_level else LevelBump.from_string(force_level)
     prerelease = is_forced_prerelease(
         as_prerelease=as_prerelease,
@@ -482,6 +628,7 @@ def version(  # noqa: C901
                 prerelease=prerelease,
                 major_on_zero=major_on_zero,
                 allow_zero_version=runtime.allow_zero_version,
+                path_filters=runtime.path_filters,
             )
     else:
         log.warning(
@@ -559,6 +706,7 @@ def version(  # noqa: C901
             translator=translator,
             commit_parser=parser,
             exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            path_filters=runtime.path_filters,
         )
 
     rprint(f"[bold green]The next version is: [white]{new_version!s}[/white]! :rocket:")
@@ -577,50 +725,118 @@ def version(  # noqa: C901
         click.echo(str(ve), err=True)
         ctx.exit(1)
 
-    all_paths_to_add: list[str] = []
+    # The stages which prepare the release run concurrently where they don't depend
+    # on each other, ex. the release notes are rendered while the distributions build
+    pipeline = Pipeline(sequential=opts.noop)
 
     if update_changelog:
         # Write changelog files & add them to the list of files to commit
-        all_paths_to_add.extend(
-            write_changelog_files(
+        pipeline.add(
+            "changelog",
+            lambda: write_changelog_files(
                 runtime_ctx=runtime,
                 release_history=release_history,
                 hvcs_client=hvcs_client,
                 noop=opts.noop,
-            )
+            ),
         )
 
-    # Apply the new version to the source files
-    files_with_new_version_written = apply_version_to_source_files(
-        repo_dir=runtime.repo_dir,
-        version_declarations=runtime.version_declarations,
-        version=new_version,
-        noop=opts.noop,
+    # Apply the new version to the source files, once the changelog was written so
+    # that a failure to write it never leaves stamped files behind
+    pipeline.add(
+        "stamp",
+        lambda: apply_version_to_source_files(
+            repo_dir=runtime.repo_dir,
+            version_declarations=runtime.version_declarations,
+            version_declaration_globs=runtime.version_declaration_globs,
+            version=new_version,
+            noop=opts.noop,
+        ),
+        after=("changelog",) if update_changelog else (),
     )
-    all_paths_to_add.extend(files_with_new_version_written)
-    all_paths_to_add.extend(assets or [])
 
-    # Build distributions before committing any changes - this way if the
-    # build fails, modifications to the source code won't be committed
-    if skip_build:
-        rprint("[bold orange1]Skipping build due to --skip-build flag")
-    else:
+    def paths_to_add() -> list[str]:
+        return [
+            *pipeline.results.get("changelog", []),
+            *pipeline.results["stamp"],
+            *(assets or []),
+        ]
+
+    def build() -> None:
+        if skip_build:
+            rprint("[bold orange1]Skipping build due to --skip-build flag")
+            return
+
+        build_command_env = {
+            # User defined overrides of environment (from config)
+            **runtime.build_command_env,
+            # PSR injected environment variables
+            "NEW_VERSION": str(new_version),
+        }
+        # Every command is part of the build, whichever order they run in
+        build_commands = runtime.build_command or str.join(
+            "\n",
+            [
+                f"{name}: {command.command}"
+                for name, command in runtime.build_commands.items()
+            ],
+        )
+        build_cache = (
+            BuildCache(
+                cache_dir=runtime.build_cache_dir,
+                # The build of an unchanged release commit is restored when the
+                # release is re-run, ex. after a failure to push or publish
+                key=BuildCache.make_key(
+                    release_tree_hash(runtime.repo_dir, paths_to_add()),
+                    build_commands,
+                    # The whole environment of the build, ex. PATH or VIRTUAL_ENV
+                    # select the tools that build the distributions
+                    build_env_vars(build_command_env),
+                ),
+                dist_glob_patterns=runtime.dist_glob_patterns,
+            )
+            if runtime.build_cache_dir and build_commands and not opts.noop
+            else None
+        )
+
         try:
             build_distributions(
                 build_command=runtime.build_command,
-                build_command_env={
-                    # User defined overrides of environment (from config)
-                    **runtime.build_command_env,
-                    # PSR injected environment variables
-                    "NEW_VERSION": str(new_version),
-                },
+                build_command_env=build_command_env,
                 noop=opts.noop,
+                build_cache=build_cache,
+                build_commands=runtime.build_commands,
+                jobs=jobs,
             )
         except BuildDistributionsError as exc:
             click.echo(str(exc), err=True)
             click.echo("Build failed, aborting release", err=True)
             ctx.exit(1)
 
+    # Build distributions before committing any changes - this way if the
+    # build fails, modifications to the source code won't be committed.
+    # The build waits for every file of the release to be written (the stamp comes
+    # after the changelog), as these files can be part of the distributions (ex. the
+    # changelog in an sdist)
+    pipeline.add("build", build, after=("stamp",))
+
+    if make_vcs_release and isinstance(hvcs_client, RemoteHvcsBase):
+        # The release notes only depend on the release history
+        pipeline.add(
+            "release_notes",
+            lambda: generate_release_notes(
+                hvcs_client,
+                release_history.released[new_version],
+                runtime.template_dir,
+                history=release_history,
+                style=runtime.changelog_style,
+                mask_initial_release=runtime.changelog_mask_initial_release,
+            ),
+        )
+
+    pipeline.run()
+    all_paths_to_add = paths_to_add()
+
     project = GitProject(
         directory=runtime.repo_dir,
         commit_author=runtime.commit_author,
@@ -690,14 +906,7 @@ def version(  # noqa: C901
         log.info("Remote does not support releases. Skipping release creation...")
         return
 
-    release_notes = generate_release_notes(
-        hvcs_client,
-        release_history.released[new_version],
-        runtime.template_dir,
-        history=release_history,
-        style=runtime.changelog_style,
-        mask_initial_release=runtime.changelog_mask_initial_release,
-    )
+    release_notes = pipeline.results["release_notes"]
 
     exception: Exception | None = None
     help_message = ""
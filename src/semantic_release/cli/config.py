@@ -39,7 +39,7 @@ from semantic_release.commit_parser import (
     ScipyCommitParser,
     TagCommitParser,
 )
-from semantic_release.const import COMMIT_MESSAGE, DEFAULT_COMMIT_AUTHOR, SEMVER_REGEX
+from semantic_release.const import COMMIT_MESSAGE, DEFAULT_COMMIT_AUTHOR
 from semantic_release.errors import (
     DetachedHeadGitError,
     InvalidConfiguration,
@@ -50,9 +50,11 @@ from semantic_release.errors import (
 from semantic_release.helpers import dynamic_import
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.version.declaration import (
+    GlobVersionDeclaration,
     PatternVersionDeclaration,
     TomlVersionDeclaration,
     VersionDeclarationABC,
+    is_glob_pattern,
 )
 from semantic_release.version.translator import VersionTranslator
 
@@ -156,6 +158,7 @@ class ChangelogConfig(BaseModel):
     mode: ChangelogMode = ChangelogMode.INIT
     insertion_flag: str = ""
     template_dir: str = "templates"
+    cache_dir: str = ""
 
     @field_validator("changelog_file", mode="after")
     @classmethod
@@ -243,6 +246,9 @@ class RemoteConfig(BaseModel):
     api_domain: Optional[str] = None
     ignore_token_for_push: bool = False
     insecure: bool = False
+    http_cache_dir: str = ""
+    # Only used by the Gitlab client
+    use_python_gitlab: bool = False
 
     @field_validator("url", "domain", "api_domain", "token", mode="before")
     @classmethod
@@ -321,6 +327,22 @@ class RemoteConfig(BaseModel):
 class PublishConfig(BaseModel):
     dist_glob_patterns: Tuple[str, ...] = ("dist/*",)
     upload_to_vcs_release: bool = True
+    upload_concurrency: Annotated[int, Field(ge=1)] = 1
+
+
+class BuildCommandConfig(BaseModel):
+    command: NonEmptyString
+    # The names of the build commands which must finish before this one starts
+    after: Tuple[str, ...] = ()
+
+
+class ProjectConfig(BaseModel):
+    path: NonEmptyString
+    # Defaults to "<project name>-v{version}", so the tags of projects don't clash
+    tag_format: Optional[str] = None
+    changelog_file: Optional[str] = None
+    version_toml: Optional[Tuple[str, ...]] = None
+    version_variables: Optional[Tuple[str, ...]] = None
 
 
 class RawConfig(BaseModel):
@@ -328,6 +350,8 @@ class RawConfig(BaseModel):
     branches: Dict[str, BranchConfig] = {"main": BranchConfig()}
     build_command: Optional[str] = None
     build_command_env: List[str] = []
+    build_commands: Dict[str, BuildCommandConfig] = {}
+    build_cache_dir: str = ""
     changelog: ChangelogConfig = ChangelogConfig()
     commit_author: MaybeFromEnv = EnvConfigVar(
         env="GIT_COMMIT_AUTHOR", default=DEFAULT_COMMIT_AUTHOR
@@ -342,8 +366,10 @@ class RawConfig(BaseModel):
     repo_dir: Annotated[Path, Field(validate_default=True)] = Path(".")
     remote: RemoteConfig = RemoteConfig()
     no_git_verify: bool = False
+    path_filters: Tuple[str, ...] = ()
     tag_format: str = "v{version}"
     publish: PublishConfig = PublishConfig()
+    projects: Dict[str, ProjectConfig] = {}
     version_toml: Optional[Tuple[str, ...]] = None
     version_variables: Optional[Tuple[str, ...]] = None
 
@@ -393,6 +419,42 @@ class RawConfig(BaseModel):
     def remove_whitespace(cls, val: list[str]) -> list[str]:
         return [entry.strip() for entry in val]
 
+    @model_validator(mode="after")
+    def order_build_commands(self) -> Self:
+        if self.build_command and self.build_commands:
+            raise ValueError(
+                "Only one of 'build_command' and 'build_commands' can be set"
+            )
+
+        # Every build command comes after the ones it depends on, so that they can be
+        # run in order
+        ordered: dict[str, BuildCommandConfig] = {}
+        visiting: list[str] = []
+
+        def visit(name: str) -> None:
+            if name in ordered:
+                return
+            if name in visiting:
+                cycle = " -> ".join([*visiting[visiting.index(name) :], name])
+                raise ValueError(f"Build commands depend on each other: {cycle}")
+            if name not in self.build_commands:
+                raise ValueError(
+                    f"Build command {visiting[-1]!r} runs after unknown build "
+                    f"command {name!r}"
+                )
+
+            visiting.append(name)
+            for dependency in self.build_commands[name].after:
+                visit(dependency)
+            visiting.pop()
+            ordered[name] = self.build_commands[name]
+
+        for name in self.build_commands:
+            visit(name)
+
+        self.build_commands = ordered
+        return self
+
     @model_validator(mode="after")
     def set_default_opts(self) -> Self:
         # Set the default parser options for the given commit parser when no user input is given
@@ -461,6 +523,39 @@ class RawConfig(BaseModel):
 
         return self
 
+    def for_project(self, name: str) -> RawConfig:
+        """
+        The configuration of one of the ``projects`` of a monorepo: only the commits
+        which change the files of the project are considered, and the project has its
+        own tag format, version declarations and (optionally) changelog file
+        """
+        try:
+            project = self.projects[name]
+        except KeyError as err:
+            raise InvalidConfiguration(
+                f"Unknown project {name!r}, expected one of {sorted(self.projects)}"
+            ) from err
+
+        changelog = self.changelog
+        if project.changelog_file:
+            changelog = changelog.model_copy(
+                update={
+                    "default_templates": changelog.default_templates.model_copy(
+                        update={"changelog_file": project.changelog_file}
+                    )
+                }
+            )
+
+        return self.model_copy(
+            update={
+                "path_filters": (project.path,),
+                "tag_format": project.tag_format or f"{name}-v{{version}}",
+                "changelog": changelog,
+                "version_toml": project.version_toml,
+                "version_variables": project.version_variables,
+            }
+        )
+
 
 @dataclass
 class GlobalCommandLineOptions:
@@ -473,6 +568,7 @@ class GlobalCommandLineOptions:
     verbosity: int = 0
     config_file: str = DEFAULT_CONFIG_FILE
     strict: bool = False
+    project: Optional[str] = None
 
 
 ######
@@ -506,11 +602,14 @@ class RuntimeContext:
     allow_zero_version: bool
     prerelease: bool
     no_git_verify: bool
+    path_filters: Tuple[str, ...]
     assets: List[str]
     commit_author: Actor
     commit_message: str
     changelog_excluded_commit_patterns: Tuple[re.Pattern[str], ...]
     version_declarations: Tuple[VersionDeclarationABC, ...]
+    # Expanded only when the version is written, see apply_version_to_source_files()
+    version_declaration_globs: Tuple[GlobVersionDeclaration, ...]
     hvcs_client: hvcs.HvcsBase
     changelog_insertion_flag: str
     changelog_mask_initial_release: bool
@@ -518,11 +617,14 @@ class RuntimeContext:
     changelog_file: Path
     changelog_style: str
     changelog_output_format: ChangelogOutputFormat
+    changelog_cache_dir: Optional[Path]
     ignore_token_for_push: bool
     template_environment: Environment
     template_dir: Path
     build_command: Optional[str]
     build_command_env: dict[str, str]
+    build_commands: Dict[str, BuildCommandConfig]
+    build_cache_dir: Optional[Path]
     dist_glob_patterns: Tuple[str, ...]
     upload_to_vcs_release: bool
     global_cli_options: GlobalCommandLineOptions
@@ -571,6 +673,9 @@ class RuntimeContext:
     def from_raw_config(  # noqa: C901
         cls, raw: RawConfig, global_cli_options: GlobalCommandLineOptions
     ) -> RuntimeContext:
+        if global_cli_options.project:
+            raw = raw.for_project(global_cli_options.project)
+
         ##
         # credentials masking for logging
         masker = MaskingFilter(_use_named_masks=raw.logging_use_named_masks)
@@ -654,9 +759,15 @@ class RuntimeContext:
         commit_author = Actor(*_commit_author_valid.groups())
 
         version_declarations: list[VersionDeclarationABC] = []
+        version_declaration_globs: list[GlobVersionDeclaration] = []
         for decl in () if raw.version_toml is None else raw.version_toml:
             try:
                 path, search_text = decl.split(":", maxsplit=1)
+                if is_glob_pattern(path):
+                    version_declaration_globs.append(
+                        GlobVersionDeclaration.from_toml(path, search_text)
+                    )
+                    continue
                 # VersionDeclarationABC handles path existence check
                 vd = TomlVersionDeclaration(path, search_text)
             except ValueError as exc:
@@ -670,20 +781,13 @@ class RuntimeContext:
         for decl in () if raw.version_variables is None else raw.version_variables:
             try:
                 path, variable = decl.split(":", maxsplit=1)
+                if is_glob_pattern(path):
+                    version_declaration_globs.append(
+                        GlobVersionDeclaration.from_variable(path, variable)
+                    )
+                    continue
                 # VersionDeclarationABC handles path existence check
-                search_text = str.join(
-                    "",
-                    [
-                        # Supports optional matching quotations around variable name
-                        # Negative lookbehind to ensure we don't match part of a variable name
-                        f"""(?x)(?P<quote1>['"])?(?<![\\w.-]){variable}(?P=quote1)?""",
-                        # Supports walrus, equals sign, or colon as assignment operator ignoring whitespace separation
-                        r"\s*(:=|[:=])\s*",
-                        # Supports optional matching quotations around version number of a SEMVER pattern
-                        f"""(?P<quote2>['"])?(?P<version>{SEMVER_REGEX.pattern})(?P=quote2)?""",
-                    ],
-                )
-                pd = PatternVersionDeclaration(path, search_text)
+                pd = PatternVersionDeclaration.from_variable(path, variable)
             except ValueError as exc:
                 log.exception("Invalid variable declaration %r", decl)
                 raise InvalidConfiguration(
@@ -707,6 +811,14 @@ class RuntimeContext:
             hvcs_api_domain=raw.remote.api_domain,
             token=raw.remote.token,
             allow_insecure=raw.remote.insecure,
+            upload_concurrency=raw.publish.upload_concurrency,
+            # An empty value disables the persistent http response cache
+            http_cache_dir=(
+                Path(raw.remote.http_cache_dir).expanduser().resolve().absolute()
+                if raw.remote.http_cache_dir
+                else None
+            ),
+            use_python_gitlab=raw.remote.use_python_gitlab,
         )
 
         # changelog_file
@@ -739,6 +851,13 @@ class RuntimeContext:
                 "Template directory must be inside of the repository directory."
             )
 
+        # An empty value disables the persistent changelog section cache
+        changelog_cache_dir = (
+            Path(raw.changelog.cache_dir).expanduser().resolve().absolute()
+            if raw.changelog.cache_dir
+            else None
+        )
+
         template_environment = environment(
             template_dir=template_dir,
             **raw.changelog.environment.model_dump(),
@@ -794,7 +913,15 @@ class RuntimeContext:
             allow_zero_version=raw.allow_zero_version,
             build_command=raw.build_command,
             build_command_env=build_cmd_env,
+            build_commands=raw.build_commands,
+            # An empty value disables the build cache
+            build_cache_dir=(
+                Path(raw.build_cache_dir).expanduser().resolve().absolute()
+                if raw.build_cache_dir
+                else None
+            ),
             version_declarations=tuple(version_declarations),
+            version_declaration_globs=tuple(version_declaration_globs),
             hvcs_client=hvcs_client,
             changelog_file=changelog_file,
             changelog_mode=raw.changelog.mode,
@@ -808,6 +935,7 @@ class RuntimeContext:
             # changelog_style=changelog_style,
             changelog_style="angular",
             changelog_output_format=raw.changelog.default_templates.output_format,
+            changelog_cache_dir=changelog_cache_dir,
             prerelease=branch_config.prerelease,
             ignore_token_for_push=raw.remote.ignore_token_for_push,
             template_dir=template_dir,
@@ -817,6 +945,7 @@ class RuntimeContext:
             global_cli_options=global_cli_options,
             masker=masker,
             no_git_verify=raw.no_git_verify,
+            path_filters=raw.path_filters,
         )
         # credential masker
         self.apply_log_masking(self.masker)
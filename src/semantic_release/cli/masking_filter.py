@@ -7,6 +7,13 @@ from typing import Iterable
 
 log = logging.getLogger(__name__)
 
+# Regexes which refer to their own groups can't be merged with other patterns, as
+# their groups are numbered differently within the merged pattern, nor can regexes
+# which set flags for the whole of the pattern
+_UNMERGEABLE_RE = re.compile(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+# Flags which can be scoped to a group of the merged pattern
+_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
 
 # https://relaxdiego.com/2014/07/logging-in-python.html
 # Updated/adapted for Python3
@@ -24,14 +31,46 @@ class MaskingFilter(logging.Filter):
         for k, vs in patterns.items():
             self._redact_patterns[k] = {v for v in vs if v and v not in self._UNWANTED}
         self._use_named_masks = _use_named_masks
+        # The values to redact are compiled into a single pattern when first needed,
+        # and again only once the values have changed
+        self._compiled: _CompiledMasks | None = None
 
     def add_mask_for(self, data: str, name: str = "redacted") -> MaskingFilter:
-        if data and data not in self._UNWANTED:
+        if (
+            data
+            and data not in self._UNWANTED
+            and data not in self._redact_patterns[name]
+        ):
             log.debug("Adding redact pattern %r to _redact_patterns", name)
             self._redact_patterns[name].add(data)
+            self._compiled = None
         return self
 
     def filter(self, record: logging.LogRecord) -> bool:
+        # Handlers only run their filters once the record has passed the level checks,
+        # so the cost of masking is only paid for the records which are emitted
+        compiled = self._compile()
+        if not compiled:
+            return True
+
+        try:
+            message = record.getMessage()
+        except Exception:  # noqa: BLE001
+            # The handler reports the broken record along with its arguments, which
+            # must be masked one by one
+            self._mask_args(record)
+            return True
+
+        # Most records don't contain any secret, and are left as they are
+        if not compiled.search(message):
+            return True
+
+        # The message is formatted already, so no arguments are left to format it with
+        record.msg = compiled.sub(message)
+        record.args = None
+        return True
+
+    def _mask_args(self, record: logging.LogRecord) -> None:
         # Note if we blindly mask all types, we will actually cast arguments to
         # log functions from external libraries to strings before they are
         # formatted into the message - for example, a dependency calling
@@ -54,7 +93,6 @@ class MaskingFilter(logging.Filter):
                 arg if type(arg) in (bool, int, float) else self.mask(str(arg))
                 for arg in record.args
             )
-        return True
 
     def mask(self, msg: str) -> str:
         if not isinstance(msg, str):
@@ -62,15 +100,108 @@ class MaskingFilter(logging.Filter):
                 "cannot mask object of type %s", type(msg)
             )
             return msg
-        for mask, values in self._redact_patterns.items():
-            repl_string = (
-                self.REPLACE_STR
-                if not self._use_named_masks
-                else f"<{mask!r} (value removed)>"
+        compiled = self._compile()
+        return compiled.sub(msg) if compiled else msg
+
+    def _compile(self) -> _CompiledMasks:
+        if self._compiled is None:
+            self._compiled = _CompiledMasks(
+                (
+                    (
+                        self.REPLACE_STR
+                        if not self._use_named_masks
+                        else f"<{mask!r} (value removed)>"
+                    ),
+                    values,
+                )
+                for mask, values in self._redact_patterns.items()
             )
+        return self._compiled
+
+
+class _CompiledMasks:
+    """
+    All of the values to redact, merged into one alternation so that a message is
+    searched & masked in a single pass
+    """
+
+    def __init__(
+        self, masks: Iterable[tuple[str, Iterable[str | re.Pattern[str]]]]
+    ) -> None:
+        literals: list[tuple[str, str]] = []
+        patterns: list[tuple[re.Pattern[str], str]] = []
+        for replacement, values in masks:
             for data in values:
                 if isinstance(data, str):
-                    msg = msg.replace(data, repl_string)
+                    literals.append((data, replacement))
                 elif isinstance(data, re.Pattern):
-                    msg = data.sub(repl_string, msg)
+                    patterns.append((data, replacement))
+
+        # Longer secrets come first so that a secret is masked whole, even when it
+        # contains another (ex. the repr() of a token, which contains the token)
+        literals.sort(key=lambda item: len(item[0]), reverse=True)
+        alternatives = [
+            (re.escape(data), replacement) for data, replacement in literals
+        ]
+
+        # Patterns which can't be merged are applied after the merged one
+        self._unmerged: list[tuple[re.Pattern[str], str]] = []
+        for pattern, replacement in patterns:
+            if (merged := _as_alternative(pattern)) is None:
+                self._unmerged.append((pattern, replacement))
+            else:
+                alternatives.append((merged, replacement))
+
+        # Each alternative is a named group, which identifies its replacement
+        self._replacements = {
+            f"_{index}": replacement
+            for index, (_, replacement) in enumerate(alternatives)
+        }
+        self._merged = (
+            re.compile(
+                "|".join(
+                    f"(?P<_{index}>{alternative})"
+                    for index, (alternative, _) in enumerate(alternatives)
+                )
+            )
+            if alternatives
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        return self._merged is not None or bool(self._unmerged)
+
+    def search(self, msg: str) -> bool:
+        return bool(
+            (self._merged is not None and self._merged.search(msg))
+            or any(pattern.search(msg) for pattern, _ in self._unmerged)
+        )
+
+    def sub(self, msg: str) -> str:
+        if self._merged is not None:
+            # The outermost group of a match is always the last one to close
+            msg = self._merged.sub(
+                lambda match: self._replacements[str(match.lastgroup)], msg
+            )
+        for pattern, replacement in self._unmerged:
+            msg = pattern.sub(replacement, msg)
         return msg
+
+
+def _as_alternative(pattern: re.Pattern[str]) -> str | None:
+    """
+    Return the regex of the pattern as an alternative of a merged pattern, or None
+    if it can't be merged without changing what it matches
+    """
+    flags = pattern.flags & ~re.UNICODE
+    if pattern.groupindex or _UNMERGEABLE_RE.search(pattern.pattern):
+        return None
+    if flags & ~sum(_INLINE_FLAGS):
+        return None
+
+    inline_flags = "".join(
+        letter for flag, letter in _INLINE_FLAGS.items() if flags & flag
+    )
+    if inline_flags:
+        return f"(?{inline_flags}:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
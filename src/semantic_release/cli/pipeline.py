@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+    from typing import Any, Callable, Iterable
+
+
+log = logging.getLogger(__name__)
+
+
+class _Stage(NamedTuple):
+    func: Callable[[], Any]
+    after: tuple[str, ...]
+
+
+class Pipeline:
+    """
+    Run the stages of a release as a dependency graph.
+
+    Every stage starts as soon as the stages it runs after have finished, with at most
+    ``max_workers`` stages running at the same time. A stage can only run after the
+    stages that were added before it, so the order in which the stages are added is
+    always a valid order to run them in one at a time.
+
+    When ``sequential``, ex. for a noop run, the stages run one at a time in the order
+    in which they were added so that the output of the stages reads the same on
+    every run.
+    """
+
+    def __init__(self, max_workers: int = 4, sequential: bool = False) -> None:
+        self.max_workers = max_workers
+        self.sequential = sequential
+        self.results: dict[str, Any] = {}
+        self._stages: dict[str, _Stage] = {}
+
+    def add(
+        self, name: str, func: Callable[[], Any], after: Iterable[str] = ()
+    ) -> Pipeline:
+        """
+        Add a stage, which can read the return value of the stages it runs after
+        from :py:attr:`results`
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage {name!r} was already added")
+
+        after = tuple(after)
+        if unknown := [stage for stage in after if stage not in self._stages]:
+            raise ValueError(f"Stage {name!r} runs after unknown stages {unknown}")
+
+        self._stages[name] = _Stage(func, after)
+        return self
+
+    def run(self) -> dict[str, Any]:
+        """
+        Run every stage, and return the return values of the stages by name.
+
+        When a stage raises an exception, the stages which run after it (directly or
+        through other stages) are skipped, while the other stages still run. The first
+        exception is raised again once every stage that could run has finished.
+        """
+        if self.sequential or self.max_workers < 2:
+            self._run_sequentially()
+            return self.results
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="psr-stage"
+        ) as executor:
+            self._run_concurrently(executor)
+        return self.results
+
+    @staticmethod
+    def _skip_dependents(pending: dict[str, _Stage], failed: set[str]) -> None:
+        # A stage only runs after stages added before it, so a single pass in order
+        # also skips the stages which depend on the failure through skipped stages
+        for name, stage in list(pending.items()):
+            if failed.intersection(stage.after):
+                log.debug("skipping stage %s after a failed stage", name)
+                del pending[name]
+                failed.add(name)
+
+    def _run_sequentially(self) -> None:
+        failed: set[str] = set()
+        error: Exception | None = None
+
+        for name, stage in self._stages.items():
+            if failed.intersection(stage.after):
+                log.debug("skipping stage %s after a failed stage", name)
+                failed.add(name)
+                continue
+
+            log.debug("running stage %s", name)
+            try:
+                self.results[name] = stage.func()
+            except Exception as err:  # noqa: BLE001
+                log.debug("stage %s failed: %s", name, err)
+                failed.add(name)
+                error = error or err
+
+        if error is not None:
+            raise error
+
+    def _run_concurrently(self, executor: ThreadPoolExecutor) -> None:
+        pending = dict(self._stages)
+        running: dict[Future[Any], str] = {}
+        failed: set[str] = set()
+        error: Exception | None = None
+
+        while pending or running:
+            self._skip_dependents(pending, failed)
+            for name in [
+                name
+                for name, stage in pending.items()
+                if all(other in self.results for other in stage.after)
+            ]:
+                log.debug("starting stage %s", name)
+                running[executor.submit(pending.pop(name).func)] = name
+
+            if not running:
+                # Nothing is left that can run
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    self.results[name] = future.result()
+                except Exception as err:  # noqa: BLE001
+                    log.debug("stage %s failed: %s", name, err)
+                    failed.add(name)
+                    error = error or err
+
+        if error is not None:
+            raise error
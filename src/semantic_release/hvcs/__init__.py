@@ -1,4 +1,5 @@
 from semantic_release.hvcs._base import HvcsBase
+from semantic_release.hvcs.async_client import AsyncRemoteHvcs
 from semantic_release.hvcs.bitbucket import Bitbucket
 from semantic_release.hvcs.gitea import Gitea
 from semantic_release.hvcs.github import Github
@@ -7,6 +8,7 @@ from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.hvcs.token_auth import TokenAuth
 
 __all__ = [
+    "AsyncRemoteHvcs",
     "Bitbucket",
     "Gitea",
     "Github",
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, cast
+
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Callable, Iterable, TypeVar
+
+    from typing_extensions import Self
+
+    from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+
+    _R = TypeVar("_R")
+
+
+log = logging.getLogger(__name__)
+
+
+class AsyncRemoteHvcs:
+    """
+    Asyncio interface to the release operations of a remote VCS client.
+
+    Every operation is run on a bounded pool of worker threads that all send their
+    requests through the ``requests`` session of the wrapped client, so independent
+    operations (ex. checking or uploading to releases of several tags) are in flight
+    at the same time while sharing one pool of (keep-alive) connections per host.
+
+    Use it as an async context manager, or call :meth:`close` once done::
+
+        async with AsyncRemoteHvcs(Github(remote_url), max_connections=8) as hvcs:
+            await asyncio.gather(
+                hvcs.create_or_update_release("v1.0.0", notes_1),
+                hvcs.create_or_update_release("v1.1.0", notes_2),
+            )
+
+    :param client: The synchronous client that performs the requests
+    :param max_connections: Maximum number of operations (and pooled connections
+        per host) in progress at the same time, the connection pools of the client
+        are enlarged to match until :meth:`close` is called
+    """
+
+    def __init__(self, client: RemoteHvcsBase, max_connections: int = 10) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+
+        self.client = client
+        self.max_connections = max_connections
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="hvcs-request"
+        )
+        # The adapters of the client's session with their pool sizes before resizing
+        self._resized_adapters: list[tuple[HTTPAdapter, int, int]] = []
+        self._resize_connection_pools()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+        # The session belongs to the client, which keeps its own pool sizes
+        for adapter, connections, maxsize in self._resized_adapters:
+            _reset_pool_manager(adapter, connections, maxsize)
+        self._resized_adapters.clear()
+
+    async def create_release(
+        self,
+        tag: str,
+        release_notes: str,
+        prerelease: bool = False,
+        assets: list[str] | None = None,
+        noop: bool = False,
+    ) -> int | str:
+        return await self._run(
+            self.client.create_release,
+            tag=tag,
+            release_notes=release_notes,
+            prerelease=prerelease,
+            assets=assets,
+            noop=noop,
+        )
+
+    async def create_or_update_release(
+        self, tag: str, release_notes: str, prerelease: bool = False
+    ) -> int | str:
+        return await self._run(
+            self.client.create_or_update_release,
+            tag=tag,
+            release_notes=release_notes,
+            prerelease=prerelease,
+        )
+
+    async def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
+        return await self._run(self.client.upload_dists, tag=tag, dist_glob=dist_glob)
+
+    async def get_release_id_by_tag(self, tag: str) -> int | None:
+        """Get the release id of a tag, if the client is able to look it up"""
+        return await self._run_if_supported("get_release_id_by_tag", tag=tag)
+
+    async def list_releases(self) -> list[dict[str, Any]] | None:
+        """Get all releases of the repository, if the client is able to list them"""
+        return await self._run_if_supported("list_releases")
+
+    async def edit_release_notes(
+        self, release_id: int, release_notes: str
+    ) -> int | None:
+        """Replace the notes of a release, if the client is able to edit them"""
+        return await self._run_if_supported(
+            "edit_release_notes",
+            release_id=release_id,
+            release_notes=release_notes,
+        )
+
+    async def _run_if_supported(self, method_name: str, /, **kwargs: Any) -> Any:
+        if (method := getattr(self.client, method_name, None)) is None:
+            warnings.warn(
+                str.join(
+                    " ",
+                    [
+                        f"{method_name} is not supported by",
+                        type(self.client).__qualname__,
+                    ],
+                ),
+                stacklevel=3,
+            )
+            return None
+
+        return await self._run(method, **kwargs)
+
+    async def _run(self, func: Callable[..., _R], /, **kwargs: Any) -> _R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, **kwargs))
+
+    def _resize_connection_pools(self) -> None:
+        # requests keeps 10 connections per host by default, which would otherwise
+        # discard the connections of the extra workers after every request. Each
+        # operation can upload assets concurrently as well.
+        if (session := getattr(self.client, "session", None)) is None:
+            log.debug(
+                "%s has no requests session, its connections are not pooled",
+                type(self.client).__qualname__,
+            )
+            return
+
+        pool_size = self.max_connections * getattr(self.client, "upload_concurrency", 1)
+        for mounted_adapter in {id(a): a for a in session.adapters.values()}.values():
+            # The response cache wraps the adapter that holds the connections
+            adapter = getattr(mounted_adapter, "inner_adapter", mounted_adapter)
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+
+            pool_state = _pool_state(adapter)
+            if pool_state["_pool_maxsize"] < pool_size:
+                self._resized_adapters.append(
+                    (
+                        adapter,
+                        pool_state["_pool_connections"],
+                        pool_state["_pool_maxsize"],
+                    )
+                )
+                _reset_pool_manager(adapter, pool_size, pool_size)
+
+
+def _pool_state(adapter: HTTPAdapter) -> dict[str, Any]:
+    # The arguments of the pool manager, which the adapter keeps to re-create it
+    # when unpickled
+    return cast("dict[str, Any]", adapter.__getstate__())
+
+
+def _reset_pool_manager(adapter: HTTPAdapter, connections: int, maxsize: int) -> None:
+    # The connections of the replaced pool manager would otherwise be left open
+    adapter.poolmanager.clear()
+    adapter.init_poolmanager(  # type: ignore[no-untyped-call]
+        connections=connections,
+        maxsize=maxsize,
+        block=_pool_state(adapter)["_pool_block"],
+    )
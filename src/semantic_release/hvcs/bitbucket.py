@@ -17,12 +17,15 @@ from urllib3.util.url import Url, parse_url
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable
+    from typing import Any, Callable, Iterable
 
 
 # Globals
 log = logging.getLogger(__name__)
 
+# Matches the number of an issue or PR/MR reference (ex. #123 or !123)
+numeric_suffix_re = regexp(r"(\d+)$")
+
 
 class Bitbucket(RemoteHvcsBase):
     """
@@ -204,7 +207,7 @@ class Bitbucket(RemoteHvcsBase):
     def pull_request_url(self, pr_number: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(pr_number, str) and (
-            match := regexp(r"(\d+)$").search(pr_number)
+            match := numeric_suffix_re.search(pr_number)
         ):
             try:
                 pr_number = int(match.group(1))
@@ -225,7 +228,7 @@ class Bitbucket(RemoteHvcsBase):
             self.pull_request_url,
         )
 
-    def upload_dists(self, tag: str, dist_glob: str) -> int:
+    def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
         return super().upload_dists(tag, dist_glob)
 
     def create_or_update_release(
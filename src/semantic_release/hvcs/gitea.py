@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import logging
 import os
 from pathlib import PurePosixPath
@@ -10,6 +9,10 @@ from re import compile as regexp
 from typing import TYPE_CHECKING
 
 from requests import HTTPError, JSONDecodeError
+from requests_toolbelt.multipart.encoder import (
+    MultipartEncoder,
+    MultipartEncoderMonitor,
+)
 from urllib3.util.url import Url, parse_url
 
 from semantic_release.cli.util import noop_report
@@ -21,15 +24,28 @@ from semantic_release.errors import (
 from semantic_release.helpers import logged_function
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.hvcs.token_auth import TokenAuth
-from semantic_release.hvcs.util import build_requests_session, suppress_not_found
+from semantic_release.hvcs.util import (
+    RateLimitScheduler,
+    UploadProgress,
+    build_requests_session,
+    find_dist_files,
+    iter_paginated_json,
+    suppress_not_found,
+    upload_assets_concurrently,
+    upload_dists_to_release,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable
+    from pathlib import Path
+    from typing import Any, Callable, Iterable
 
 
 # Globals
 log = logging.getLogger(__name__)
 
+# Matches the number of an issue or PR/MR reference (ex. #123 or !123)
+numeric_suffix_re = regexp(r"(\d+)$")
+
 
 class Gitea(RemoteHvcsBase):
     """Gitea helper class"""
@@ -45,12 +61,20 @@ class Gitea(RemoteHvcsBase):
         hvcs_domain: str | None = None,
         token: str | None = None,
         allow_insecure: bool = False,
+        upload_concurrency: int = 1,
+        http_cache_dir: Path | None = None,
         **_kwargs: Any,
     ) -> None:
         super().__init__(remote_url)
         self.token = token
+        self.upload_concurrency = upload_concurrency
+        self.rate_limit_scheduler = RateLimitScheduler()
         auth = None if not self.token else TokenAuth(self.token)
-        self.session = build_requests_session(auth=auth)
+        self.session = build_requests_session(
+            auth=auth,
+            rate_limit=self.rate_limit_scheduler,
+            cache_dir=http_cache_dir,
+        )
 
         domain_url = self._normalize_url(
             hvcs_domain
@@ -151,17 +175,29 @@ class Gitea(RemoteHvcsBase):
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
-        errors = []
-        for asset in assets or []:
+        def upload_asset(asset: str) -> None:
             log.info("Uploading asset %s", asset)
-            try:
-                self.upload_release_asset(release_id, asset)
-            except HTTPError as err:
-                errors.append(
-                    AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
-                        err.__traceback__
-                    )
-                )
+            self.upload_release_asset(release_id, asset)
+
+        upload_results = upload_assets_concurrently(
+            upload_asset, assets or [], max_workers=self.upload_concurrency
+        )
+
+        errors = [
+            AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
+                err.__traceback__
+            )
+            for asset, err in upload_results.items()
+            if err is not None
+        ]
+
+        if upload_results:
+            log.info(
+                "Uploaded %s of %s assets to release %s",
+                len(upload_results) - len(errors),
+                len(upload_results),
+                release_id,
+            )
 
         if len(errors) < 1:
             return release_id
@@ -199,6 +235,24 @@ class Gitea(RemoteHvcsBase):
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
+    @logged_function(log)
+    def list_releases(self) -> list[dict[str, Any]]:
+        """
+        Get all releases of the repository
+        https://gitea.com/api/swagger#/repository/repoListReleases
+
+        :return: The release objects as returned by the api, newest first
+        """
+        return list(
+            iter_paginated_json(
+                self.session,
+                self.create_api_url(
+                    endpoint=f"/repos/{self.owner}/{self.repo_name}/releases"
+                ),
+                params={"limit": 50},
+            )
+        )
+
     @logged_function(log)
     def edit_release_notes(self, release_id: int, release_notes: str) -> int:
         """
@@ -269,6 +323,7 @@ class Gitea(RemoteHvcsBase):
         release_id: int,
         file: str,
         label: str | None = None,  # noqa: ARG002
+        name: str | None = None,
     ) -> bool:
         """
         Upload an asset to an existing release
@@ -276,19 +331,19 @@ class Gitea(RemoteHvcsBase):
         :param release_id: ID of the release to upload to
         :param file: Path of the file to upload
         :param label: this parameter has no effect
+        :param name: Optional name of the asset, the file name by default
 
         :return: The status of the request
         """
         url = self.asset_upload_url(release_id)
 
         with open(file, "rb") as attachment:
-            name = os.path.basename(file)
+            name = name or os.path.basename(file)
             content_type = "application/octet-stream"
-            response = self.session.post(
-                url,
-                params={"name": name},
-                data={},
-                files={
+
+            # Stream the multipart body rather than building it in memory
+            encoder = MultipartEncoder(
+                fields={
                     "attachment": (
                         name,
                         attachment,
@@ -296,6 +351,19 @@ class Gitea(RemoteHvcsBase):
                     ),
                 },
             )
+            progress = UploadProgress(name, encoder.len)
+            response = self.session.post(
+                url,
+                params={"name": name},
+                headers={
+                    "Content-Type": encoder.content_type,
+                    "Content-Length": str(encoder.len),
+                },
+                data=MultipartEncoderMonitor(
+                    encoder,
+                    callback=lambda monitor: progress.update(monitor.bytes_read),
+                ),
+            )
 
             # Raise an error if the request was not successful
             response.raise_for_status()
@@ -310,11 +378,69 @@ class Gitea(RemoteHvcsBase):
         return True
 
     @logged_function(log)
-    def upload_dists(self, tag: str, dist_glob: str) -> int:
+    def list_release_assets(self, release_id: int) -> list[dict[str, Any]]:
+        """
+        Get the assets of a release
+        https://gitea.com/api/swagger#/repository/repoListReleaseAttachments
+
+        :param release_id: ID of the release
+
+        :return: The asset objects as returned by the api
+        """
+        return list(
+            iter_paginated_json(
+                self.session,
+                self.create_api_url(
+                    endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}/assets"
+                ),
+            )
+        )
+
+    @logged_function(log)
+    def delete_release_asset(self, release_id: int, asset_id: int) -> None:
+        """
+        Delete an asset of a release
+        https://gitea.com/api/swagger#/repository/repoDeleteReleaseAttachment
+
+        :param release_id: ID of the release
+        :param asset_id: ID of the asset to delete
+        """
+        log.info("Deleting asset %s of release %s", asset_id, release_id)
+        response = self.session.delete(
+            self.create_api_url(
+                endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}/assets/{asset_id}",
+            )
+        )
+
+        # Raise an error if the request was not successful
+        response.raise_for_status()
+
+    @logged_function(log)
+    def rename_release_asset(self, release_id: int, asset_id: int, name: str) -> None:
+        """
+        Rename an asset of a release
+        https://gitea.com/api/swagger#/repository/repoEditReleaseAttachment
+
+        :param release_id: ID of the release
+        :param asset_id: ID of the asset to rename
+        :param name: New file name of the asset
+        """
+        response = self.session.patch(
+            self.create_api_url(
+                endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}/assets/{asset_id}",
+            ),
+            json={"name": name},
+        )
+
+        # Raise an error if the request was not successful
+        response.raise_for_status()
+
+    @logged_function(log)
+    def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
         """
         Upload distributions to a release
         :param tag: Tag to upload for
-        :param path: Path to the dist directory
+        :param dist_glob: Glob pattern(s) of the distributions to upload
 
         :return: The number of distributions successfully uploaded
         """
@@ -324,18 +450,7 @@ class Gitea(RemoteHvcsBase):
             log.warning("No release corresponds to tag %s, can't upload dists", tag)
             return 0
 
-        # Upload assets
-        n_succeeded = 0
-        for file_path in (
-            f for f in glob.glob(dist_glob, recursive=True) if os.path.isfile(f)
-        ):
-            try:
-                self.upload_release_asset(release_id, file_path)
-                n_succeeded += 1
-            except HTTPError:  # noqa: PERF203
-                log.exception("error uploading asset %s", file_path)
-
-        return n_succeeded
+        return upload_dists_to_release(self, release_id, find_dist_files(dist_glob))
 
     def remote_url(self, use_token: bool = True) -> str:
         """Get the remote url including the token for authentication if requested"""
@@ -353,7 +468,7 @@ class Gitea(RemoteHvcsBase):
     def issue_url(self, issue_num: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(issue_num, str) and (
-            match := regexp(r"(\d+)$").search(issue_num)
+            match := numeric_suffix_re.search(issue_num)
         ):
             try:
                 issue_num = int(match.group(1))
@@ -368,7 +483,7 @@ class Gitea(RemoteHvcsBase):
     def pull_request_url(self, pr_number: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(pr_number, str) and (
-            match := regexp(r"(\d+)$").search(pr_number)
+            match := numeric_suffix_re.search(pr_number)
         ):
             try:
                 pr_number = int(match.group(1))
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import logging
 import mimetypes
 import os
@@ -23,15 +22,29 @@ from semantic_release.errors import (
 from semantic_release.helpers import logged_function
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.hvcs.token_auth import TokenAuth
-from semantic_release.hvcs.util import build_requests_session, suppress_not_found
+from semantic_release.hvcs.util import (
+    RateLimitScheduler,
+    UploadProgress,
+    UploadStream,
+    build_requests_session,
+    find_dist_files,
+    iter_paginated_json,
+    suppress_not_found,
+    upload_assets_concurrently,
+    upload_dists_to_release,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable
+    from pathlib import Path
+    from typing import Any, Callable, Iterable
 
 
 # Globals
 log = logging.getLogger(__name__)
 
+# Matches the number of an issue or PR/MR reference (ex. #123 or !123)
+numeric_suffix_re = regexp(r"(\d+)$")
+
 
 # Add a mime type for wheels
 # Fix incorrect entries in the `mimetypes` registry.
@@ -91,12 +104,23 @@ class Github(RemoteHvcsBase):
         hvcs_api_domain: str | None = None,
         token: str | None = None,
         allow_insecure: bool = False,
+        upload_concurrency: int = 1,
+        http_cache_dir: Path | None = None,
         **_kwargs: Any,
     ) -> None:
         super().__init__(remote_url)
         self.token = token
+        self.upload_concurrency = upload_concurrency
+        # Release metadata from api responses, see _cache_release()
+        self._releases: dict[str, dict[str, Any]] = {}
+        self._release_ids_by_tag: dict[str, int] = {}
+        self.rate_limit_scheduler = RateLimitScheduler()
         auth = None if not self.token else TokenAuth(self.token)
-        self.session = build_requests_session(auth=auth)
+        self.session = build_requests_session(
+            auth=auth,
+            rate_limit=self.rate_limit_scheduler,
+            cache_dir=http_cache_dir,
+        )
 
         # ref: https://docs.github.com/en/actions/reference/environment-variables#default-environment-variables
         domain_url_str = (
@@ -271,24 +295,40 @@ class Github(RemoteHvcsBase):
         response.raise_for_status()
 
         try:
-            release_id: int = response.json()["id"]
+            release: dict[str, Any] = response.json()
+            release_id: int = release["id"]
             log.info("Successfully created release with ID: %s", release_id)
         except JSONDecodeError as err:
             raise UnexpectedResponse("Unreadable json response") from err
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
-        errors = []
-        for asset in assets or []:
+        # Keep the upload url of the new release for the asset uploads
+        self._cache_release(release)
+
+        def upload_asset(asset: str) -> None:
             log.info("Uploading asset %s", asset)
-            try:
-                self.upload_release_asset(release_id, asset)
-            except HTTPError as err:
-                errors.append(
-                    AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
-                        err.__traceback__
-                    )
-                )
+            self.upload_release_asset(release_id, asset)
+
+        upload_results = upload_assets_concurrently(
+            upload_asset, assets or [], max_workers=self.upload_concurrency
+        )
+
+        errors = [
+            AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
+                err.__traceback__
+            )
+            for asset, err in upload_results.items()
+            if err is not None
+        ]
+
+        if upload_results:
+            log.info(
+                "Uploaded %s of %s assets to release %s",
+                len(upload_results) - len(errors),
+                len(upload_results),
+                release_id,
+            )
 
         if len(errors) < 1:
             return release_id
@@ -309,6 +349,9 @@ class Github(RemoteHvcsBase):
         :param tag: Tag to get release for
         :return: ID of release, if found, else None
         """
+        if tag in self._release_ids_by_tag:
+            return self._release_ids_by_tag[tag]
+
         tag_endpoint = self.create_api_url(
             endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/tags/{tag}",
         )
@@ -319,12 +362,38 @@ class Github(RemoteHvcsBase):
 
         try:
             data = response.json()
-            return data["id"]
+            release_id = data["id"]
         except JSONDecodeError as err:
             raise UnexpectedResponse("Unreadable json response") from err
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
+        self._cache_release(data)
+        return release_id
+
+    @logged_function(log)
+    def list_releases(self) -> list[dict[str, Any]]:
+        """
+        Get all releases of the repository
+        https://docs.github.com/rest/releases/releases#list-releases
+
+        :return: The release objects as returned by the api, newest first
+        """
+        releases = list(
+            iter_paginated_json(
+                self.session,
+                self.create_api_url(
+                    endpoint=f"/repos/{self.owner}/{self.repo_name}/releases"
+                ),
+                params={"per_page": 100},
+            )
+        )
+
+        for release in releases:
+            self._cache_release(release)
+
+        return releases
+
     @logged_function(log)
     def edit_release_notes(self, release_id: int, release_notes: str) -> int:
         """
@@ -386,6 +455,10 @@ class Github(RemoteHvcsBase):
         :param release_id: ID of the release to upload to
         :return: URL to upload for a release if found, else None
         """
+        # Avoid the request when the release was already created or retrieved
+        if "upload_url" in (release := self._releases.get(str(release_id), {})):
+            return str(release["upload_url"]).replace("{?name,label}", "")
+
         # https://docs.github.com/en/enterprise-server@3.5/rest/releases/assets#upload-a-release-asset
         release_url = self.create_api_url(
             endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}"
@@ -395,8 +468,8 @@ class Github(RemoteHvcsBase):
         response.raise_for_status()
 
         try:
-            upload_url: str = response.json()["upload_url"]
-            return upload_url.replace("{?name,label}", "")
+            release = response.json()
+            upload_url: str = release["upload_url"]
         except JSONDecodeError as err:
             raise UnexpectedResponse("Unreadable json response") from err
         except KeyError as err:
@@ -404,9 +477,28 @@ class Github(RemoteHvcsBase):
                 "JSON response is missing a key 'upload_url'"
             ) from err
 
+        self._cache_release(release)
+        return upload_url.replace("{?name,label}", "")
+
+    def _cache_release(self, release: dict[str, Any]) -> None:
+        """
+        Store the release metadata of an api response so that later requests for the
+        same release (ex. the upload url for each asset) can be avoided
+        """
+        if "id" not in release:
+            return
+
+        self._releases[str(release["id"])] = release
+        if "tag_name" in release:
+            self._release_ids_by_tag[release["tag_name"]] = release["id"]
+
     @logged_function(log)
     def upload_release_asset(
-        self, release_id: int, file: str, label: str | None = None
+        self,
+        release_id: int,
+        file: str,
+        label: str | None = None,
+        name: str | None = None,
     ) -> bool:
         """
         Upload an asset to an existing release
@@ -414,6 +506,7 @@ class Github(RemoteHvcsBase):
         :param release_id: ID of the release to upload to
         :param file: Path of the file to upload
         :param label: Optional custom label for this file
+        :param name: Optional name of the asset, the file name by default
         :return: The status of the request
         """
         url = self.asset_upload_url(release_id)
@@ -428,14 +521,19 @@ class Github(RemoteHvcsBase):
             mimetypes.guess_type(file, strict=False)[0] or "application/octet-stream"
         )
 
+        name = name or os.path.basename(file)
+        file_size = os.path.getsize(file)
+
         with open(file, "rb") as data:
+            # Stream the file as the raw request body to keep memory usage constant
             response = self.session.post(
                 url,
-                params={"name": os.path.basename(file), "label": label},
+                params={"name": name, "label": label},
                 headers={
                     "Content-Type": content_type,
+                    "Content-Length": str(file_size),
                 },
-                data=data.read(),
+                data=UploadStream(data, file_size, UploadProgress(name, file_size)),
             )
 
             # Raise an error if the upload was unsuccessful
@@ -451,11 +549,75 @@ class Github(RemoteHvcsBase):
         return True
 
     @logged_function(log)
-    def upload_dists(self, tag: str, dist_glob: str) -> int:
+    def list_release_assets(self, release_id: int) -> list[dict[str, Any]]:
+        """
+        Get the assets of a release
+        https://docs.github.com/rest/releases/assets#list-release-assets
+
+        :param release_id: ID of the release
+
+        :return: The asset objects as returned by the api
+        """
+        return list(
+            iter_paginated_json(
+                self.session,
+                self.create_api_url(
+                    endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}/assets"
+                ),
+                params={"per_page": 100},
+            )
+        )
+
+    @logged_function(log)
+    def delete_release_asset(self, release_id: int, asset_id: int) -> None:
+        """
+        Delete an asset of a release
+        https://docs.github.com/rest/releases/assets#delete-a-release-asset
+
+        :param release_id: ID of the release
+        :param asset_id: ID of the asset to delete
+        """
+        log.info("Deleting asset %s of release %s", asset_id, release_id)
+        response = self.session.delete(
+            self.create_api_url(
+                endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/assets/{asset_id}",
+            )
+        )
+
+        # Raise an error if the request was not successful
+        response.raise_for_status()
+
+    @logged_function(log)
+    def rename_release_asset(
+        self,
+        release_id: int,  # noqa: ARG002
+        asset_id: int,
+        name: str,
+    ) -> None:
+        """
+        Rename an asset of a release
+        https://docs.github.com/rest/releases/assets#update-a-release-asset
+
+        :param release_id: this parameter has no effect, asset ids are unique
+        :param asset_id: ID of the asset to rename
+        :param name: New file name of the asset
+        """
+        response = self.session.patch(
+            self.create_api_url(
+                endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/assets/{asset_id}",
+            ),
+            json={"name": name},
+        )
+
+        # Raise an error if the request was not successful
+        response.raise_for_status()
+
+    @logged_function(log)
+    def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
         """
         Upload distributions to a release
         :param tag: Version to upload for
-        :param dist_glob: Path to the dist directory
+        :param dist_glob: Glob pattern(s) of the distributions to upload
         :return: The number of distributions successfully uploaded
         """
         # Find the release corresponding to this version
@@ -464,18 +626,7 @@ class Github(RemoteHvcsBase):
             log.warning("No release corresponds to tag %s, can't upload dists", tag)
             return 0
 
-        # Upload assets
-        n_succeeded = 0
-        for file_path in (
-            f for f in glob.glob(dist_glob, recursive=True) if os.path.isfile(f)
-        ):
-            try:
-                self.upload_release_asset(release_id, file_path)
-                n_succeeded += 1
-            except HTTPError:  # noqa: PERF203
-                log.exception("error uploading asset %s", file_path)
-
-        return n_succeeded
+        return upload_dists_to_release(self, release_id, find_dist_files(dist_glob))
 
     def remote_url(self, use_token: bool = True) -> str:
         """Get the remote url including the token for authentication if requested"""
@@ -504,7 +655,7 @@ class Github(RemoteHvcsBase):
     def issue_url(self, issue_num: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(issue_num, str) and (
-            match := regexp(r"(\d+)$").search(issue_num)
+            match := numeric_suffix_re.search(issue_num)
         ):
             try:
                 issue_num = int(match.group(1))
@@ -519,7 +670,7 @@ class Github(RemoteHvcsBase):
     def pull_request_url(self, pr_number: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(pr_number, str) and (
-            match := regexp(r"(\d+)$").search(pr_number)
+            match := numeric_suffix_re.search(pr_number)
         ):
             try:
                 pr_number = int(match.group(1))
@@ -8,22 +8,35 @@ from functools import lru_cache
 from pathlib import PurePosixPath
 from re import compile as regexp
 from typing import TYPE_CHECKING
+from urllib.parse import quote
 
-import gitlab
-import gitlab.exceptions
-import gitlab.v4
-import gitlab.v4.objects
+from requests import HTTPError
 from urllib3.util.url import Url, parse_url
 
 from semantic_release.cli.util import noop_report
-from semantic_release.errors import UnexpectedResponse
+from semantic_release.errors import (
+    AssetUploadError,
+    IncompleteReleaseError,
+    UnexpectedResponse,
+)
 from semantic_release.helpers import logged_function
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.hvcs.util import suppress_not_found
+from semantic_release.hvcs.util import (
+    RateLimitScheduler,
+    UploadProgress,
+    UploadStream,
+    build_requests_session,
+    find_dist_files,
+    suppress_not_found,
+    upload_assets_concurrently,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable
+    from pathlib import Path
+    from typing import Any, Callable, Iterable
 
+    import gitlab
+    import gitlab.v4.objects
     from gitlab.v4.objects import Project as GitLabProject
 
 
@@ -33,9 +46,18 @@ log = logging.getLogger(__name__)
 # Globals
 log = logging.getLogger(__name__)
 
+# Matches the number of an issue or PR/MR reference (ex. #123 or !123)
+numeric_suffix_re = regexp(r"(\d+)$")
+
 
 class Gitlab(RemoteHvcsBase):
-    """Gitlab HVCS interface for interacting with Gitlab repositories"""
+    """
+    Gitlab HVCS interface for interacting with Gitlab repositories
+
+    Releases are managed with direct requests to the REST API by default. With
+    ``use_python_gitlab``, the python-gitlab library is used instead, which is only
+    imported when it is needed.
+    """
 
     DEFAULT_ENV_TOKEN_NAME = "GITLAB_TOKEN"  # noqa: S105
     # purposefully not CI_JOB_TOKEN as it is not a personal access token,
@@ -50,12 +72,19 @@ class Gitlab(RemoteHvcsBase):
         hvcs_domain: str | None = None,
         token: str | None = None,
         allow_insecure: bool = False,
+        upload_concurrency: int = 1,
+        http_cache_dir: Path | None = None,
+        use_python_gitlab: bool = False,
         **_kwargs: Any,
     ) -> None:
         super().__init__(remote_url)
         self.token = token
+        self.upload_concurrency = upload_concurrency
+        self.use_python_gitlab = use_python_gitlab
         self.project_namespace = f"{self.owner}/{self.repo_name}"
         self._project: GitLabProject | None = None
+        self._http_cache_dir = http_cache_dir
+        self._python_gitlab_client: gitlab.Gitlab | None = None
 
         domain_url = self._normalize_url(
             hvcs_domain
@@ -74,8 +103,50 @@ class Gitlab(RemoteHvcsBase):
             ).url.rstrip("/")
         )
 
-        self._client = gitlab.Gitlab(self.hvcs_domain.url, private_token=self.token)
-        self._api_url = parse_url(self._client.api_url)
+        self._api_url = parse_url(f"{self.hvcs_domain.url}/api/v4")
+
+        self.rate_limit_scheduler = RateLimitScheduler()
+        self.session = build_requests_session(
+            rate_limit=self.rate_limit_scheduler,
+            cache_dir=http_cache_dir,
+        )
+        if self.token:
+            self.session.headers["PRIVATE-TOKEN"] = self.token
+
+    @property
+    def _client(self) -> gitlab.Gitlab:
+        """The python-gitlab client, which is only imported & created on first use"""
+        if self._python_gitlab_client is None:
+            import gitlab
+
+            self._python_gitlab_client = gitlab.Gitlab(
+                self.hvcs_domain.url,
+                private_token=self.token,
+                # python-gitlab handles the retries and errors of its own requests
+                session=(
+                    build_requests_session(
+                        raise_for_status=False,
+                        retry=False,
+                        rate_limit=False,
+                        cache_dir=self._http_cache_dir,
+                    )
+                    if self._http_cache_dir is not None
+                    else None
+                ),
+            )
+        return self._python_gitlab_client
+
+    def _project_api_url(self, endpoint: str) -> str:
+        # The project is identified by its url-encoded path, which saves a lookup
+        # of its id. (create_api_url() would decode the encoded path separators)
+        return str.join(
+            "",
+            [
+                str(self.api_url.url),
+                f"/projects/{quote(self.project_namespace, safe='')}",
+                endpoint,
+            ],
+        )
 
     @property
     def project(self) -> GitLabProject:
@@ -101,7 +172,7 @@ class Gitlab(RemoteHvcsBase):
         tag: str,
         release_notes: str,
         prerelease: bool = False,  # noqa: ARG002
-        assets: list[str] | None = None,  # noqa: ARG002
+        assets: list[str] | None = None,
         noop: bool = False,
     ) -> str:
         """
@@ -110,43 +181,195 @@ class Gitlab(RemoteHvcsBase):
         :param tag: The tag to create the release for
         :param release_notes: The changelog description for this version only
         :param prerelease: This parameter has no effect in GitLab
-        :param assets: A list of paths to files to upload as assets (TODO: not implemented)
+        :param assets: A list of paths to files to upload as assets, see
+            upload_release_asset()
         :param noop: If True, do not perform any actions, only log intents
 
         :return: The tag of the release
 
-        :raises: GitlabAuthenticationError: If authentication is not correct
-        :raises: GitlabCreateError: If the server cannot perform the request
+        :raises: HTTPError: If the server cannot perform the request
+        :raises: GitlabAuthenticationError: If authentication is not correct (python-gitlab)
+        :raises: GitlabCreateError: If the server cannot perform the request (python-gitlab)
+        :raises: IncompleteReleaseError: If any of the assets failed to upload
         """
         if noop:
             noop_report(f"would have created a release for tag {tag}")
+            if assets:
+                noop_report(
+                    str.join(
+                        "\n",
+                        [
+                            "would have uploaded the following assets to the release:",
+                            *assets,
+                        ],
+                    )
+                )
             return tag
 
         log.info("Creating release for %s", tag)
+        release_data = {
+            "name": tag,
+            "tag_name": tag,
+            "tag_message": tag,
+            "description": release_notes,
+        }
+
         # ref: https://docs.gitlab.com/ee/api/releases/index.html#create-a-release
-        self.project.releases.create(
-            {
-                "name": tag,
-                "tag_name": tag,
-                "tag_message": tag,
-                "description": release_notes,
-            }
-        )
+        if self.use_python_gitlab:
+            self.project.releases.create(release_data)
+        else:
+            response = self.session.post(
+                self._project_api_url("/releases"), json=release_data
+            )
+            response.raise_for_status()
+
         log.info("Successfully created release for %s", tag)
+
+        def upload_asset(asset: str) -> None:
+            log.info("Uploading asset %s", asset)
+            self.upload_release_asset(tag, asset)
+
+        upload_results = upload_assets_concurrently(
+            upload_asset, assets or [], max_workers=self.upload_concurrency
+        )
+
+        errors = [
+            AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
+                err.__traceback__
+            )
+            for asset, err in upload_results.items()
+            if err is not None
+        ]
+
+        if len(errors) < 1:
+            return tag
+
+        for error in errors:
+            log.exception(error)
+
+        raise IncompleteReleaseError(
+            f"Failed to upload asset{'s' if len(errors) > 1 else ''} to release!"
+        )
+
+    @logged_function(log)
+    def upload_release_asset(self, tag: str, file: str) -> bool:
+        """
+        Upload a file to the generic package registry of the project and link it to
+        the release of the tag. The package is named after the repository and its
+        version is the tag.
+
+        ref: https://docs.gitlab.com/ee/user/packages/generic_packages/
+        ref: https://docs.gitlab.com/ee/api/releases/links.html#create-a-release-link
+
+        :param tag: The tag of the release
+        :param file: Path of the file to upload
+
+        :return: True if the upload was successful
+        """
+        name = os.path.basename(file)
+        file_size = os.path.getsize(file)
+        package_file_url = self._project_api_url(
+            str.join(
+                "/",
+                [
+                    "/packages/generic",
+                    quote(self.repo_name, safe=""),
+                    quote(tag, safe=""),
+                    quote(name, safe=""),
+                ],
+            )
+        )
+
+        with open(file, "rb") as data:
+            # Stream the file as the raw request body to keep memory usage constant
+            response = self.session.put(
+                package_file_url,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(file_size),
+                },
+                data=UploadStream(data, file_size, UploadProgress(name, file_size)),
+            )
+
+            # Raise an error if the upload was unsuccessful
+            response.raise_for_status()
+
+        response = self.session.post(
+            self._project_api_url(f"/releases/{quote(tag, safe='')}/assets/links"),
+            json={"name": name, "url": package_file_url, "link_type": "package"},
+        )
+        response.raise_for_status()
+
+        log.debug("Successfully uploaded %s to Gitlab, url: %s", file, package_file_url)
+        return True
+
+    @logged_function(log)
+    def update_release_notes(self, tag: str, release_notes: str) -> str:
+        """
+        Replace the release notes of the release for the given tag.
+
+        ref: https://docs.gitlab.com/ee/api/releases/index.html#update-a-release
+
+        :param tag: The tag of the release
+        :param release_notes: The new release notes
+
+        :return: The tag of the release
+
+        :raises ValueError: If there is no release for the tag
+        :raises HTTPError: If the server cannot perform the request
+        """
+        log.info("Updating release %s", tag)
+        try:
+            response = self.session.put(
+                self._project_api_url(f"/releases/{quote(tag, safe='')}"),
+                json={"description": release_notes},
+            )
+            response.raise_for_status()
+        except HTTPError as err:
+            if err.response is not None and err.response.status_code == 404:
+                raise ValueError(f"release for tag {tag} could not be found") from err
+            raise
+
         return tag
 
     @logged_function(log)
     @suppress_not_found
-    def get_release_by_tag(self, tag: str) -> gitlab.v4.objects.ProjectRelease | None:
+    def get_release_by_tag(
+        self, tag: str
+    ) -> gitlab.v4.objects.ProjectRelease | dict[str, Any] | None:
         """
         Get a release by its tag name.
 
+        ref: https://docs.gitlab.com/ee/api/releases/index.html#get-a-release-by-a-tag-name
+
         :param tag: The tag name to get the release for
 
-        :return: gitlab.v4.objects.ProjectRelease or None if not found
+        :return: The release as returned by the REST API (or a
+            gitlab.v4.objects.ProjectRelease with python-gitlab), or None if not found
 
-        :raises: gitlab.exceptions.GitlabAuthenticationError: If the user is not authenticated
+        :raises: HTTPError: If the server cannot perform the request
+        :raises: gitlab.exceptions.GitlabAuthenticationError: If the user is not
+            authenticated (python-gitlab)
         """
+        if not self.use_python_gitlab:
+            try:
+                response = self.session.get(
+                    self._project_api_url(f"/releases/{quote(tag, safe='')}")
+                )
+                response.raise_for_status()
+            except HTTPError as err:
+                if err.response is None or err.response.status_code != 404:
+                    raise
+                log.debug("Release %s not found", tag)
+                return None
+
+            try:
+                return response.json()
+            except ValueError as err:
+                raise UnexpectedResponse("Unreadable json response") from err
+
+        import gitlab.exceptions
+
         try:
             return self.project.releases.get(tag)
         except gitlab.exceptions.GitlabGetError:
@@ -158,21 +381,31 @@ class Gitlab(RemoteHvcsBase):
     @logged_function(log)
     def edit_release_notes(  # type: ignore[override]
         self,
-        release: gitlab.v4.objects.ProjectRelease,
+        release: gitlab.v4.objects.ProjectRelease | dict[str, Any],
         release_notes: str,
     ) -> str:
         """
         Update the release notes for a given release.
 
-        :param release: The release object to update
+        :param release: The release to update, as returned by get_release_by_tag()
         :param release_notes: The new release notes
 
-        :return: The release id
+        :return: The release id, which is its tag
 
+        :raises: HTTPError: If the server cannot perform the request
         :raises: GitlabAuthenticationError: If authentication is not correct
+            (python-gitlab)
         :raises: GitlabUpdateError: If the server cannot perform the request
-
+            (python-gitlab)
         """
+        if isinstance(release, dict):
+            log.info(
+                "Updating release %s [%s]",
+                release.get("name"),
+                release.get("commit", {}).get("id"),
+            )
+            return self.update_release_notes(release["tag_name"], release_notes)
+
         log.info(
             "Updating release %s [%s]",
             release.name,
@@ -196,33 +429,39 @@ class Gitlab(RemoteHvcsBase):
         :return: The release id
 
         :raises ValueError: If the release could not be created or updated
+        :raises HTTPError: If the server cannot perform the request
         :raises gitlab.exceptions.GitlabAuthenticationError: If the user is not authenticated
         :raises GitlabUpdateError: If the server cannot perform the request
         """
+        create_errors: tuple[type[Exception], ...] = (HTTPError,)
+        if self.use_python_gitlab:
+            import gitlab.exceptions
+
+            create_errors = (gitlab.exceptions.GitlabCreateError,)
+
         try:
             return self.create_release(
                 tag=tag, release_notes=release_notes, prerelease=prerelease
             )
-        except gitlab.GitlabCreateError:
+        except create_errors as err:
             log.info(
                 "New release %s could not be created for project %s",
                 tag,
                 self.project_namespace,
             )
+            log.debug("error creating release: %s", err)
 
-        if (release_obj := self.get_release_by_tag(tag)) is None:
+        if not self.use_python_gitlab:
+            # The release is addressed by its tag, so it is updated without a lookup
+            return self.update_release_notes(tag, release_notes)
+
+        if (release := self.get_release_by_tag(tag)) is None:
             raise ValueError(
                 f"release for tag {tag} could not be found, and could not be created"
             )
 
-        log.debug(
-            "Found existing release commit %s, updating", release_obj.commit.get("id")
-        )
         # If this errors we let it die
-        return self.edit_release_notes(
-            release=release_obj,
-            release_notes=release_notes,
-        )
+        return self.edit_release_notes(release=release, release_notes=release_notes)
 
     def remote_url(self, use_token: bool = True) -> str:
         """Get the remote url including the token for authentication if requested"""
@@ -243,7 +482,7 @@ class Gitlab(RemoteHvcsBase):
     def issue_url(self, issue_num: str | int) -> str:
         # Strips off any character prefix like '#' that usually exists
         if isinstance(issue_num, str) and (
-            match := regexp(r"(\d+)$").search(issue_num)
+            match := numeric_suffix_re.search(issue_num)
         ):
             try:
                 issue_num = int(match.group(1))
@@ -258,7 +497,7 @@ class Gitlab(RemoteHvcsBase):
     def merge_request_url(self, mr_number: str | int) -> str:
         # Strips off any character prefix like '!' that usually exists
         if isinstance(mr_number, str) and (
-            match := regexp(r"(\d+)$").search(mr_number)
+            match := numeric_suffix_re.search(mr_number)
         ):
             try:
                 mr_number = int(match.group(1))
@@ -273,8 +512,64 @@ class Gitlab(RemoteHvcsBase):
     def pull_request_url(self, pr_number: str | int) -> str:
         return self.merge_request_url(mr_number=pr_number)
 
-    def upload_dists(self, tag: str, dist_glob: str) -> int:
-        return super().upload_dists(tag, dist_glob)
+    @logged_function(log)
+    def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
+        """
+        Upload distributions to the release of a tag, see upload_release_asset()
+
+        :param tag: Tag of the release to upload to
+        :param dist_glob: Glob pattern(s) of the distributions to upload
+
+        :return: The number of distributions successfully uploaded
+        """
+        # ref: https://docs.gitlab.com/ee/api/releases/index.html#get-a-release-by-a-tag-name
+        try:
+            response = self.session.get(
+                self._project_api_url(f"/releases/{quote(tag, safe='')}")
+            )
+            response.raise_for_status()
+            release = response.json()
+        except HTTPError as err:
+            if err.response is None or err.response.status_code != 404:
+                raise
+            log.warning("No release corresponds to tag %s, can't upload dists", tag)
+            return 0
+        except ValueError as err:
+            raise UnexpectedResponse("Unreadable json response") from err
+
+        # Links can not be replaced, so skip the files that are linked already
+        linked_names = {
+            link.get("name") for link in release.get("assets", {}).get("links", [])
+        }
+        dist_files = []
+        for file_path in find_dist_files(dist_glob):
+            if os.path.basename(file_path) in linked_names:
+                log.info("Asset %s is already linked to release %s", file_path, tag)
+                continue
+            dist_files.append(file_path)
+
+        upload_results = upload_assets_concurrently(
+            lambda file_path: self.upload_release_asset(tag, file_path),
+            dist_files,
+            max_workers=self.upload_concurrency,
+        )
+
+        n_succeeded = 0
+        for file_path, upload_error in upload_results.items():
+            if upload_error is None:
+                n_succeeded += 1
+                continue
+
+            log.error("error uploading asset %s", file_path, exc_info=upload_error)
+
+        log.info(
+            "Uploaded %s of %s distributions to release %s",
+            n_succeeded,
+            len(upload_results),
+            tag,
+        )
+
+        return n_succeeded
 
     def get_changelog_context_filters(self) -> tuple[Callable[..., Any], ...]:
         return (
@@ -12,7 +12,9 @@ from urllib3.util.url import Url, parse_url
 from semantic_release.hvcs import HvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any
+    from typing import Any, Iterable
+
+    from semantic_release.hvcs.util import RateLimitScheduler
 
 
 # Globals
@@ -38,6 +40,12 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
         super().__init__(remote_url)
         self._hvcs_domain: Url | None = None
         self._api_url: Url | None = None
+        # Repository url template state, see _get_repo_url_prefix()
+        self._repo_url_prefix_key: tuple[Url | None, str, str] | None = None
+        self._repo_url_prefix: str | None = None
+        self._repo_url_cache: dict[str, str] = {}
+        # Set by the clients which pace their requests by the rate limit of the remote
+        self.rate_limit_scheduler: RateLimitScheduler | None = None
 
     @property
     def hvcs_domain(self) -> Url:
@@ -52,10 +60,14 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
         return self._api_url
 
     @abstractmethod
-    def upload_dists(self, tag: str, dist_glob: str) -> int:
+    def upload_dists(self, tag: str, dist_glob: str | Iterable[str]) -> int:
         """
         Upload built distributions to a release on a remote VCS that
         supports such uploads
+
+        :param tag: Tag of the release to upload to
+        :param dist_glob: A glob pattern of the distributions, or several glob
+            patterns whose (deduplicated) files are uploaded together
         """
         self._not_supported(self.upload_dists.__name__)
         return 0
@@ -109,6 +121,33 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
         repo_path: str,
         query: str | None = None,
         fragment: str | None = None,
+    ) -> str:
+        if query is not None or fragment is not None:
+            return self._derive_repo_url(repo_path, query=query, fragment=fragment)
+
+        # Changelog filters call this once per commit, so urls are built from the
+        # pre-resolved repository prefix with plain string formatting & memoized
+        if (repo_url_prefix := self._get_repo_url_prefix()) is None:
+            return self._derive_repo_url(repo_path)
+
+        if (url := self._repo_url_cache.get(repo_path)) is None:
+            # Equivalent to the path normalization of PurePosixPath in _derive_url()
+            url = str.join(
+                "/",
+                [
+                    repo_url_prefix,
+                    *(part for part in repo_path.split("/") if part not in ("", ".")),
+                ],
+            )
+            self._repo_url_cache[repo_path] = url
+
+        return url
+
+    def _derive_repo_url(
+        self,
+        repo_path: str,
+        query: str | None = None,
+        fragment: str | None = None,
     ) -> str:
         return self.create_server_url(
             path=f"/{self.owner}/{self.repo_name}/{repo_path}",
@@ -116,6 +155,29 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
             fragment=fragment,
         )
 
+    def _get_repo_url_prefix(self) -> str | None:
+        """
+        Resolve the repository url (server, path prefix, owner & name) once so that
+        repository urls can be built by appending the normalized repo path to it.
+
+        Returns None when the prefix cannot be reused, which is the case when the
+        server path prefix would strip characters beyond the owner & repository name
+        in create_server_url(). The memoized urls are dropped whenever the domain or
+        repository identity changes.
+        """
+        prefix_key = (self._hvcs_domain, self.owner, self.repo_name)
+        if prefix_key == self._repo_url_prefix_key:
+            return self._repo_url_prefix
+
+        self._repo_url_cache.clear()
+        self._repo_url_prefix_key = prefix_key
+        self._repo_url_prefix = (
+            self._derive_repo_url(repo_path="")
+            if f"/{self.owner}/{self.repo_name}".lstrip(self.hvcs_domain.path)
+            else None
+        )
+        return self._repo_url_prefix
+
     def create_api_url(
         self,
         endpoint: str,
@@ -1,23 +1,403 @@
 from __future__ import annotations
 
+import glob
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Protocol, TypeVar
 
-from requests import HTTPError, Session
-from requests.adapters import HTTPAdapter
+from requests import HTTPError, JSONDecodeError, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry  # type: ignore[import]
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from semantic_release.errors import UnexpectedResponse
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import BinaryIO, Iterable, Iterator
+
+    from requests import PreparedRequest
+
     from semantic_release.hvcs.token_auth import TokenAuth
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimitMetrics:
+    """Counters describing how the requests of a session were rate limited"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.throttled_requests = 0
+        self.rate_limited_responses = 0
+        self.retries = 0
+        self.wait_seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__qualname__}(requests={self.requests}, "
+            f"throttled_requests={self.throttled_requests}, "
+            f"rate_limited_responses={self.rate_limited_responses}, "
+            f"retries={self.retries}, wait_seconds={self.wait_seconds:.2f})"
+        )
+
+
+class RateLimitScheduler:
+    """
+    Pace requests according to the rate limit headers of the responses.
+
+    The ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` headers (as sent by GitHub
+    and Gitea), or ``RateLimit-Remaining`` and ``RateLimit-Reset`` (as sent by GitLab),
+    are tracked across all requests of the sessions sharing the scheduler.
+    Once fewer than ``min_remaining`` requests are left, the next requests are spread
+    evenly over the time until the limit resets, and when none are left the requests
+    wait for the reset. Responses that were rate limited (a 403 or 429 status with a
+    ``Retry-After`` header, or without any remaining requests) are retried after the
+    time the server asked for, at most ``max_retries`` times. A secondary rate limit
+    of GitHub, which is reported in the body of the response only, is retried after
+    ``secondary_rate_limit_wait`` seconds.
+
+    Waits longer than ``max_wait`` seconds are never made, in that case the request
+    is sent (or the rate limited response returned) right away.
+
+    :param max_retries: Maximum number of retries of a rate limited request
+    :param max_wait: Maximum number of seconds to wait before a single request
+    :param min_remaining: Number of remaining requests below which requests are paced
+    """
+
+    rate_limited_status_codes = (403, 429)
+    # GitHub asks to wait at least a minute before retrying when it does not say how
+    # long to wait for a secondary rate limit
+    secondary_rate_limit_wait = 60.0
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        max_wait: float = 300.0,
+        min_remaining: int = 10,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.min_remaining = min_remaining
+        self.metrics = RateLimitMetrics()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+
+    def before_request(self) -> None:
+        """Wait as long as needed to stay within the rate limit before a request"""
+        with self._lock:
+            delay = self._pacing_delay()
+            if self._remaining is not None:
+                # Reserve a request, so that concurrent requests are paced as well
+                self._remaining = max(self._remaining - 1, 0)
+
+            self.metrics.requests += 1
+            if delay > 0:
+                self.metrics.throttled_requests += 1
+                self.metrics.wait_seconds += delay
+
+        if delay > 0:
+            logger.debug("Waiting %.2f seconds to stay within the rate limit", delay)
+            self._sleep(delay)
+
+    def after_response(self, response: Response) -> float | None:
+        """
+        Track the rate limit headers of a response.
+
+        :return: seconds to wait before retrying the request if the response was
+            rate limited, otherwise None
+        """
+        headers = response.headers
+        now = self._clock()
+        secondary_rate_limit = (
+            response.status_code in self.rate_limited_status_codes
+            and _is_secondary_rate_limit(response)
+        )
+
+        with self._lock:
+            remaining = _parse_int(_rate_limit_header(headers, "Remaining"))
+            if remaining is not None:
+                self._remaining = remaining
+
+            reset_at = _parse_int(_rate_limit_header(headers, "Reset"))
+            if reset_at is not None:
+                self._reset_at = float(reset_at)
+
+            if response.status_code not in self.rate_limited_status_codes:
+                return None
+
+            retry_after = _parse_retry_after(headers, now)
+            if retry_after is None and remaining == 0 and self._reset_at is not None:
+                retry_after = max(self._reset_at - now, 0.0)
+            if retry_after is None and secondary_rate_limit:
+                retry_after = self.secondary_rate_limit_wait
+            if retry_after is None:
+                # Not caused by the rate limit (ex. missing permissions)
+                return None
+
+            self.metrics.rate_limited_responses += 1
+            return retry_after
+
+    def wait_for_retry(self, delay: float) -> None:
+        """Wait the time requested by a rate limited response before its retry"""
+        with self._lock:
+            self.metrics.retries += 1
+            self.metrics.wait_seconds += delay
+
+        self._sleep(delay)
+
+    def log_metrics(self) -> None:
+        """Log how the requests were rate limited, if any were sent"""
+        if not self.metrics.requests:
+            return
+
+        logger.log(
+            logging.INFO
+            if self.metrics.throttled_requests or self.metrics.rate_limited_responses
+            else logging.DEBUG,
+            "Rate limiting of the requests to the remote VCS: %s",
+            self.metrics,
+        )
+
+    def _pacing_delay(self) -> float:
+        if self._remaining is None or self._reset_at is None:
+            return 0.0
+
+        if self._remaining >= self.min_remaining:
+            return 0.0
+
+        until_reset = self._reset_at - self._clock()
+        if until_reset <= 0:
+            # The limit was reset already, the next response has the new numbers
+            self._remaining = self._reset_at = None
+            return 0.0
+
+        delay = until_reset / (self._remaining + 1)
+        if delay > self.max_wait:
+            logger.warning(
+                "Rate limit resets in %.0f seconds, not waiting for it", until_reset
+            )
+            return 0.0
+
+        return delay
+
+
+def _is_secondary_rate_limit(response: Response) -> bool:
+    # ex. "You have exceeded a secondary rate limit. Please wait a few minutes..."
+    try:
+        message = response.json().get("message", "")
+    except (ValueError, AttributeError):
+        return False
+    return isinstance(message, str) and "secondary rate limit" in message.lower()
+
+
+def _rate_limit_header(headers: Any, name: str) -> str | None:
+    return headers.get(f"X-RateLimit-{name}", headers.get(f"RateLimit-{name}"))
+
+
+def _parse_int(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(headers: Any, now: float) -> float | None:
+    # The value is either a number of seconds or a http date
+    if (value := headers.get("Retry-After")) is None:
+        return None
+
+    if (seconds := _parse_int(value)) is not None:
+        return float(max(seconds, 0))
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request through a :class:`RateLimitScheduler`"""
+
+    def __init__(self, scheduler: RateLimitScheduler, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        attempt = 0
+        while True:
+            self.scheduler.before_request()
+            response = super().send(request, *args, **kwargs)
+            delay = self.scheduler.after_response(response)
+
+            if (
+                delay is None
+                or attempt >= self.scheduler.max_retries
+                or delay > self.scheduler.max_wait
+                # A streamed body (ex. an asset upload) has been consumed already
+                or not isinstance(request.body, (type(None), str, bytes))
+            ):
+                return response
+
+            attempt += 1
+            logger.info(
+                "Request to %s was rate limited, retrying in %.2f seconds",
+                request.url,
+                delay,
+            )
+            response.close()
+            self.scheduler.wait_for_retry(delay)
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    headers: dict[str, str]
+    body: bytes
+
+
+class ConditionalGetCache:
+    """
+    On-disk store of the bodies of GET responses and their ``ETag``.
+
+    Entries are keyed by the url and the credentials of the request, so that
+    responses are never shared between different tokens. Each entry is written to a
+    temporary file first, so concurrent processes sharing the directory never read
+    a partial entry.
+    """
+
+    # Headers that describe the transfer of the original body rather than the body
+    _transfer_headers = ("Content-Encoding", "Content-Length", "Transfer-Encoding")
+
+    # Headers that influence the content of a response
+    _vary_headers = ("Accept", "Authorization", "PRIVATE-TOKEN")
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def make_key(cls, request: PreparedRequest) -> str:
+        digest = hashlib.sha256(str(request.url).encode("utf-8"))
+        for header in cls._vary_headers:
+            digest.update(b"\0")
+            digest.update(str(request.headers.get(header, "")).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            with (self.cache_dir / f"{key}.http").open("rb") as rfd:
+                metadata = json.loads(rfd.readline())
+                body = rfd.read()
+        except (OSError, ValueError):
+            return None
+
+        return CachedResponse(metadata["etag"], metadata["headers"], body)
+
+    def set(self, key: str, etag: str, headers: dict[str, str], body: bytes) -> None:
+        metadata = {
+            "etag": etag,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name not in self._transfer_headers
+            },
+        }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=self.cache_dir, prefix=f".{key}.", delete=False
+            ) as wfd:
+                wfd.write(json.dumps(metadata).encode("utf-8"))
+                wfd.write(b"\n")
+                wfd.write(body)
+            os.replace(wfd.name, self.cache_dir / f"{key}.http")
+        except OSError as err:
+            logger.warning("Unable to write http response cache: %s", err)
+
+
+class ConditionalGetHTTPAdapter(BaseAdapter):
+    """
+    Adapter that revalidates GET requests against a :class:`ConditionalGetCache`.
+
+    A GET request for which a response was stored is sent with ``If-None-Match``,
+    and a ``304 Not Modified`` reply is answered with the stored body. GitHub does
+    not count these replies against the rate limit. All requests are sent with the
+    wrapped ``inner_adapter``.
+    """
+
+    def __init__(self, cache: ConditionalGetCache, inner_adapter: BaseAdapter) -> None:
+        super().__init__()
+        self.cache = cache
+        self.inner_adapter = inner_adapter
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, *args: Any, **kwargs: Any
+    ) -> Response:
+        if request.method != "GET" or kwargs.get("stream"):
+            return self.inner_adapter.send(request, *args, **kwargs)
+
+        key = self.cache.make_key(request)
+        if (cached := self.cache.get(key)) is not None:
+            request.headers["If-None-Match"] = cached.etag
+
+        response = self.inner_adapter.send(request, *args, **kwargs)
+
+        if cached is not None and response.status_code == 304:
+            logger.debug("Using cached response of %s", request.url)
+            return self._build_cached_response(request, response, cached)
+
+        if response.status_code == 200 and (etag := response.headers.get("ETag")):
+            self.cache.set(key, etag, dict(response.headers), response.content)
+
+        return response
+
+    def close(self) -> None:
+        self.inner_adapter.close()
+
+    def _build_cached_response(
+        self,
+        request: PreparedRequest,
+        not_modified: Response,
+        cached: CachedResponse,
+    ) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        # The headers of the 304 reply are current (ex. the rate limit headers)
+        response.headers = CaseInsensitiveDict(
+            {**cached.headers, **not_modified.headers}
+        )
+        response.headers["Content-Length"] = str(len(cached.body))
+        response._content = cached.body  # noqa: SLF001
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = not_modified.url
+        response.request = request
+        response.elapsed = not_modified.elapsed
+        response.connection = not_modified.connection
+        not_modified.close()
+        return response
+
+
 def build_requests_session(
     raise_for_status: bool = True,
     retry: bool | int | Retry = True,
     auth: TokenAuth | None = None,
+    rate_limit: bool | RateLimitScheduler = True,
+    cache_dir: Path | None = None,
 ) -> Session:
     """
     Create a requests session.
@@ -28,6 +408,12 @@ def build_requests_session(
         count. if Retry instance, it will use this instance.
     :param auth: Optional TokenAuth instance to be used to provide the Authorization
         header to the session
+    :param rate_limit: If true, requests are paced and retried according to the
+        rate limit headers of the responses with a new RateLimitScheduler. If a
+        RateLimitScheduler instance, it will use this instance (which can be shared
+        between sessions).
+    :param cache_dir: Optional directory where the bodies of GET responses are stored
+        to revalidate them with their ETag on subsequent requests
 
     :return: configured requests Session
     """
@@ -35,6 +421,27 @@ def build_requests_session(
     if raise_for_status:
         session.hooks = {"response": [lambda r, *_, **__: r.raise_for_status()]}
 
+    adapter: BaseAdapter | None = _build_adapter(retry, rate_limit)
+    if cache_dir is not None:
+        adapter = ConditionalGetHTTPAdapter(
+            ConditionalGetCache(cache_dir), adapter or HTTPAdapter()
+        )
+
+    if adapter is not None:
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    if auth:
+        logger.debug("setting up default session authentication")
+        session.auth = auth
+
+    return session
+
+
+def _build_adapter(
+    retry: bool | int | Retry, rate_limit: bool | RateLimitScheduler
+) -> HTTPAdapter | None:
+    adapter_kwargs: dict[str, Any] = {}
     if retry:
         if isinstance(retry, bool):
             retry = Retry()
@@ -42,15 +449,337 @@ def build_requests_session(
             retry = Retry(retry)
         elif not isinstance(retry, Retry):
             raise ValueError("retry should be a bool, int or Retry instance.")
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        adapter_kwargs["max_retries"] = retry
 
-    if auth:
-        logger.debug("setting up default session authentication")
-        session.auth = auth
+    if rate_limit:
+        if isinstance(rate_limit, bool):
+            rate_limit = RateLimitScheduler()
+        elif not isinstance(rate_limit, RateLimitScheduler):
+            raise ValueError(
+                "rate_limit should be a bool or RateLimitScheduler instance."
+            )
+        return RateLimitedHTTPAdapter(rate_limit, **adapter_kwargs)
 
-    return session
+    if retry:
+        return HTTPAdapter(**adapter_kwargs)
+
+    return None
+
+
+def iter_paginated_json(
+    session: Session,
+    url: str,
+    params: dict[str, Any] | None = None,
+) -> Iterator[Any]:
+    """
+    Get every item of a paginated json list endpoint, following the ``next`` links
+    of the ``Link`` header (as sent by GitHub and Gitea) until the last page.
+
+    :param session: The session used for the requests
+    :param url: The url of the first page
+    :param params: Query parameters for the first page, the urls of the next pages
+        already include them
+
+    :return: iterator over the items of all pages
+    """
+    next_url: str | None = url
+    while next_url:
+        response = session.get(next_url, params=params)
+        response.raise_for_status()
+
+        try:
+            page = response.json()
+        except JSONDecodeError as err:
+            raise UnexpectedResponse("Unreadable json response") from err
+
+        if not isinstance(page, list):
+            raise UnexpectedResponse("JSON response is not a list")
+
+        yield from page
+        next_url = response.links.get("next", {}).get("url")
+        params = None
+
+
+def _file_digest(file_path: str, algorithm: str) -> str:
+    digest = hashlib.new(algorithm)
+    with open(file_path, "rb") as rfd:
+        while chunk := rfd.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _asset_matches_file(asset: dict[str, Any], file_path: str) -> bool:
+    if asset.get("size") != os.path.getsize(file_path):
+        return False
+
+    # ex. "sha256:<hex digest>", which is not provided by every forge
+    algorithm, _, expected_digest = str(asset.get("digest") or "").partition(":")
+    if not expected_digest or algorithm not in hashlib.algorithms_available:
+        return True
+
+    return _file_digest(file_path, algorithm) == expected_digest.lower()
+
+
+def find_dist_files(dist_globs: str | Iterable[str]) -> list[str]:
+    """
+    Find the distribution files matching any of the glob patterns. A file matched by
+    several patterns (ex. ``dist/*`` and ``dist/*.whl``) is only returned once, so
+    that it is not uploaded twice.
+
+    :param dist_globs: A glob pattern, or several glob patterns
+
+    :return: The paths of the matching files, in the order they were matched
+    """
+    files: dict[str, str] = {}
+    for dist_glob in (dist_globs,) if isinstance(dist_globs, str) else dist_globs:
+        for file_path in glob.glob(dist_glob, recursive=True):
+            if os.path.isfile(file_path):
+                files.setdefault(os.path.realpath(file_path), file_path)
+
+    return list(files.values())
+
+
+def plan_asset_uploads(
+    files: Iterable[str],
+    existing_assets: Iterable[dict[str, Any]],
+) -> tuple[list[str], dict[str, int]]:
+    """
+    Compare local files with the assets that already exist on a release, so that
+    only the files that are missing or different are uploaded again.
+
+    A file is already uploaded when an asset with the same name and size exists
+    and, if the forge provides a digest of the asset, the same digest.
+
+    :param files: File paths of the assets to upload
+    :param existing_assets: The asset objects of the release as returned by the api
+
+    :return: The files that need to be uploaded, and the ids (by file path) of the
+        existing assets with the same name that those files replace
+    """
+    assets_by_name = {
+        asset["name"]: asset
+        for asset in existing_assets
+        if "name" in asset and "id" in asset
+    }
+
+    uploads: list[str] = []
+    replaced_asset_ids: dict[str, int] = {}
+    for file_path in files:
+        if (asset := assets_by_name.get(os.path.basename(file_path))) is None:
+            uploads.append(file_path)
+            continue
+
+        if _asset_matches_file(asset, file_path):
+            logger.debug("Asset %s is already uploaded, skipping", file_path)
+            continue
+
+        uploads.append(file_path)
+        replaced_asset_ids[file_path] = asset["id"]
+
+    return uploads, replaced_asset_ids
+
+
+class ReleaseAssetClient(Protocol):
+    """The methods of a hvcs client that :func:`upload_dists_to_release` uses"""
+
+    upload_concurrency: int
+
+    def list_release_assets(self, release_id: int) -> list[dict[str, Any]]: ...
+
+    def upload_release_asset(
+        self,
+        release_id: int,
+        file: str,
+        label: str | None = None,
+        name: str | None = None,
+    ) -> bool: ...
+
+    def delete_release_asset(self, release_id: int, asset_id: int) -> None: ...
+
+    def rename_release_asset(
+        self, release_id: int, asset_id: int, name: str
+    ) -> None: ...
+
+
+def _plan_dist_uploads(
+    client: ReleaseAssetClient, release_id: int, dist_files: list[str]
+) -> tuple[list[str], dict[str, int]]:
+    try:
+        existing_assets = client.list_release_assets(release_id)
+    except (HTTPError, UnexpectedResponse) as err:
+        logger.warning(
+            "Unable to list the assets of release %s, uploading all files: %s",
+            release_id,
+            err,
+        )
+        return dist_files, {}
+
+    uploads, replaced_asset_ids = plan_asset_uploads(dist_files, existing_assets)
+    if len(uploads) < len(dist_files):
+        logger.info(
+            "Skipping %s distributions already uploaded to release %s",
+            len(dist_files) - len(uploads),
+            release_id,
+        )
+
+    return uploads, replaced_asset_ids
+
+
+def _replacement_asset_name(file_path: str) -> str:
+    return f"{os.path.basename(file_path)}.uploading"
+
+
+def _swap_replaced_assets(
+    client: ReleaseAssetClient,
+    release_id: int,
+    replaced_asset_ids: dict[str, int],
+) -> dict[str, Exception | None]:
+    """
+    Delete the assets that were replaced and give the uploaded replacements their
+    final name.
+
+    :return: mapping of each file to the error of its swap, or None if successful
+    """
+    try:
+        asset_ids_by_name = {
+            asset["name"]: asset["id"]
+            for asset in client.list_release_assets(release_id)
+            if "name" in asset and "id" in asset
+        }
+    except (HTTPError, UnexpectedResponse) as err:
+        return dict.fromkeys(replaced_asset_ids, err)
+
+    results: dict[str, Exception | None] = {}
+    for file_path, old_asset_id in replaced_asset_ids.items():
+        temporary_name = _replacement_asset_name(file_path)
+        if (new_asset_id := asset_ids_by_name.get(temporary_name)) is None:
+            results[file_path] = UnexpectedResponse(
+                f"Uploaded asset {temporary_name} is missing from release {release_id}"
+            )
+            continue
+
+        try:
+            client.delete_release_asset(release_id, old_asset_id)
+            client.rename_release_asset(
+                release_id, new_asset_id, os.path.basename(file_path)
+            )
+            results[file_path] = None
+        except HTTPError as err:  # noqa: PERF203
+            results[file_path] = err
+
+    return results
+
+
+def upload_dists_to_release(
+    client: ReleaseAssetClient, release_id: int, dist_files: list[str]
+) -> int:
+    """
+    Upload the distribution files to a release, skipping the files that are already
+    uploaded so that a re-run is idempotent.
+
+    A file that differs from the asset of the same name is uploaded under a
+    temporary name first, and the existing asset is only deleted (and the new one
+    renamed) once that upload succeeded. A failed upload therefore never leaves
+    the release without the asset.
+
+    :param client: The hvcs client of the release
+    :param release_id: ID of the release to upload to
+    :param dist_files: Paths of the distribution files
+
+    :return: The number of distributions successfully uploaded
+    """
+    uploads, replaced_asset_ids = _plan_dist_uploads(client, release_id, dist_files)
+
+    def upload_dist(file_path: str) -> None:
+        if file_path in replaced_asset_ids:
+            client.upload_release_asset(
+                release_id, file_path, name=_replacement_asset_name(file_path)
+            )
+            return
+        client.upload_release_asset(release_id, file_path)
+
+    upload_results: dict[str, Exception | None] = dict(
+        upload_assets_concurrently(
+            upload_dist, uploads, max_workers=client.upload_concurrency
+        )
+    )
+
+    if uploaded_replacements := {
+        file_path: asset_id
+        for file_path, asset_id in replaced_asset_ids.items()
+        if file_path in upload_results and upload_results[file_path] is None
+    }:
+        upload_results.update(
+            _swap_replaced_assets(client, release_id, uploaded_replacements)
+        )
+
+    n_succeeded = 0
+    for file_path, err in upload_results.items():
+        if err is None:
+            n_succeeded += 1
+            continue
+
+        logger.error("error uploading asset %s", file_path, exc_info=err)
+
+    logger.info(
+        "Uploaded %s of %s distributions to release %s",
+        n_succeeded,
+        len(upload_results),
+        release_id,
+    )
+
+    return n_succeeded
+
+
+class UploadProgress:
+    """Log the progress of an upload every time another 10% has been sent"""
+
+    def __init__(self, name: str, total_size: int) -> None:
+        self.name = name
+        self.total_size = total_size
+        self._next_percent = 10
+
+    def update(self, bytes_sent: int) -> None:
+        if self.total_size < 1:
+            return
+
+        percent = bytes_sent * 100 // self.total_size
+        if percent < self._next_percent:
+            return
+
+        logger.debug(
+            "Uploading %s: %s%% (%s of %s bytes)",
+            self.name,
+            percent,
+            bytes_sent,
+            self.total_size,
+        )
+        self._next_percent = (percent // 10 + 1) * 10
+
+
+class UploadStream:
+    """
+    Read-only file wrapper to stream a file as a request body.
+
+    Requests uses the length of the stream for the Content-Length header and the
+    http client reads it in small blocks, so the file is never loaded in memory
+    all at once. Every read is reported to the given ``progress``.
+    """
+
+    def __init__(self, fd: BinaryIO, size: int, progress: UploadProgress) -> None:
+        self._fd = fd
+        self._size = size
+        self._bytes_read = 0
+        self._progress = progress
+
+    def __len__(self) -> int:
+        return self._size - self._bytes_read
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fd.read(size)
+        self._bytes_read += len(chunk)
+        self._progress.update(self._bytes_read)
+        return chunk
 
 
 _R = TypeVar("_R")
@@ -88,3 +817,55 @@ def suppress_http_error_for_codes(
 
 
 suppress_not_found = suppress_http_error_for_codes(404)
+
+
+def upload_assets_concurrently(
+    upload_asset: Callable[[str], Any],
+    assets: Iterable[str],
+    max_workers: int = 1,
+) -> dict[str, HTTPError | None]:
+    """
+    Upload assets with at most ``max_workers`` uploads in progress at the same time.
+
+    Failed uploads (HTTPErrors) are collected per asset so that the remaining assets
+    are still uploaded. Any other exception is raised once the uploads in progress
+    have finished, and the uploads that have not started yet are cancelled.
+
+    :param upload_asset: Function that uploads the asset at the given file path
+    :param assets: File paths of the assets to upload
+    :param max_workers: Maximum number of concurrent uploads
+
+    :return: mapping of each asset to the HTTPError of its upload, or None if the
+        upload was successful
+    """
+    assets = list(assets)
+    results: dict[str, HTTPError | None] = {}
+
+    if max_workers <= 1 or len(assets) <= 1:
+        for asset in assets:
+            try:
+                upload_asset(asset)
+                results[asset] = None
+            except HTTPError as err:  # noqa: PERF203
+                results[asset] = err
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(assets)),
+        thread_name_prefix="asset-upload",
+    ) as executor:
+        futures = {asset: executor.submit(upload_asset, asset) for asset in assets}
+
+        try:
+            for asset, future in futures.items():
+                try:
+                    future.result()
+                    results[asset] = None
+                except HTTPError as err:  # noqa: PERF203
+                    results[asset] = err
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            raise
+
+    return results
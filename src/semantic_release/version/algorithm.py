@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from queue import Queue
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from semantic_release.commit_parser import ParsedCommit
 from semantic_release.const import DEFAULT_VERSION
@@ -59,6 +59,18 @@ def tags_and_versions(
     return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
 
 
+def commits_touching_paths(repo: Repo, rev: str, paths: Sequence[str]) -> set[str]:
+    """
+    Return the hashes of the commits in ``rev`` which change a file matched by any of
+    the ``paths`` (git pathspecs).
+
+    The history is filtered by git itself, which reads the changed-path Bloom filters
+    of the commit-graph when they are present, so that only the matching commits
+    need to be loaded & parsed.
+    """
+    return set(repo.git.rev_list(rev, "--", *paths).split())
+
+
 def _bfs_for_latest_version_in_history(
     merge_base: Commit | TagObject | Blob | Tree,
     full_release_tags_and_versions: list[tuple[Tag, Version]],
@@ -269,10 +281,14 @@ def next_version(
     prerelease: bool = False,
     major_on_zero: bool = True,
     allow_zero_version: bool = True,
+    path_filters: Sequence[str] = (),
 ) -> Version:
     """
     Evaluate the history within `repo`, and based on the tags and commits in the repo
     history, identify the next semantic version that should be applied to a release
+
+    When `path_filters` are given, only the commits which change a file matched by
+    one of these pathspecs are parsed for the level of the bump.
     """
     # Step 1. All tags, sorted descending by semver ordering rules
     all_git_tags_as_versions = tags_and_versions(repo.tags, translator)
@@ -360,10 +376,18 @@ def next_version(
         latest_full_version_in_history,
     )
 
-    commits_since_last_full_release = (
-        repo.iter_commits()
+    commits_range = (
+        "HEAD"
         if latest_full_version_in_history is None
-        else repo.iter_commits(f"{latest_full_version_in_history.as_tag()}...")
+        else f"{latest_full_version_in_history.as_tag()}..."
+    )
+    commits_since_last_full_release = repo.iter_commits(commits_range)
+    # The commits are still walked in full to find the tags of any prereleases, which
+    # needn't touch the paths, but only the commits that do are loaded & parsed
+    shas_touching_paths = (
+        commits_touching_paths(repo, commits_range, path_filters)
+        if path_filters
+        else None
     )
 
     # Step 4. Parse each commit since the last release and find any tags that have
@@ -396,7 +420,11 @@ def next_version(
 
     # N.B. these should be sorted so long as we iterate the commits in reverse order
     for commit in commits_since_last_full_release:
-        parse_result = commit_parser.parse(commit)
+        parse_result = (
+            commit_parser.parse(commit)
+            if shas_touching_paths is None or commit.hexsha in shas_touching_paths
+            else None
+        )
         if isinstance(parse_result, ParsedCommit):
             log.debug(
                 "adding %s to the levels identified in commits_since_last_full_release",
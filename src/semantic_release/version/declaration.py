@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import TYPE_CHECKING, Any, Dict, cast
 
 import tomlkit
 from dotty_dict import Dotty  # type: ignore[import]
+from git.cmd import Git
 
+from semantic_release.const import SEMVER_REGEX
+from semantic_release.version.toml_span import find_string_value_span
 from semantic_release.version.version import Version
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable, Iterable
+
 log = logging.getLogger(__name__)
 
 
@@ -40,13 +53,12 @@ class VersionDeclarationABC(ABC):
             self._content = self.path.read_text()
         return self._content
 
-    # mypy doesn't like properties?
-    @content.setter  # type: ignore[attr-defined]
-    def _(self, _: Any) -> None:
+    @content.setter
+    def content(self, _: Any) -> None:
         raise AttributeError("'content' cannot be set directly")
 
-    @content.deleter  # type: ignore[attr-defined]
-    def _(self) -> None:
+    @content.deleter
+    def content(self) -> None:
         log.debug("resetting instance-stored source file contents")
         self._content = None
 
@@ -70,6 +82,18 @@ class VersionDeclarationABC(ABC):
         :param new_version: The new version number as a `Version` instance
         """
 
+    def replace_in(self, content: str, new_version: Version) -> str:
+        """
+        Return ``content`` with the versions replaced by ``new_version``, like
+        replace() does for the content of the source file. This allows several
+        declarations of the same file to update it one after another.
+        """
+        original_content, self._content = self._content, content
+        try:
+            return self.replace(new_version)
+        finally:
+            self._content = original_content
+
     def write(self, content: str) -> None:
         r"""
         Write new content back to the source path.
@@ -84,21 +108,31 @@ class VersionDeclarationABC(ABC):
         >>> vd.write(vd.replace(new_version))
         """
         log.debug("writing content to %r", self.path.resolve())
-        self.path.write_text(content)
+        _write_atomic(self.path.resolve(), content)
         self._content = None
 
 
 class TomlVersionDeclaration(VersionDeclarationABC):
-    """VersionDeclarationABC implementation which manages toml-format source files."""
+    """
+    VersionDeclarationABC implementation which manages toml-format source files.
+
+    The value is edited in place when it is a plain string that can be found with
+    a lightweight scan (see :func:`find_string_value_span`), otherwise the file is
+    parsed with tomlkit.
+    """
 
-    def _load(self) -> Dotty:
-        """Load the content of the source file into a Dotty for easier searching"""
-        loaded = tomlkit.loads(self.content)
+    @staticmethod
+    def _load(content: str) -> Dotty:
+        """Load the content of a toml file into a Dotty for easier searching"""
+        loaded = tomlkit.loads(content)
         return Dotty(loaded)
 
     def parse(self) -> set[Version]:
         """Look for the version in the source content"""
-        content = self._load()
+        if (span := find_string_value_span(self.content, self.search_text)) is not None:
+            return {Version.parse(self.content[span[0] : span[1]])}
+
+        content = self._load(self.content)
         maybe_version: str = content.get(self.search_text)  # type: ignore[return-value]
         if maybe_version is not None:
             log.debug(
@@ -116,16 +150,31 @@ class TomlVersionDeclaration(VersionDeclarationABC):
         Replace the version in the source content with `new_version`, and return the
         updated content.
         """
-        content = self._load()
-        if self.search_text in content:
+        return self.replace_in(self.content, new_version)
+
+    def replace_in(self, content: str, new_version: Version) -> str:
+        """Replace the version in `content` with `new_version`"""
+        # Edit the value in place where it can be found without a full parse
+        if (span := find_string_value_span(content, self.search_text)) is not None:
+            log.info(
+                "found %r in source file contents, replacing with %s",
+                self.search_text,
+                new_version,
+            )
+            return str.join(
+                "", [content[: span[0]], str(new_version), content[span[1] :]]
+            )
+
+        loaded = self._load(content)
+        if self.search_text in loaded:
             log.info(
                 "found %r in source file contents, replacing with %s",
                 self.search_text,
                 new_version,
             )
-            content[self.search_text] = str(new_version)
+            loaded[self.search_text] = str(new_version)
 
-        return tomlkit.dumps(cast(Dict[str, Any], content))
+        return tomlkit.dumps(cast(Dict[str, Any], loaded))
 
 
 class PatternVersionDeclaration(VersionDeclarationABC):
@@ -139,6 +188,8 @@ class PatternVersionDeclaration(VersionDeclarationABC):
 
     def __init__(self, path: Path | str, search_text: str) -> None:
         super().__init__(path, search_text)
+        # The variable name, for declarations created with from_variable()
+        self.variable: str | None = None
         self.search_re = re.compile(self.search_text, flags=re.MULTILINE)
         if self._VERSION_GROUP_NAME not in self.search_re.groupindex:
             raise ValueError(
@@ -147,6 +198,18 @@ class PatternVersionDeclaration(VersionDeclarationABC):
                 "groups see https://docs.python.org/3/library/re.html"
             )
 
+    @classmethod
+    def from_variable(
+        cls, path: Path | str, variable: str
+    ) -> PatternVersionDeclaration:
+        """
+        Create a declaration of the version assigned to ``variable`` in the file, as
+        configured with ``version_variables``
+        """
+        declaration = cls(path, _variable_search_text(variable))
+        declaration.variable = variable
+        return declaration
+
     # The pattern should be a regular expression with a single group,
     # containing the version to replace.
     def parse(self) -> set[Version]:
@@ -160,7 +223,7 @@ class PatternVersionDeclaration(VersionDeclarationABC):
         """
         versions = {
             Version.parse(m.group(self._VERSION_GROUP_NAME))
-            for m in self.search_re.finditer(self.content, re.MULTILINE)
+            for m in self.search_re.finditer(self.content)
         }
 
         log.debug(
@@ -178,6 +241,10 @@ class PatternVersionDeclaration(VersionDeclarationABC):
         matched pattern, then writes the updated file.
         :param new_version: The new version number as a `Version` instance
         """
+        return self.replace_in(self.content, new_version)
+
+    def replace_in(self, content: str, new_version: Version) -> str:
+        """Replace each occurrence of the matched pattern in `content`"""
         n = 0
 
         def swap_version(m: re.Match[str]) -> str:
@@ -190,12 +257,314 @@ class PatternVersionDeclaration(VersionDeclarationABC):
             log.debug("version group spans characters %s:%s", ii, jj)
             return s[i:ii] + str(new_version) + s[jj:j]
 
-        new_content, n_matches = self.search_re.subn(
-            swap_version, self.content, re.MULTILINE
-        )
+        new_content, n_matches = self.search_re.subn(swap_version, content)
 
         log.debug(
             "path=%r pattern=%r num_matches=%r", self.path, self.search_text, n_matches
         )
 
         return new_content
+
+
+class VariableVersionScanner:
+    """
+    Finds or replaces the versions assigned to any of several variables with a
+    single pass over the content of a file, rather than one pass for each variable.
+
+    The variable names are merged into one alternation of a single pattern, and
+    contents that contain none of the (literal) names are skipped without scanning.
+    Use :func:`variable_version_scanner` to reuse the compiled scanner for the
+    same variables.
+
+    :param variables: The variable names, as used in ``version_variables``
+    """
+
+    def __init__(self, variables: Iterable[str]) -> None:
+        self.variables = tuple(dict.fromkeys(variables))
+        self._variables_by_group = {
+            f"variable_{i}": variable for i, variable in enumerate(self.variables)
+        }
+        self.search_re = re.compile(
+            _variable_search_text(
+                str.join(
+                    "|",
+                    [
+                        f"(?P<{group}>{variable})"
+                        for group, variable in self._variables_by_group.items()
+                    ],
+                )
+            ),
+            flags=re.MULTILINE,
+        )
+        # Names which are plain text can only match where they occur verbatim
+        self._literal_variables = tuple(
+            variable for variable in self.variables if re.escape(variable) == variable
+        )
+        self._all_literal = len(self._literal_variables) == len(self.variables)
+
+    def _may_match(self, content: str) -> bool:
+        return not self._all_literal or any(
+            variable in content for variable in self._literal_variables
+        )
+
+    def replace(self, content: str, new_version: Version) -> str:
+        """Replace the versions assigned to each of the variables in ``content``"""
+        if not self._may_match(content):
+            return content
+
+        def swap_version(match: re.Match[str]) -> str:
+            start, end = match.span()
+            version_start, version_end = match.span("version")
+            return str.join(
+                "",
+                [
+                    content[start:version_start],
+                    str(new_version),
+                    content[version_end:end],
+                ],
+            )
+
+        new_content, n_matches = self.search_re.subn(swap_version, content)
+        log.debug(
+            "replaced %s versions of %s variables", n_matches, len(self.variables)
+        )
+        return new_content
+
+
+@lru_cache(maxsize=128)
+def variable_version_scanner(variables: tuple[str, ...]) -> VariableVersionScanner:
+    """Get the (cached) scanner of the versions of ``variables``"""
+    return VariableVersionScanner(variables)
+
+
+def _variable_search_text(variable: str) -> str:
+    return str.join(
+        "",
+        [
+            # Supports optional matching quotations around variable name
+            # Negative lookbehind to ensure we don't match part of a variable name
+            f"""(?x)(?P<quote1>['"])?(?<![\\w.-])(?:{variable})(?P=quote1)?""",
+            # Supports walrus, equals sign, or colon as assignment operator ignoring whitespace separation
+            r"\s*(:=|[:=])\s*",
+            # Supports optional matching quotations around version number of a SEMVER pattern
+            f"""(?P<quote2>['"])?(?P<version>{SEMVER_REGEX.pattern})(?P=quote2)?""",
+        ],
+    )
+
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def is_glob_pattern(path: str) -> bool:
+    """
+    Whether a declaration path is a glob pattern (ex. ``packages/**/__about__.py``).
+
+    A path containing glob characters is still a literal path when that file exists,
+    ex. ``pkg[extra]/version.py``.
+    """
+    return not _GLOB_CHARACTERS.isdisjoint(path) and not Path(path).exists()
+
+
+def find_declaration_files(
+    base_dir: Path,
+    pattern: str,
+    needle: str | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Find the files of the repository that match a glob pattern of a declaration.
+
+    The files are listed by ``git ls-files`` (tracked files and untracked files that
+    are not ignored), where ``**`` matches any number of directories. When a
+    ``needle`` is given, only the files that contain it are returned; the files are
+    memory-mapped and searched in parallel, so they are never decoded or read into
+    memory as a whole.
+
+    :param base_dir: The directory (within the repository) which the pattern is
+        relative to
+    :param pattern: The glob pattern
+    :param needle: Text that the files must contain to be returned
+    :param max_workers: Maximum number of files to search at the same time
+
+    :return: The matching files, in the order listed by git
+    """
+    # git matches the pathspec against (and lists) paths relative to its working
+    # directory, which is the base directory rather than the root of the repository
+    listed = Git(str(base_dir)).ls_files(
+        "-z",
+        "--cached",
+        "--others",
+        "--exclude-standard",
+        "--",
+        f":(glob){pattern}",
+    )
+
+    paths = [
+        path
+        for path in dict.fromkeys(
+            base_dir / name for name in listed.split("\0") if name
+        )
+        # Tracked files can be deleted from the working tree
+        if path.is_file()
+    ]
+    log.debug("glob pattern %r matches %s files", pattern, len(paths))
+
+    if needle is None or not paths:
+        return paths
+
+    encoded_needle = needle.encode()
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="declaration-scan"
+    ) as executor:
+        contains_needle = list(
+            executor.map(lambda path: _file_contains(path, encoded_needle), paths)
+        )
+
+    return [path for path, found in zip(paths, contains_needle) if found]
+
+
+class GlobVersionDeclaration:
+    """
+    The version declarations of every file matching a glob pattern (ex.
+    ``packages/**/__about__.py``). Finding the files means listing and searching the
+    repository, so the pattern is only expanded (see :meth:`expand`) when the
+    version is written.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        declare: Callable[[Path], VersionDeclarationABC],
+        needle: str | None = None,
+    ) -> None:
+        self.pattern = pattern
+        self.needle = needle
+        self._declare = declare
+
+    @classmethod
+    def from_toml(cls, pattern: str, search_text: str) -> GlobVersionDeclaration:
+        """Declare the version at the dotted key ``search_text`` of each TOML file"""
+        return cls(
+            pattern,
+            lambda path: TomlVersionDeclaration(path, search_text),
+            search_text.rsplit(".", maxsplit=1)[-1],
+        )
+
+    @classmethod
+    def from_variable(cls, pattern: str, variable: str) -> GlobVersionDeclaration:
+        """Declare the version assigned to ``variable`` in each file"""
+        return cls(
+            pattern,
+            lambda path: PatternVersionDeclaration.from_variable(path, variable),
+            # Only plain variable names can be searched for verbatim
+            variable if re.escape(variable) == variable else None,
+        )
+
+    def expand(self, base_dir: Path) -> list[VersionDeclarationABC]:
+        """
+        Find the files which match the pattern, relative to ``base_dir``
+
+        :return: A version declaration for each of the files
+        """
+        if not (paths := find_declaration_files(base_dir, self.pattern, self.needle)):
+            log.warning(
+                "No files match the version declaration pattern %r", self.pattern
+            )
+        return [self._declare(path) for path in paths]
+
+
+def _file_contains(path: Path, needle: bytes) -> bool:
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return False
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(needle) != -1
+
+
+def stamp_version(
+    version_declarations: Iterable[VersionDeclarationABC],
+    new_version: Version,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Write ``new_version`` to the source files of the version declarations.
+
+    The declarations of each file are applied in their configured order to a single
+    read of the file, which is then written once, atomically. Consecutive version
+    variables are replaced in a single pass (see :class:`VariableVersionScanner`).
+    Separate files are updated in parallel.
+
+    :param version_declarations: The declarations to update
+    :param new_version: The version to write
+    :param max_workers: Maximum number of files to update at the same time
+
+    :return: The (resolved) paths of the updated files
+    """
+    declarations_by_path: dict[Path, list[VersionDeclarationABC]] = {}
+    for declaration in version_declarations:
+        declarations_by_path.setdefault(declaration.path.resolve(), []).append(
+            declaration
+        )
+
+    def stamp_file(path: Path, declarations: list[VersionDeclarationABC]) -> Path:
+        content = path.read_text()
+        variables: list[str] = []
+
+        def replace_variables(content: str) -> str:
+            # Each run of consecutive version variables is replaced in a single pass
+            if not variables:
+                return content
+            content = variable_version_scanner(tuple(variables)).replace(
+                content, new_version
+            )
+            variables.clear()
+            return content
+
+        for declaration in declarations:
+            if (
+                isinstance(declaration, PatternVersionDeclaration)
+                and declaration.variable
+            ):
+                variables.append(declaration.variable)
+                continue
+            content = replace_variables(content)
+            content = declaration.replace_in(content, new_version)
+
+        content = replace_variables(content)
+
+        log.debug("writing %s version declarations to %r", len(declarations), path)
+        _write_atomic(path, content)
+
+        for declaration in declarations:
+            del declaration.content
+
+        return path
+
+    if len(declarations_by_path) < 2:
+        return [stamp_file(*item) for item in declarations_by_path.items()]
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="version-stamp"
+    ) as executor:
+        return list(
+            executor.map(lambda item: stamp_file(*item), declarations_by_path.items())
+        )
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    # Write to a temporary file next to the target, then rename it over the target
+    # so an interrupted write never leaves a truncated file behind
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(content)
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
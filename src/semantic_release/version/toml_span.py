@@ -0,0 +1,168 @@
+"""
+Locate the value of a key in toml content without parsing the whole document,
+so a version string can be read and replaced in place with the formatting of the
+rest of the file left exactly as it is.
+"""
+
+from __future__ import annotations
+
+import re
+
+_KEY_PART = r"""(?:[A-Za-z0-9_-]+|"[^"\\\n]*"|'[^'\n]*')"""
+_DOTTED_KEY = rf"{_KEY_PART}(?:[ \t]*\.[ \t]*{_KEY_PART})*"
+
+_KEY_PART_RE = re.compile(_KEY_PART)
+_TABLE_RE = re.compile(
+    rf"[ \t]*(?P<open>\[\[?)[ \t]*(?P<key>{_DOTTED_KEY})[ \t]*\]\]?[ \t]*(?:#.*)?$"
+)
+_KEY_VALUE_RE = re.compile(rf"[ \t]*(?P<key>{_DOTTED_KEY})[ \t]*=[ \t]*")
+_STRING_VALUE_RE = re.compile(
+    r"""(?P<quote>["'])(?P<value>[^"'\\\n]*)(?P=quote)[ \t]*(?:#.*)?$"""
+)
+_MULTILINE_STRING_DELIMITERS = ('"""', "'''")
+
+
+class _Unsupported(Exception):
+    """The content uses toml syntax which the scanner leaves to a full parser"""
+
+
+def _key_path(dotted_key: str) -> tuple[str, ...]:
+    return tuple(
+        part[1:-1] if part[0] in "\"'" else part
+        for part in _KEY_PART_RE.findall(dotted_key)
+    )
+
+
+def _bracket_depth(text: str) -> int:
+    """Net depth of the array & inline table brackets in a line of a value"""
+    depth = 0
+    quote = ""
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = ""
+            elif char == "\\" and quote == '"':
+                # escaped characters are not worth tracking, let a parser do it
+                raise _Unsupported
+        elif char in "\"'":
+            quote = char
+        elif char == "#":
+            break
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+
+    if quote:
+        raise _Unsupported
+    return depth
+
+
+def _skip_value(lines: list[str], index: int, value: str) -> int:
+    """
+    Return the index of the last line of the value which starts with ``value`` on
+    line ``index``
+    """
+    for delimiter in _MULTILINE_STRING_DELIMITERS:
+        if value.startswith(delimiter):
+            if delimiter in value[len(delimiter) :]:
+                return index
+            for end_index in range(index + 1, len(lines)):
+                if delimiter in lines[end_index]:
+                    return end_index
+            raise _Unsupported
+
+    if value[:1] not in ("[", "{"):
+        return index
+
+    depth = _bracket_depth(value)
+    while depth > 0:
+        index += 1
+        if index >= len(lines) or any(
+            delimiter in lines[index] for delimiter in _MULTILINE_STRING_DELIMITERS
+        ):
+            raise _Unsupported
+        depth += _bracket_depth(lines[index])
+    return index
+
+
+def _table_header(line: str, target: tuple[str, ...]) -> tuple[tuple[str, ...], bool]:
+    """Return the key of a table header, and whether it is an array of tables"""
+    if (table_match := _TABLE_RE.match(line)) is None:
+        raise _Unsupported
+
+    table = _key_path(table_match.group("key"))
+    is_array_table = table_match.group("open") == "[["
+    if is_array_table and target[: len(table)] == table:
+        raise _Unsupported
+    return table, is_array_table
+
+
+def _string_value_span(value: str) -> tuple[int, int]:
+    if (value_match := _STRING_VALUE_RE.match(value)) is None:
+        # not a simple string, ex. a number, multiline or escaped string
+        raise _Unsupported
+    return value_match.span("value")
+
+
+def _find_span(content: str, target: tuple[str, ...]) -> tuple[int, int] | None:
+    lines = content.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    table: tuple[str, ...] = ()
+    in_array_table = False
+    span: tuple[int, int] | None = None
+    index = 0
+    while index < len(lines):
+        line = lines[index].rstrip("\r\n")
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith("#"):
+            index += 1
+            continue
+
+        if stripped.startswith("["):
+            table, in_array_table = _table_header(line, target)
+            index += 1
+            continue
+
+        if (key_match := _KEY_VALUE_RE.match(line)) is None:
+            raise _Unsupported
+
+        key = (*table, *_key_path(key_match.group("key")))
+        value = line[key_match.end() :]
+
+        if not in_array_table and key == target:
+            if span is not None:
+                # a duplicate key, which is invalid toml
+                raise _Unsupported
+            start, end = _string_value_span(value)
+            offset = offsets[index] + key_match.end()
+            span = (offset + start, offset + end)
+        elif value.startswith("{") and target[: len(key)] == key:
+            # the key might be nested in an inline table
+            raise _Unsupported
+
+        index = _skip_value(lines, index, value) + 1
+
+    return span
+
+
+def find_string_value_span(content: str, dotted_key: str) -> tuple[int, int] | None:
+    """
+    Find the characters of the (single line, unescaped) string value of a key in
+    toml content.
+
+    :param content: The toml content
+    :param dotted_key: The key, with the names of its tables separated by dots (ie.
+        ``tool.poetry.version``)
+
+    :return: The start & end index of the value (without the quotes), or None if it
+        was not found or is declared in a way that needs a full toml parser to find
+        (ex. in an inline table, an array of tables, or with escape sequences)
+    """
+    try:
+        return _find_span(content, tuple(dotted_key.split(".")))
+    except _Unsupported:
+        return None
@@ -1081,6 +1081,34 @@ def test_changelog_post_to_release(args: list[str], cli_runner: CliRunner):
     assert expected_request_url == mock_adapter.last_request.url
 
 
+@pytest.mark.usefixtures(repo_w_trunk_only_n_prereleases_angular_commits.__name__)
+@pytest.mark.parametrize("release_notes_only", [False, True])
+def test_changelog_post_to_release_tag_writes_changelog_file(
+    release_notes_only: bool,
+    example_changelog_md: Path,
+    post_mocker: Mocker,
+    cli_runner: CliRunner,
+):
+    # Setup: Make sure the changelog doesn't already exist
+    example_changelog_md.unlink(missing_ok=True)
+
+    # Act
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        CHANGELOG_SUBCMD,
+        "--post-to-release-tag",
+        "v0.1.0",
+        *(["--release-notes-only"] if release_notes_only else []),
+    ]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    assert post_mocker.call_count == 1
+    # The changelog file is only left alone when asked to post just the notes
+    assert example_changelog_md.exists() is not release_notes_only
+
+
 @pytest.mark.parametrize(
     "repo, get_version_strings",
     [
@@ -6,17 +6,23 @@ from unittest import mock
 import pytest
 
 from semantic_release.cli.commands.main import main
+from semantic_release.enums import LevelBump
 from semantic_release.hvcs import Github
+from semantic_release.version.version import Version
 
-from tests.const import MAIN_PROG_NAME, PUBLISH_SUBCMD
+from tests.const import MAIN_PROG_NAME, PUBLISH_SUBCMD, VERSION_SUBCMD
 from tests.fixtures.repos import repo_w_trunk_only_angular_commits
 from tests.util import assert_exit_code, assert_successful_exit_code
 
 if TYPE_CHECKING:
     from typing import Sequence
+    from unittest.mock import MagicMock
 
     from click.testing import CliRunner
+    from git import Repo
 
+    from tests.fixtures.example_project import GetWheelFileFn, UpdatePyprojectTomlFn
+    from tests.fixtures.fake_forge import FakeForge
     from tests.fixtures.git_repo import GetVersionStringsFn
 
 
@@ -39,7 +45,9 @@ def test_publish_latest_uses_latest_tag(
 
         # Evaluate
         assert_successful_exit_code(result, cli_cmd)
-        mocked_upload_dists.assert_called_once_with(tag=latest_tag, dist_glob="dist/*")
+        mocked_upload_dists.assert_called_once_with(
+            tag=latest_tag, dist_glob=("dist/*",)
+        )
 
 
 @pytest.mark.usefixtures(repo_w_trunk_only_angular_commits.__name__)
@@ -59,7 +67,7 @@ def test_publish_to_tag_uses_tag(
         # Evaluate
         assert_successful_exit_code(result, cli_cmd)
         mocked_upload_dists.assert_called_once_with(
-            tag=previous_tag, dist_glob="dist/*"
+            tag=previous_tag, dist_glob=("dist/*",)
         )
 
 
@@ -79,3 +87,45 @@ def test_publish_fails_on_nonexistant_tag(cli_runner: CliRunner):
             f"Tag '{non_existant_tag}' not found in local repository!" in result.stderr
         )
         mocked_upload_dists.assert_not_called()
+
+
+def test_version_and_publish_to_forge(
+    repo_w_trunk_only_angular_commits: Repo,
+    cli_runner: CliRunner,
+    fake_forge: FakeForge,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    mocked_git_push: MagicMock,
+    get_wheel_file: GetWheelFileFn,
+    get_versions_for_trunk_only_repo_w_tags: GetVersionStringsFn,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_w_trunk_only_angular_commits
+    new_version = Version.parse(get_versions_for_trunk_only_repo_w_tags()[-1]).bump(
+        LevelBump.PATCH
+    )
+    new_tag = f"v{new_version}"
+
+    # Setup: release to the local stand-in forge instead of github.com
+    monkeypatch.setenv("GH_TOKEN", "fake-token")
+    update_pyproject_toml("tool.semantic_release.remote.type", "github")
+    update_pyproject_toml("tool.semantic_release.remote.domain", fake_forge.url)
+    update_pyproject_toml("tool.semantic_release.remote.insecure", True)
+    repo.git.commit(m="chore: release to the stand-in forge", a=True)
+
+    # Act
+    version_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--patch"]
+    version_result = cli_runner.invoke(main, version_cmd[1:])
+    publish_cmd = [MAIN_PROG_NAME, PUBLISH_SUBCMD]
+    publish_result = cli_runner.invoke(main, publish_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(version_result, version_cmd)
+    assert_successful_exit_code(publish_result, publish_cmd)
+    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+
+    release = fake_forge.release_by_tag("github", new_tag)
+    assert release is not None
+    assert release["body"]
+    assert [get_wheel_file(str(new_version)).name] == [
+        asset["name"] for asset in release["assets"]
+    ]
@@ -306,3 +306,42 @@ def test_stamp_version_variables_json(
     resulting_json_obj["version"] = orig_version
 
     assert orig_json == resulting_json_obj
+
+
+@pytest.mark.usefixtures(repo_w_no_tags_angular_commits.__name__)
+def test_version_does_not_stamp_when_changelog_fails(
+    repo_w_no_tags_angular_commits: Repo,
+    cli_runner: CliRunner,
+    mocked_git_push: MagicMock,
+    post_mocker: MagicMock,
+    example_changelog_md: Path,
+    example_pyproject_toml: Path,
+    example_project_dir: ExProjectDir,
+) -> None:
+    repo = repo_w_no_tags_angular_commits
+    version_file = example_project_dir.joinpath(
+        "src", EXAMPLE_PROJECT_NAME, "_version.py"
+    )
+
+    # Setup: the changelog can not be written over a directory
+    if example_changelog_md.exists():
+        example_changelog_md.unlink()
+    example_changelog_md.mkdir()
+
+    # Act
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        VERSION_SUBCMD,
+        "--no-commit",
+        "--no-tag",
+        "--skip-build",
+        "--changelog",
+    ]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Evaluate: no version was stamped into the source files
+    assert result.exit_code != 0
+    assert {
+        str(example_pyproject_toml.relative_to(example_project_dir)),
+        str(version_file.relative_to(example_project_dir)),
+    }.isdisjoint(item.a_path for item in repo.index.diff(None))
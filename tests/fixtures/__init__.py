@@ -1,5 +1,6 @@
 from tests.fixtures.commit_parsers import *
 from tests.fixtures.example_project import *
+from tests.fixtures.fake_forge import *
 from tests.fixtures.git_repo import *
 from tests.fixtures.repos import *
 from tests.fixtures.scipy import *
@@ -0,0 +1,625 @@
+"""
+A local stand-in for the remote VCS (forge) servers, for testing the hvcs clients
+offline. It implements the subset of the GitHub, Gitea and GitLab APIs that
+``semantic_release.hvcs`` uses, and can add latency, cap the bandwidth, enforce a
+rate limit, revalidate GET requests with an ETag and inject failures. Bitbucket has
+no release endpoints to serve.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+import pytest
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Generator, Iterator, TypeVar
+
+    from typing_extensions import Self
+
+    from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+
+    _HvcsT = TypeVar("_HvcsT", bound=RemoteHvcsBase)
+
+
+FAKE_FORGE_OWNER = "owner"
+FAKE_FORGE_REPO = "repo"
+
+
+@dataclass
+class InjectedFailure:
+    """
+    A failure response for the requests that match ``method`` (any if None) and
+    whose path matches the regular expression ``path``.
+
+    A ``status`` of 0 drops the connection without any response.
+    """
+
+    status: int
+    method: str | None = None
+    path: str = ""
+    times: int = 1
+    headers: dict[str, str] = field(default_factory=dict)
+    body: Any = None
+
+    def matches(self, method: str, path: str) -> bool:
+        return (
+            self.times > 0
+            and self.method in (None, method)
+            and re.search(self.path, path) is not None
+        )
+
+
+@dataclass(frozen=True)
+class _Request:
+    path: str
+    query: dict[str, str]
+    headers: Any
+    body: bytes
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    method: str
+    path: str
+    body_size: int
+    status: int
+
+
+class _Reply:
+    def __init__(
+        self, status: int, body: Any = None, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+class FakeForge:
+    """
+    Threaded http server that answers like the release api of a forge.
+
+    Every forge serves the single repository ``owner/repo``, the api is selected by
+    the path prefix that the clients use for a self-hosted instance: ``/api/v3``
+    (GitHub), ``/api/v1`` (Gitea) and ``/api/v4`` (GitLab). Create a client for it
+    with :meth:`client`.
+
+    Successful GET responses carry an ``ETag`` of their body, and a GET request with
+    a matching ``If-None-Match`` header is answered with a ``304 Not Modified``.
+
+    :param latency: Seconds to wait before answering each request
+    :param bandwidth: Maximum bytes per second to read or write on each connection
+    :param rate_limit: Number of requests allowed per ``rate_limit_window``, which
+        are reported in ``X-RateLimit-*`` headers. Once exhausted, requests are
+        answered with a 403 and a ``Retry-After`` header until the window resets.
+    :param rate_limit_window: Length of a rate limit window in seconds
+    :param clock: Current time for the rate limit windows, to share a fake clock
+        with the client under test
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: int | None = None,
+        rate_limit: int | None = None,
+        rate_limit_window: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.clock = clock
+
+        self.requests: list[RecordedRequest] = []
+        self.failures: list[InjectedFailure] = []
+        self.max_in_flight = 0
+        # Releases of each api, by their id (GitHub, Gitea) or tag (GitLab)
+        self.releases: dict[str, dict[Any, dict[str, Any]]] = {
+            "github": {},
+            "gitea": {},
+            "gitlab": {},
+        }
+        # Sizes of the files in the GitLab generic package registry, by path
+        self.packages: dict[str, int] = {}
+
+        self._ids = count(1)
+        self._in_flight = 0
+        self._window_start = clock()
+        self._window_requests = 0
+        self._lock = threading.RLock()
+        handler_class = type("Handler", (_ForgeRequestHandler,), {"forge": self})
+        self._server = _ForgeServer(("127.0.0.1", 0), handler_class)
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def __enter__(self) -> Self:
+        threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        ).start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def client(self, hvcs_class: type[_HvcsT], **kwargs: Any) -> _HvcsT:
+        """Create a client of ``hvcs_class`` for the repository of this forge"""
+        return hvcs_class(
+            f"git@127.0.0.1:{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}.git",
+            hvcs_domain=self.url,
+            allow_insecure=True,
+            **kwargs,
+        )
+
+    def inject_failure(
+        self,
+        status: int,
+        *,
+        method: str | None = None,
+        path: str = "",
+        times: int = 1,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+    ) -> InjectedFailure:
+        """Answer the next ``times`` matching requests with a failure, see InjectedFailure"""
+        failure = InjectedFailure(status, method, path, times, headers or {}, body)
+        with self._lock:
+            self.failures.append(failure)
+        return failure
+
+    def requests_to(self, method: str, path_pattern: str = "") -> list[RecordedRequest]:
+        with self._lock:
+            return [
+                request
+                for request in self.requests
+                if request.method == method and re.search(path_pattern, request.path)
+            ]
+
+    def release_by_tag(self, api: str, tag: str) -> dict[str, Any] | None:
+        return next(
+            (
+                release
+                for release in self.releases[api].values()
+                if release["tag_name"] == tag
+            ),
+            None,
+        )
+
+    # Request handling
+
+    def _routes(self) -> list[tuple[str, re.Pattern[str], Callable[..., _Reply]]]:
+        github = "/api/v3/repos/[^/]+/[^/]+/releases"
+        github_uploads = "/api/uploads/repos/[^/]+/[^/]+/releases"
+        gitea = "/api/v1/repos/[^/]+/[^/]+/releases"
+        gitlab = "/api/v4/projects/(?P<project>[^/]+)"
+        routes: list[tuple[str, str, Callable[..., _Reply]]] = [
+            # GitHub
+            ("GET", github, partial(self._list_releases, "github", "per_page")),
+            ("POST", github, partial(self._create_release, "github", 422)),
+            (
+                "GET",
+                f"{github}/tags/(?P<tag>[^/]+)",
+                partial(self._get_by_tag, "github"),
+            ),
+            ("GET", f"{github}/(?P<id>\\d+)", partial(self._get_release, "github")),
+            ("POST", f"{github}/(?P<id>\\d+)", partial(self._edit_release, "github")),
+            (
+                "GET",
+                f"{github}/(?P<id>\\d+)/assets",
+                partial(self._list_assets, "github"),
+            ),
+            (
+                "DELETE",
+                f"{github}/assets/(?P<asset_id>\\d+)",
+                partial(self._delete_asset, "github"),
+            ),
+            (
+                "PATCH",
+                f"{github}/assets/(?P<asset_id>\\d+)",
+                partial(self._edit_asset, "github"),
+            ),
+            ("POST", f"{github_uploads}/(?P<id>\\d+)/assets", self._github_upload),
+            # Gitea
+            ("GET", gitea, partial(self._list_releases, "gitea", "limit")),
+            ("POST", gitea, partial(self._create_release, "gitea", 409)),
+            ("GET", f"{gitea}/tags/(?P<tag>[^/]+)", partial(self._get_by_tag, "gitea")),
+            ("PATCH", f"{gitea}/(?P<id>\\d+)", partial(self._edit_release, "gitea")),
+            (
+                "GET",
+                f"{gitea}/(?P<id>\\d+)/assets",
+                partial(self._list_assets, "gitea"),
+            ),
+            ("POST", f"{gitea}/(?P<id>\\d+)/assets", self._gitea_upload),
+            (
+                "DELETE",
+                f"{gitea}/(?P<id>\\d+)/assets/(?P<asset_id>\\d+)",
+                partial(self._delete_asset, "gitea"),
+            ),
+            (
+                "PATCH",
+                f"{gitea}/(?P<id>\\d+)/assets/(?P<asset_id>\\d+)",
+                partial(self._edit_asset, "gitea"),
+            ),
+            # GitLab
+            (
+                "PUT",
+                f"{gitlab}/packages/generic/(?P<file>[^/]+/[^/]+/[^/]+)",
+                self._gitlab_package_upload,
+            ),
+            ("POST", f"{gitlab}/releases", self._gitlab_create_release),
+            ("GET", f"{gitlab}/releases/(?P<tag>[^/]+)", self._gitlab_get_release),
+            ("PUT", f"{gitlab}/releases/(?P<tag>[^/]+)", self._gitlab_edit_release),
+            (
+                "POST",
+                f"{gitlab}/releases/(?P<tag>[^/]+)/assets/links",
+                self._gitlab_create_link,
+            ),
+        ]
+        return [
+            (method, re.compile(pattern), handler)
+            for method, pattern, handler in routes
+        ]
+
+    def _handle(self, method: str, path: str, headers: Any, body: bytes) -> _Reply:
+        url = urlsplit(path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            if (failure := self._take_failure(method, url.path)) is not None:
+                return _Reply(
+                    failure.status,
+                    {"message": "injected failure"}
+                    if failure.body is None
+                    else failure.body,
+                    failure.headers,
+                )
+
+            for route_method, pattern, handler in self._routes():
+                if route_method == method and (match := pattern.fullmatch(url.path)):
+                    params = {k: unquote(v) for k, v in match.groupdict().items()}
+                    request = _Request(url.path, query, headers, body)
+                    return handler(request, **params)
+
+            return _Reply(404, {"message": "Not Found"})
+
+    def _take_failure(self, method: str, path: str) -> InjectedFailure | None:
+        for failure in self.failures:
+            if failure.matches(method, path):
+                failure.times -= 1
+                return failure
+        return None
+
+    def _rate_limit_headers(self) -> tuple[bool, dict[str, str]]:
+        if self.rate_limit is None:
+            return False, {}
+
+        with self._lock:
+            now = self.clock()
+            if now - self._window_start >= self.rate_limit_window:
+                self._window_start = now
+                self._window_requests = 0
+
+            self._window_requests += 1
+            remaining = self.rate_limit - self._window_requests
+            reset_at = self._window_start + self.rate_limit_window
+
+        limited = remaining < 0
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-RateLimit-Reset": str(math.ceil(reset_at)),
+        }
+        if limited:
+            headers["Retry-After"] = str(math.ceil(reset_at - now))
+        return limited, headers
+
+    def _paginate(self, request: _Request, items: list[Any], page_param: str) -> _Reply:
+        per_page = int(request.query.get(page_param, 30))
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * per_page
+        headers = {}
+        if start + per_page < len(items):
+            next_query = urlencode({**request.query, "page": page + 1})
+            headers["Link"] = f'<{self.url}{request.path}?{next_query}>; rel="next"'
+        return _Reply(200, items[start : start + per_page], headers)
+
+    # GitHub & Gitea
+
+    def _list_releases(self, api: str, page_param: str, request: _Request) -> _Reply:
+        newest_first = sorted(self.releases[api].values(), key=lambda r: -r["id"])
+        return self._paginate(request, newest_first, page_param)
+
+    def _create_release(
+        self, api: str, conflict_status: int, request: _Request
+    ) -> _Reply:
+        data = json.loads(request.body)
+        if self.release_by_tag(api, data["tag_name"]) is not None:
+            return _Reply(conflict_status, {"message": "Release already exists"})
+
+        release_id = next(self._ids)
+        release = {
+            "id": release_id,
+            "tag_name": data["tag_name"],
+            "name": data.get("name", data["tag_name"]),
+            "body": data.get("body", ""),
+            "draft": data.get("draft", False),
+            "prerelease": data.get("prerelease", False),
+            "assets": [],
+        }
+        if api == "github":
+            release["upload_url"] = str.join(
+                "",
+                [
+                    f"{self.url}/api/uploads/repos/{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}",
+                    f"/releases/{release_id}/assets{{?name,label}}",
+                ],
+            )
+        self.releases[api][release_id] = release
+        return _Reply(201, release)
+
+    def _get_by_tag(self, api: str, _request: _Request, tag: str) -> _Reply:
+        if (release := self.release_by_tag(api, tag)) is None:
+            return _Reply(404, {"message": "Not Found"})
+        return _Reply(200, release)
+
+    def _get_release(self, api: str, _request: _Request, id: str) -> _Reply:  # noqa: A002
+        if (release := self.releases[api].get(int(id))) is None:
+            return _Reply(404, {"message": "Not Found"})
+        return _Reply(200, release)
+
+    def _edit_release(self, api: str, request: _Request, id: str) -> _Reply:  # noqa: A002
+        if (release := self.releases[api].get(int(id))) is None:
+            return _Reply(404, {"message": "Not Found"})
+        release.update(json.loads(request.body))
+        return _Reply(200, release)
+
+    def _list_assets(self, api: str, request: _Request, id: str) -> _Reply:  # noqa: A002
+        if (release := self.releases[api].get(int(id))) is None:
+            return _Reply(404, {"message": "Not Found"})
+        return self._paginate(request, list(release["assets"]), "per_page")
+
+    def _find_asset(
+        self, api: str, asset_id: str, release_id: str | None
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        for release in self.releases[api].values():
+            if release_id is not None and int(release_id) != release["id"]:
+                continue
+            for asset in release["assets"]:
+                if asset["id"] == int(asset_id):
+                    return release, asset
+        return None
+
+    def _delete_asset(
+        self,
+        api: str,
+        _request: _Request,
+        asset_id: str,
+        id: str | None = None,  # noqa: A002
+    ) -> _Reply:
+        if (found := self._find_asset(api, asset_id, id)) is None:
+            return _Reply(404, {"message": "Not Found"})
+        release, asset = found
+        release["assets"].remove(asset)
+        return _Reply(204)
+
+    def _edit_asset(
+        self,
+        api: str,
+        request: _Request,
+        asset_id: str,
+        id: str | None = None,  # noqa: A002
+    ) -> _Reply:
+        if (found := self._find_asset(api, asset_id, id)) is None:
+            return _Reply(404, {"message": "Not Found"})
+        _, asset = found
+        asset.update(json.loads(request.body))
+        return _Reply(200, asset)
+
+    def _add_asset(
+        self, api: str, release_id: int, name: str, content: bytes
+    ) -> _Reply:
+        if (release := self.releases[api].get(release_id)) is None:
+            return _Reply(404, {"message": "Not Found"})
+
+        asset = {"id": next(self._ids), "name": name, "size": len(content)}
+        if api == "github":
+            asset["digest"] = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        release["assets"].append(asset)
+        return _Reply(201, asset)
+
+    def _github_upload(self, request: _Request, id: str) -> _Reply:  # noqa: A002
+        return self._add_asset("github", int(id), request.query["name"], request.body)
+
+    def _gitea_upload(self, request: _Request, id: str) -> _Reply:  # noqa: A002
+        # The attachment is the file of a multipart/form-data body
+        message = BytesParser().parsebytes(
+            f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+            + request.body
+        )
+        attachment = next(
+            (part for part in message.walk() if part.get_filename()), None
+        )
+        if attachment is None:
+            return _Reply(400, {"message": "attachment is required"})
+
+        name = request.query.get("name") or attachment.get_filename()
+        return self._add_asset(
+            "gitea", int(id), name, attachment.get_payload(decode=True)
+        )
+
+    # GitLab
+
+    def _gitlab_release(self, project: str, tag: str) -> dict[str, Any] | None:
+        if project != f"{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}":
+            return None
+        return self.releases["gitlab"].get(tag)
+
+    def _gitlab_package_upload(
+        self, request: _Request, project: str, file: str
+    ) -> _Reply:
+        if project != f"{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}":
+            return _Reply(404, {"message": "404 Project Not Found"})
+        self.packages[file] = len(request.body)
+        return _Reply(201, {"message": "201 Created"})
+
+    def _gitlab_create_release(self, request: _Request, project: str) -> _Reply:
+        data = json.loads(request.body)
+        if project != f"{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}":
+            return _Reply(404, {"message": "404 Project Not Found"})
+        if data["tag_name"] in self.releases["gitlab"]:
+            return _Reply(409, {"message": "Release already exists"})
+
+        release = {
+            "tag_name": data["tag_name"],
+            "name": data.get("name", data["tag_name"]),
+            "description": data.get("description", ""),
+            "assets": {"links": []},
+        }
+        self.releases["gitlab"][data["tag_name"]] = release
+        return _Reply(201, release)
+
+    def _gitlab_get_release(self, _request: _Request, project: str, tag: str) -> _Reply:
+        if (release := self._gitlab_release(project, tag)) is None:
+            return _Reply(404, {"message": "404 Not Found"})
+        return _Reply(200, release)
+
+    def _gitlab_edit_release(self, request: _Request, project: str, tag: str) -> _Reply:
+        if (release := self._gitlab_release(project, tag)) is None:
+            return _Reply(404, {"message": "404 Not Found"})
+        release.update(json.loads(request.body))
+        return _Reply(200, release)
+
+    def _gitlab_create_link(self, request: _Request, project: str, tag: str) -> _Reply:
+        if (release := self._gitlab_release(project, tag)) is None:
+            return _Reply(404, {"message": "404 Not Found"})
+
+        data = json.loads(request.body)
+        links = release["assets"]["links"]
+        if any(link["name"] == data["name"] for link in links):
+            return _Reply(422, {"message": "name has already been taken"})
+
+        link = {"id": next(self._ids), **data}
+        links.append(link)
+        return _Reply(201, link)
+
+    @staticmethod
+    def _revalidate(reply: _Reply, if_none_match: str | None) -> _Reply:
+        digest = hashlib.sha256(json.dumps(reply.body).encode()).hexdigest()
+        etag = f'"{digest[:16]}"'
+        if if_none_match == etag:
+            return _Reply(304, headers={"ETag": etag})
+        reply.headers = {**reply.headers, "ETag": etag}
+        return reply
+
+    @contextmanager
+    def _track_in_flight(self) -> Iterator[None]:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _reply_to(self, method: str, path: str, headers: Any, body: bytes) -> _Reply:
+        limited, rate_limit_headers = self._rate_limit_headers()
+        reply = (
+            _Reply(403, {"message": "API rate limit exceeded"})
+            if limited
+            else self._handle(method, path, headers, body)
+        )
+        if method == "GET" and reply.status == 200:
+            reply = self._revalidate(reply, headers.get("If-None-Match"))
+        reply.headers = {**rate_limit_headers, **reply.headers}
+
+        with self._lock:
+            self.requests.append(
+                RecordedRequest(method, urlsplit(path).path, len(body), reply.status)
+            )
+        return reply
+
+
+class _ForgeServer(ThreadingHTTPServer):
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients drop idle keep-alive connections, which is not worth a traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _ForgeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    forge: FakeForge
+
+    def _reply(self) -> None:
+        with self.forge._track_in_flight():
+            body = self._read_body()
+            time.sleep(self.forge.latency)
+            reply = self.forge._reply_to(self.command, self.path, self.headers, body)
+
+            if reply.status == 0:
+                self.close_connection = True
+                return
+
+            self._send(reply)
+
+    def _read_body(self) -> bytes:
+        remaining = int(self.headers.get("Content-Length", 0))
+        chunks = []
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 16384))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            chunks.append(chunk)
+            self._throttle(len(chunk))
+        return b"".join(chunks)
+
+    def _send(self, reply: _Reply) -> None:
+        body = b"" if reply.body is None else json.dumps(reply.body).encode()
+        self.send_response(reply.status)
+        for name, value in reply.headers.items():
+            self.send_header(name, value)
+        if reply.status == 304:
+            self.end_headers()
+            return
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self._throttle(len(body))
+        self.wfile.write(body)
+
+    def _throttle(self, num_bytes: int) -> None:
+        if self.forge.bandwidth:
+            time.sleep(num_bytes / self.forge.bandwidth)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _reply  # noqa: N815
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_forge() -> Generator[FakeForge, None, None]:
+    with FakeForge() as forge:
+        yield forge
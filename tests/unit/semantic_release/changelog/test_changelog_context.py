@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import os
+import random
+import re
 from datetime import datetime
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 from git import Commit, Object, Repo
 
-from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+import semantic_release.changelog.context as changelog_context_module
+from semantic_release.changelog.context import (
+    ChangelogMode,
+    autofit_text_width,
+    autofit_text_width_bulk,
+    convert_md_to_rst,
+    convert_md_to_rst_bulk,
+    make_changelog_context,
+)
 from semantic_release.changelog.release_history import Release, ReleaseHistory
 from semantic_release.changelog.template import environment
+from semantic_release.cli.changelog_writer import render_default_changelog_file
+from semantic_release.cli.config import ChangelogOutputFormat
 from semantic_release.commit_parser import ParsedCommit
 from semantic_release.enums import LevelBump
 from semantic_release.hvcs import Bitbucket, Gitea, Github, Gitlab
@@ -497,3 +510,197 @@ def test_changelog_context_autofit_text_width_w_indent(
 
     # Evaluate
     assert expected_changelog == actual_changelog
+
+
+def _reference_autofit_text_width(
+    text: str, maxwidth: int = 100, indent_size: int = 0
+) -> str:
+    """The original word wrap implementation, used to verify the output is unchanged"""
+    input_text = text.strip()
+
+    if len(input_text) <= maxwidth:
+        return input_text
+
+    indent = " " * indent_size
+    formatted_description = []
+
+    for paragraph in input_text.split("\n\n"):
+        formatted_paragraph = []
+        words = list(
+            filter(
+                None, paragraph.replace("\r", "").replace("\n", " ").strip().split(" ")
+            )
+        )
+
+        line = words[0]
+        next_line = ""
+
+        for word in words[1:]:
+            next_line = f"{line} {word}"
+            if len(next_line) <= maxwidth:
+                line = next_line
+                continue
+
+            formatted_paragraph.append(line)
+            line = f"{indent}{word}"
+
+        formatted_paragraph.append(line)
+        formatted_description.append(str.join("\n", formatted_paragraph))
+
+    return str.join("\n\n", formatted_description).strip()
+
+
+def _random_description(rng: random.Random) -> str:
+    """Build a description from random words and the separators found in commits"""
+    separators = [" ", " ", " ", "  ", "\n", "\r\n", "\n\n", "\t", " \n ", "\t\n"]
+    while True:
+        words = [
+            str.join(
+                "",
+                rng.choices("abcdefghijklmnopqrstuvwxyz-_*`()", k=rng.randint(1, 30)),
+            )
+            for _ in range(rng.randint(1, 60))
+        ]
+        # Words are separated by runs of separators, ex. trailing whitespace before a
+        # line break or a tab which indents the next paragraph
+        description = str.join(
+            "",
+            [
+                f"{str.join('', rng.choices(separators, k=rng.randint(1, 3)))}{word}"
+                for word in words
+            ],
+        ) + str.join("", rng.choices(separators, k=rng.randint(0, 2)))
+
+        # Paragraphs without any word are not supported by either implementation
+        if all(paragraph.strip() for paragraph in description.strip().split("\n\n")):
+            return description
+
+
+@pytest.mark.parametrize(
+    "text, maxwidth, indent_size",
+    [
+        ("a " * 60 + "\n\n\tfoo bar", 20, 2),
+        ("a " * 60 + "foo\t\n\nbar", 20, 2),
+        ("a " * 60 + "foo \t\n\n \tbar\t ", 20, 0),
+    ],
+)
+def test_autofit_text_width_strips_paragraphs(
+    text: str, maxwidth: int, indent_size: int
+):
+    expected_output = _reference_autofit_text_width(text, maxwidth, indent_size)
+
+    assert "\t" not in expected_output
+    assert expected_output == autofit_text_width(text, maxwidth, indent_size)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_autofit_text_width_matches_reference(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(100):
+        text = _random_description(rng)
+        maxwidth = rng.randint(1, 120)
+        indent_size = rng.randint(0, 6)
+
+        expected_output = _reference_autofit_text_width(text, maxwidth, indent_size)
+
+        # Execute twice to also evaluate the memoized result
+        assert expected_output == autofit_text_width(text, maxwidth, indent_size)
+        assert expected_output == autofit_text_width(text, maxwidth, indent_size)
+
+
+def test_autofit_text_width_bulk():
+    rng = random.Random(0)
+    texts = [_random_description(rng).replace("\n\n", "\n") for _ in range(50)]
+
+    expected_output = [_reference_autofit_text_width(text, 40, 2) for text in texts]
+
+    assert expected_output == autofit_text_width_bulk(iter(texts), 40, indent_size=2)
+
+
+def _reference_convert_md_to_rst(md_content: str) -> str:
+    """The original multi-pass conversion, used to verify the output is unchanged"""
+    rst_content = md_content
+    for pattern, replacement in (
+        (r"(?<=\s)__(.+?)__(?=\s|$)", r"**\1**"),
+        (r"(?<=\s)_([^_].+?[^_])_(?=\s|$)", r"*\1*"),
+        (r"^(\s*)-(\s)", r"\1*\2"),
+        (r"(?<=\s)(`[^`]+`)(?![`_])", r"`\1`"),
+        (r"(?<=\s)\[([^\]]+)\]\(([^)]+)\)(?=\s|$)", r"`\1 <\2>`_"),
+    ):
+        rst_content = re.sub(pattern, replacement, rst_content)
+    return rst_content
+
+
+md_to_rst_samples = (
+    "",
+    "plain text without any markdown",
+    "- **cli**: Add a __bold__ and _italic_ word",
+    "- fix the `raw` value and a [link](https://example.com) too",
+    "  - nested bullet with __bold `raw`__ inside",
+    "* __a _bcd_ c__ and __a `x`__ end",
+    "- first line\n\n- not a bullet as only the start of content is matched",
+    "snake_case_name and __dunder__method and `code`_ref",
+    "trailing __bold__\nnext line _italic text_\n[link](url)",
+    "unbalanced __bold and _italic and `raw and [link](",
+    "- Update docs ([#10](https://example.com/pull/10), [`abcdef0`](https://x/c/a))",
+)
+
+
+@pytest.mark.parametrize("md_content", md_to_rst_samples)
+def test_convert_md_to_rst(md_content: str):
+    expected_output = _reference_convert_md_to_rst(md_content)
+    assert expected_output == convert_md_to_rst(md_content)
+
+
+def test_convert_md_to_rst_bulk():
+    expected_output = [_reference_convert_md_to_rst(md) for md in md_to_rst_samples]
+    assert expected_output == convert_md_to_rst_bulk(md_to_rst_samples)
+
+    plain_samples = ["no markdown here", "nor here"]
+    assert plain_samples == convert_md_to_rst_bulk(iter(plain_samples))
+
+
+@pytest.mark.parametrize("hvcs_client", [Github, Gitlab, Gitea, Bitbucket])
+def test_default_rst_changelog_matches_reference_conversion(
+    hvcs_client: type[Bitbucket | Gitea | Github | Gitlab],
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    changelog_rst_file: Path,
+):
+    # Load the release history with markdown heavy commit descriptions
+    latest_version = next(iter(artificial_release_history.released.keys()))
+    for commit in artificial_release_history.released[latest_version]["elements"][
+        "feature"
+    ]:
+        assert isinstance(commit, ParsedCommit)
+        commit.descriptions.extend(md_to_rst_samples[1:])
+
+    def render_changelog() -> str:
+        return render_default_changelog_file(
+            output_format=ChangelogOutputFormat.RESTRUCTURED_TEXT,
+            changelog_context=make_changelog_context(
+                hvcs_client=hvcs_client(example_git_https_url),
+                release_history=artificial_release_history,
+                mode=ChangelogMode.INIT,
+                prev_changelog_file=changelog_rst_file,
+                insertion_flag="",
+                mask_initial_release=True,
+            ),
+            changelog_style="angular",
+        )
+
+    def reference_filter(md_content: str) -> str:
+        return _reference_convert_md_to_rst(md_content)
+
+    reference_filter.__name__ = convert_md_to_rst.__name__
+
+    with mock.patch.object(
+        changelog_context_module, convert_md_to_rst.__name__, reference_filter
+    ):
+        expected_changelog = render_changelog()
+
+    actual_changelog = render_changelog()
+
+    assert "``raw``" in actual_changelog
+    assert expected_changelog == actual_changelog
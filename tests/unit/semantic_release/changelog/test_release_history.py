@@ -5,7 +5,7 @@ from functools import reduce
 from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
-from git import Actor
+from git import Actor, Repo
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
 from semantic_release.changelog.release_history import ReleaseHistory
@@ -30,10 +30,9 @@ from tests.fixtures import (
 from tests.util import add_text_to_file
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Protocol
 
-    from git import Repo
-
     from semantic_release.commit_parser.angular import AngularCommitParser
 
     from tests.fixtures.git_repo import GetRepoDefinitionFn, RepoDefinition
@@ -324,3 +323,115 @@ def test_all_matching_repo_tags_are_released(
 
     for tag in repo.tags:
         assert translator.from_tag(tag.name) in release_history.released
+
+
+@pytest.mark.parametrize(
+    "repo",
+    [
+        lazy_fixture(repo_w_trunk_only_angular_commits.__name__),
+        *[
+            pytest.param(
+                lazy_fixture(repo_fixture_name),
+                marks=pytest.mark.comprehensive,
+            )
+            for repo_fixture_name in [
+                repo_w_no_tags_angular_commits.__name__,
+                repo_w_trunk_only_n_prereleases_angular_commits.__name__,
+                repo_w_github_flow_w_feature_release_channel_angular_commits.__name__,
+                repo_w_git_flow_angular_commits.__name__,
+                repo_w_git_flow_and_release_channels_angular_commits.__name__,
+            ]
+        ],
+    ],
+)
+@pytest.mark.order("last")
+def test_release_history_from_release_tag(
+    repo: Repo, default_angular_parser: AngularCommitParser
+):
+    translator = VersionTranslator()
+    full_release_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_angular_parser,
+    )
+
+    for version, expected_release in full_release_history.released.items():
+        release_history = ReleaseHistory.from_release_tag(
+            repo=repo,
+            version=version,
+            translator=translator,
+            commit_parser=default_angular_parser,
+        )
+
+        assert release_history.unreleased == {}
+        assert full_release_history.released.keys() == release_history.released.keys()
+
+        actual_release = release_history.released[version]
+        assert expected_release["tagged_date"] == actual_release["tagged_date"]
+        assert {
+            commit_type: [res.commit.hexsha for res in results]
+            for commit_type, results in expected_release["elements"].items()
+        } == {
+            commit_type: [res.commit.hexsha for res in results]
+            for commit_type, results in actual_release["elements"].items()
+        }
+
+        # Only the requested release is parsed
+        assert not any(
+            release["elements"]
+            for other_version, release in release_history.released.items()
+            if other_version != version
+        )
+
+
+@pytest.mark.usefixtures(repo_w_trunk_only_angular_commits.__name__)
+def test_release_history_from_release_tag_without_tag(
+    repo_w_trunk_only_angular_commits: Repo,
+    default_angular_parser: AngularCommitParser,
+):
+    version = Version.parse("100.10.1")
+
+    release_history = ReleaseHistory.from_release_tag(
+        repo=repo_w_trunk_only_angular_commits,
+        version=version,
+        translator=VersionTranslator(),
+        commit_parser=default_angular_parser,
+    )
+
+    assert version not in release_history.released
+    assert len(repo_w_trunk_only_angular_commits.tags) == len(release_history.released)
+
+
+def test_release_history_with_path_filters(
+    tmp_path: Path, default_angular_parser: AngularCommitParser
+):
+    with Repo.init(tmp_path) as repo:
+        for message, filename in (
+            ("feat: add a", "a.py"),
+            ("feat: add b", "b.py"),
+            ("chore(release): 1.0.0", "CHANGELOG.md"),
+        ):
+            add_text_to_file(repo, filename)
+            repo.index.commit(message)
+        # the release commit doesn't touch the filtered paths, but is still found
+        repo.create_tag("v1.0.0")
+        add_text_to_file(repo, "a.py")
+        repo.index.commit("fix: fix a")
+
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=VersionTranslator(),
+            commit_parser=default_angular_parser,
+            path_filters=("a.py",),
+        )
+
+    assert {
+        commit_type: [res.descriptions[0] for res in results]
+        for commit_type, results in release_history.unreleased.items()
+    } == {"bug fixes": ["fix a"]}
+    assert {
+        commit_type: [res.descriptions[0] for res in results]
+        for commit_type, results in release_history.released[Version.parse("1.0.0")][
+            "elements"
+        ].items()
+    } == {"features": ["add a"]}
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import semantic_release
+from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+from semantic_release.changelog.section_cache import ReleaseSectionCache
+from semantic_release.changelog.template import environment
+from semantic_release.cli.changelog_writer import render_default_changelog_file
+from semantic_release.cli.config import ChangelogOutputFormat
+from semantic_release.commit_parser import (
+    AngularCommitParser,
+    AngularParserOptions,
+    EmojiCommitParser,
+)
+from semantic_release.hvcs import Github
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.changelog.context import ChangelogContext
+    from semantic_release.changelog.release_history import ReleaseHistory
+
+
+@pytest.fixture
+def make_context(
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    changelog_md_file: Path,
+):
+    def _make_context(section_cache_dir: Path | None = None) -> ChangelogContext:
+        return make_changelog_context(
+            hvcs_client=Github(example_git_https_url),
+            release_history=artificial_release_history,
+            mode=ChangelogMode.INIT,
+            prev_changelog_file=changelog_md_file,
+            insertion_flag="",
+            mask_initial_release=True,
+            section_cache_dir=section_cache_dir,
+        )
+
+    return _make_context
+
+
+def test_section_cache_persists_sections(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+
+    ReleaseSectionCache(cache_dir=cache_dir).set("key", "section\r\ntext")
+
+    assert ReleaseSectionCache(cache_dir=cache_dir).get("key") == "section\r\ntext"
+    assert ReleaseSectionCache(cache_dir=cache_dir).get("missing") is None
+    assert [path.name for path in cache_dir.rglob("*.txt")] == ["key.txt"]
+
+
+def test_section_cache_prunes_other_namespaces_on_write(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    ReleaseSectionCache(cache_dir=cache_dir, namespace="1.0.0").set("old", "old")
+    cache_dir.joinpath("flat-layout.txt").write_text("older")
+
+    cache = ReleaseSectionCache(cache_dir=cache_dir, namespace="1.1.0")
+    assert cache.get("old") is None
+    # Reading alone leaves the cache as it is
+    assert len(list(cache_dir.iterdir())) == 2
+
+    cache.set("new", "new")
+    cache.set("newer", "newer")
+
+    assert sorted(path.name for path in cache_dir.rglob("*.txt")) == [
+        "new.txt",
+        "newer.txt",
+    ]
+    assert ReleaseSectionCache(cache_dir=cache_dir, namespace="1.1.0").get("new") == (
+        "new"
+    )
+
+
+def test_section_cache_namespaces_keys():
+    github_cache = ReleaseSectionCache(namespace="github https://github.com/a/b")
+    gitlab_cache = ReleaseSectionCache(namespace="gitlab https://gitlab.com/a/b")
+
+    assert github_cache.make_key("1.0.0") != gitlab_cache.make_key("1.0.0")
+    assert github_cache.make_key("a", "bc") != github_cache.make_key("ab", "c")
+
+
+def test_section_cache_namespace_covers_commit_parsing(
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    changelog_md_file: Path,
+):
+    def namespace(**kwargs: Any) -> str:
+        context = make_changelog_context(
+            hvcs_client=Github(example_git_https_url),
+            release_history=artificial_release_history,
+            mode=ChangelogMode.INIT,
+            prev_changelog_file=changelog_md_file,
+            insertion_flag="",
+            mask_initial_release=True,
+            **kwargs,
+        )
+        assert context.section_cache is not None
+        return context.section_cache.namespace
+
+    namespaces = [
+        namespace(),
+        namespace(commit_parser=AngularCommitParser()),
+        namespace(
+            commit_parser=AngularCommitParser(
+                AngularParserOptions(minor_tags=("feat", "perf"))
+            )
+        ),
+        namespace(commit_parser=EmojiCommitParser()),
+        namespace(exclude_commit_patterns=[re.compile(r"chore\(release\)")]),
+    ]
+
+    assert len(set(namespaces)) == len(namespaces)
+    assert all(semantic_release.__version__ in ns for ns in namespaces)
+
+
+@pytest.mark.parametrize(
+    "output_format",
+    [ChangelogOutputFormat.MARKDOWN, ChangelogOutputFormat.RESTRUCTURED_TEXT],
+)
+def test_default_changelog_reuses_cached_sections(
+    make_context,
+    artificial_release_history: ReleaseHistory,
+    output_format: ChangelogOutputFormat,
+    tmp_path: Path,
+):
+    cache_dir = tmp_path / "cache"
+
+    expected_changelog = render_default_changelog_file(
+        output_format=output_format,
+        changelog_context=make_context(),
+        changelog_style="angular",
+    )
+
+    actual_changelog = render_default_changelog_file(
+        output_format=output_format,
+        changelog_context=make_context(section_cache_dir=cache_dir),
+        changelog_style="angular",
+    )
+
+    section_files = list(cache_dir.rglob("*.txt"))
+
+    assert expected_changelog == actual_changelog
+    assert len(artificial_release_history.released) == len(section_files)
+
+    # Prove that the next run uses the stored sections rather than rendering them
+    for section_file in section_files:
+        section_file.write_text(
+            section_file.read_text().replace("Initial Release", "Cached Release")
+        )
+
+    cached_changelog = render_default_changelog_file(
+        output_format=output_format,
+        changelog_context=make_context(section_cache_dir=cache_dir),
+        changelog_style="angular",
+    )
+
+    assert "Cached Release" in cached_changelog
+    assert expected_changelog == cached_changelog.replace(
+        "Cached Release", "Initial Release"
+    )
+
+
+def test_cached_release_renders_body_without_cache(
+    artificial_release_history: ReleaseHistory,
+):
+    env = environment(autoescape=False)
+    template = env.from_string(
+        str.join(
+            "",
+            [
+                "{% for release in releases %}",
+                "{% cached_release release, loop.index %}",
+                "{{ release.version }};",
+                "{% endcached_release %}",
+                "{% endfor %}",
+            ],
+        )
+    )
+
+    expected_output = str.join(
+        "",
+        [f"{version};" for version in artificial_release_history.released],
+    )
+
+    assert expected_output == template.render(
+        releases=list(artificial_release_history.released.values())
+    )
+
+
+def test_cached_release_key_includes_extra_arguments(
+    make_context,
+    artificial_release_history: ReleaseHistory,
+):
+    env = make_context().bind_to_environment(environment(autoescape=False))
+    template = env.from_string(
+        "{% cached_release release, label %}{{ label }}{% endcached_release %}"
+    )
+    release = next(iter(artificial_release_history.released.values()))
+
+    assert template.render(release=release, label="first") == "first"
+    assert template.render(release=release, label="second") == "second"
+    assert template.render(release=release, label="first") == "first"
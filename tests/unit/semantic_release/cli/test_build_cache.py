@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Repo
+
+from semantic_release.cli.build_cache import BuildCache, release_tree_hash
+from semantic_release.cli.commands.version import build_distributions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+KEY = BuildCache.make_key("0" * 40, "python -m build", {"NEW_VERSION": "1.0.0"})
+
+
+@pytest.fixture
+def build_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # dist_glob_patterns are relative to the working directory, like the build
+    build_dir = tmp_path / "project"
+    build_dir.mkdir()
+    monkeypatch.chdir(build_dir)
+    return build_dir
+
+
+def write_dists(build_dir: Path, *names: str) -> None:
+    (build_dir / "dist").mkdir(exist_ok=True)
+    for name in names:
+        (build_dir / "dist" / name).write_text(f"contents of {name}")
+
+
+def test_release_tree_hash(tmp_path: Path):
+    with Repo.init(tmp_path) as repo:
+        (tmp_path / "pyproject.toml").write_text('version = "1.0.0"\n')
+        repo.index.add(["pyproject.toml"])
+        repo.index.commit("initial commit")
+
+        (tmp_path / "pyproject.toml").write_text('version = "1.1.0"\n')
+        (tmp_path / "CHANGELOG.md").write_text("# 1.1.0\n")
+        tree_hash = release_tree_hash(tmp_path, ["pyproject.toml", "CHANGELOG.md"])
+
+        # the index of the repository is left alone
+        assert repo.is_dirty()
+        assert repo.untracked_files == ["CHANGELOG.md"]
+
+        repo.index.add(["pyproject.toml", "CHANGELOG.md"])
+        assert tree_hash == repo.index.write_tree().hexsha
+        assert tree_hash != release_tree_hash(tmp_path, ["pyproject.toml"])
+
+
+@pytest.mark.parametrize(
+    "build_command, build_command_env",
+    [
+        ("python -m build --sdist", {"NEW_VERSION": "1.0.0"}),
+        ("python -m build", {"NEW_VERSION": "1.0.1"}),
+        ("python -m build", {"NEW_VERSION": "1.0.0", "CI": "true"}),
+        ("python -m build", {"NEW_VERSION": "1.0.0", "PATH": "/opt/venv/bin"}),
+    ],
+)
+def test_make_key_depends_on_build_inputs(
+    build_command: str, build_command_env: dict[str, str]
+):
+    assert BuildCache.make_key("0" * 40, build_command, build_command_env) != KEY
+
+
+def test_build_cache_round_trip(build_dir: Path, tmp_path: Path):
+    cache = BuildCache(tmp_path / "cache", KEY, ("dist/*.whl", "dist/*.tar.gz"))
+    write_dists(build_dir, "pkg-1.0.0.tar.gz", "pkg-1.0.0-py3-none-any.whl")
+
+    assert cache.restore() is None
+    cache.store()
+    (build_dir / "dist" / "pkg-1.0.0.tar.gz").unlink()
+    (build_dir / "dist" / "pkg-1.0.0-py3-none-any.whl").write_text("overwritten")
+
+    assert cache.restore() == [
+        "dist/pkg-1.0.0-py3-none-any.whl",
+        "dist/pkg-1.0.0.tar.gz",
+    ]
+    assert (build_dir / "dist" / "pkg-1.0.0.tar.gz").read_text() == (
+        "contents of pkg-1.0.0.tar.gz"
+    )
+    assert (build_dir / "dist" / "pkg-1.0.0-py3-none-any.whl").read_text() == (
+        "contents of pkg-1.0.0-py3-none-any.whl"
+    )
+    # nothing is left behind from writing the entry
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == [KEY]
+
+
+def test_build_distributions_restores_cached_build(build_dir: Path, tmp_path: Path):
+    cache = BuildCache(tmp_path / "cache", KEY, ("dist/*",))
+
+    def build(*_: object, **__: object) -> None:
+        write_dists(build_dir, "pkg-1.0.0-py3-none-any.whl")
+
+    with mock.patch(
+        "semantic_release.cli.commands.version.shell", side_effect=build
+    ) as mocked_shell:
+        build_distributions("python -m build", build_cache=cache)
+        (build_dir / "dist" / "pkg-1.0.0-py3-none-any.whl").unlink()
+        build_distributions("python -m build", build_cache=cache)
+
+    assert mocked_shell.call_count == 1
+    assert (build_dir / "dist" / "pkg-1.0.0-py3-none-any.whl").exists()
+
+
+def test_build_cache_stores_only_files_of_the_build(build_dir: Path, tmp_path: Path):
+    cache = BuildCache(tmp_path / "cache", KEY, ("dist/*",))
+    write_dists(build_dir, "pkg-0.9.0-py3-none-any.whl", "pkg-1.0.0.tar.gz")
+
+    def build(*_: object, **__: object) -> None:
+        # A new distribution, and one which is built again over a leftover
+        write_dists(build_dir, "pkg-1.0.0-py3-none-any.whl")
+        (build_dir / "dist" / "pkg-1.0.0.tar.gz").write_text("rebuilt")
+
+    with mock.patch("semantic_release.cli.commands.version.shell", side_effect=build):
+        build_distributions("python -m build", build_cache=cache)
+
+    for path in (build_dir / "dist").iterdir():
+        path.unlink()
+
+    assert cache.restore() == [
+        "dist/pkg-1.0.0-py3-none-any.whl",
+        "dist/pkg-1.0.0.tar.gz",
+    ]
+    assert not (build_dir / "dist" / "pkg-0.9.0-py3-none-any.whl").exists()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+from requests import HTTPError
+
+from semantic_release.cli.commands.changelog import (
+    backfill_release_notes,
+    diff_release_notes,
+)
+from semantic_release.hvcs import Bitbucket, Github
+
+
+def test_diff_release_notes():
+    release_notes = {
+        "v1.2.0": "## v1.2.0\n\n- new feature\n",
+        "v1.1.0": "## v1.1.0\n\n- fixed bug\n",
+        "v1.0.0": "## v1.0.0\n\n- initial release\n",
+    }
+    existing_releases = [
+        # Line endings and surrounding whitespace are not a difference
+        {"id": 11, "tag_name": "v1.1.0", "body": "## v1.1.0\r\n\r\n- fixed bug"},
+        {"id": 10, "tag_name": "v1.0.0", "body": "outdated notes"},
+        {"id": 9, "tag_name": "v0.9.0", "body": "not in the history"},
+    ]
+
+    missing_tags, outdated_release_ids = diff_release_notes(
+        release_notes, existing_releases
+    )
+
+    assert missing_tags == ["v1.2.0"]
+    assert outdated_release_ids == {"v1.0.0": 10}
+
+
+def test_backfill_release_notes_only_changes_outdated_releases():
+    client = Github("git@github.com:owner/repo.git")
+    release_notes = {
+        "v1.2.0-rc.1": ("new notes", True),
+        "v1.1.0": ("current notes", False),
+        "v1.0.0": ("new notes", False),
+    }
+    existing_releases = [
+        {"id": 11, "tag_name": "v1.1.0", "body": "current notes"},
+        {"id": 10, "tag_name": "v1.0.0", "body": "old notes"},
+    ]
+
+    with mock.patch.object(
+        client, client.list_releases.__name__, return_value=existing_releases
+    ), mock.patch.object(
+        client, client.create_release.__name__, return_value=12
+    ) as mock_create_release, mock.patch.object(
+        client, client.edit_release_notes.__name__, return_value=10
+    ) as mock_edit_release_notes, mock.patch.object(
+        client, client.create_or_update_release.__name__
+    ) as mock_create_or_update_release:
+        failures = asyncio.run(
+            backfill_release_notes(client, release_notes, max_concurrency=2)
+        )
+
+    assert failures == 0
+    mock_create_release.assert_called_once_with(
+        tag="v1.2.0-rc.1",
+        release_notes="new notes",
+        prerelease=True,
+        assets=None,
+        noop=False,
+    )
+    mock_edit_release_notes.assert_called_once_with(
+        release_id=10, release_notes="new notes"
+    )
+    mock_create_or_update_release.assert_not_called()
+
+
+def test_backfill_release_notes_counts_failures():
+    client = Github("git@github.com:owner/repo.git")
+    release_notes = {f"v1.{i}.0": (f"notes {i}", False) for i in range(4)}
+
+    def create_release(tag: str, **_: object) -> int:
+        if tag == "v1.2.0":
+            raise HTTPError("rate limited")
+        return 1
+
+    with mock.patch.object(
+        client, client.list_releases.__name__, return_value=[]
+    ), mock.patch.object(
+        client, client.create_release.__name__, side_effect=create_release
+    ) as mock_create_release:
+        failures = asyncio.run(backfill_release_notes(client, release_notes))
+
+    assert failures == 1
+    assert mock_create_release.call_count == 4
+
+
+def test_backfill_release_notes_noop():
+    client = Github("git@github.com:owner/repo.git")
+
+    with mock.patch.object(
+        client, client.list_releases.__name__, return_value=[]
+    ), mock.patch.object(client, client.create_release.__name__) as mock_create_release:
+        failures = asyncio.run(
+            backfill_release_notes(client, {"v1.0.0": ("notes", False)}, noop=True)
+        )
+
+    assert failures == 0
+    mock_create_release.assert_not_called()
+
+
+def test_backfill_release_notes_without_release_listing():
+    client = Bitbucket("git@bitbucket.org:owner/repo.git")
+
+    with mock.patch.object(
+        client, client.create_or_update_release.__name__, return_value=-1
+    ) as mock_create_or_update_release, pytest.warns(
+        UserWarning, match="list_releases is not supported"
+    ):
+        failures = asyncio.run(
+            backfill_release_notes(client, {"v1.0.0": ("notes", False)})
+        )
+
+    assert failures == 0
+    mock_create_or_update_release.assert_called_once_with(
+        tag="v1.0.0", release_notes="notes", prerelease=False
+    )
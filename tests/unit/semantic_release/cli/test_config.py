@@ -6,6 +6,7 @@ from unittest import mock
 
 import pytest
 import tomlkit
+from git import Repo
 from pydantic import RootModel, ValidationError
 
 import semantic_release
@@ -19,13 +20,20 @@ from semantic_release.cli.config import (
     RuntimeContext,
 )
 from semantic_release.cli.util import load_raw_config_file
-from semantic_release.commit_parser.angular import AngularParserOptions
+from semantic_release.commit_parser.angular import (
+    AngularCommitParser,
+    AngularParserOptions,
+)
 from semantic_release.commit_parser.emoji import EmojiParserOptions
 from semantic_release.commit_parser.scipy import ScipyParserOptions
 from semantic_release.commit_parser.tag import TagParserOptions
 from semantic_release.const import DEFAULT_COMMIT_AUTHOR
 from semantic_release.enums import LevelBump
-from semantic_release.errors import ParserLoadError
+from semantic_release.errors import InvalidConfiguration, ParserLoadError
+from semantic_release.hvcs import Gitlab
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+from semantic_release.version.version import Version
 
 from tests.fixtures.repos import repo_w_no_tags_angular_commits
 from tests.util import (
@@ -33,6 +41,7 @@ from tests.util import (
     CustomParserWithNoOpts,
     CustomParserWithOpts,
     IncompleteCustomParser,
+    add_text_to_file,
 )
 
 if TYPE_CHECKING:
@@ -222,6 +231,192 @@ def test_load_valid_runtime_config(
     assert runtime_ctx
 
 
+def test_load_runtime_config_defers_version_declaration_globs(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        "tool.semantic_release.version_variables",
+        ["packages/**/__about__.py:__version__"],
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.version_toml",
+        ["packages/*/pyproject.toml:project.version"],
+    )
+
+    with mock.patch(
+        "semantic_release.version.declaration.find_declaration_files"
+    ) as mock_find_files:
+        runtime_ctx = RuntimeContext.from_raw_config(
+            RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+            global_cli_options=GlobalCommandLineOptions(),
+        )
+
+    # The files are only listed when the version is written
+    mock_find_files.assert_not_called()
+    assert [
+        (decl.pattern, decl.needle) for decl in runtime_ctx.version_declaration_globs
+    ] == [
+        ("packages/*/pyproject.toml", "version"),
+        ("packages/**/__about__.py", "__version__"),
+    ]
+    assert all(
+        not str(decl.path).startswith("packages")
+        for decl in runtime_ctx.version_declarations
+    )
+
+
+def test_load_runtime_config_literal_declaration_path_with_brackets(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    version_file = example_project_dir / "pkg[extra]" / "version.py"
+    version_file.parent.mkdir()
+    version_file.write_text('__version__ = "0.0.0"\n')
+    update_pyproject_toml(
+        "tool.semantic_release.version_variables",
+        ["pkg[extra]/version.py:__version__"],
+    )
+
+    runtime_ctx = RuntimeContext.from_raw_config(
+        RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+        global_cli_options=GlobalCommandLineOptions(),
+    )
+
+    assert not runtime_ctx.version_declaration_globs
+    assert version_file.resolve() in [
+        decl.path.resolve() for decl in runtime_ctx.version_declarations
+    ]
+
+
+def test_load_runtime_config_for_project(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    about_file = example_project_dir / "packages" / "a" / "__about__.py"
+    about_file.parent.mkdir(parents=True)
+    about_file.write_text('__version__ = "0.0.0"\n')
+
+    update_pyproject_toml(
+        "tool.semantic_release.projects",
+        {
+            "a": {
+                "path": "packages/a",
+                "changelog_file": "packages/a/CHANGELOG.md",
+                "version_variables": ["packages/a/__about__.py:__version__"],
+            },
+            "b": {"path": "packages/b", "tag_format": "b/{version}"},
+        },
+    )
+    raw = RawConfig.model_validate(load_raw_config_file(example_pyproject_toml))
+
+    runtime_ctx_a = RuntimeContext.from_raw_config(
+        raw, global_cli_options=GlobalCommandLineOptions(project="a")
+    )
+    runtime_ctx_b = RuntimeContext.from_raw_config(
+        raw, global_cli_options=GlobalCommandLineOptions(project="b")
+    )
+
+    assert runtime_ctx_a.path_filters == ("packages/a",)
+    assert runtime_ctx_a.version_translator.tag_format == "a-v{version}"
+    assert (
+        runtime_ctx_a.changelog_file
+        == (example_project_dir / "packages" / "a" / "CHANGELOG.md").resolve()
+    )
+    assert [str(decl.path) for decl in runtime_ctx_a.version_declarations] == [
+        "packages/a/__about__.py"
+    ]
+    assert runtime_ctx_b.path_filters == ("packages/b",)
+    assert runtime_ctx_b.version_translator.tag_format == "b/{version}"
+    assert not runtime_ctx_b.version_declarations
+
+    with pytest.raises(InvalidConfiguration, match="Unknown project 'c'"):
+        RuntimeContext.from_raw_config(
+            raw, global_cli_options=GlobalCommandLineOptions(project="c")
+        )
+
+
+def test_next_version_of_projects_on_merge_history(tmp_path: Path):
+    parser = AngularCommitParser()
+
+    with Repo.init(tmp_path) as repo:
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "semantic-release")
+            config.set_value("user", "email", "semantic-release@example.com")
+
+        for filename in ("packages/a/a.py", "packages/b/b.py"):
+            (tmp_path / filename).parent.mkdir(parents=True)
+            add_text_to_file(repo, filename)
+        repo.git.commit("-m", "chore: initial commit")
+        repo.create_tag("a-v1.0.0")
+        repo.create_tag("b/1.0.0")
+        main_branch = repo.active_branch.name
+
+        repo.git.checkout("-b", "feature")
+        add_text_to_file(repo, "packages/a/a.py")
+        repo.git.commit("-m", "feat: add to a")
+        repo.git.checkout(main_branch)
+        add_text_to_file(repo, "packages/b/b.py")
+        repo.git.commit("-m", "fix: fix b")
+        repo.git.merge("--no-ff", "feature", "-m", "Merge branch 'feature'")
+
+        raw = RawConfig(
+            repo_dir=tmp_path,
+            projects={
+                "a": {"path": "packages/a"},
+                "b": {"path": "packages/b", "tag_format": "b/{version}"},
+            },
+        )
+
+        def project_next_version(name: str) -> Version:
+            project_raw = raw.for_project(name)
+            return next_version(
+                repo,
+                VersionTranslator(tag_format=project_raw.tag_format),
+                parser,
+                path_filters=project_raw.path_filters,
+            )
+
+        assert Version.parse("1.1.0") == project_next_version("a")
+        assert Version.parse("1.0.1") == project_next_version("b")
+
+
+@pytest.mark.parametrize("use_python_gitlab", [True, False])
+def test_load_runtime_config_gitlab_backend(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+    use_python_gitlab: bool,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        "tool.semantic_release.remote",
+        {"type": "gitlab", "use_python_gitlab": use_python_gitlab},
+    )
+
+    runtime_ctx = RuntimeContext.from_raw_config(
+        RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+        global_cli_options=GlobalCommandLineOptions(),
+    )
+
+    assert isinstance(runtime_ctx.hvcs_client, Gitlab)
+    assert runtime_ctx.hvcs_client.use_python_gitlab is use_python_gitlab
+
+
 @pytest.mark.parametrize(
     "commit_parser",
     [
@@ -307,6 +502,42 @@ def test_branch_config_with_invalid_regex(invalid_regex: str):
         )
 
 
+def test_raw_config_orders_build_commands():
+    raw = RawConfig.model_validate(
+        {
+            "build_commands": {
+                "docs": {"command": "make docs", "after": ["wheel"]},
+                "wheel": {"command": "python -m build --wheel", "after": ["sdist"]},
+                "sdist": {"command": "python -m build --sdist"},
+            }
+        }
+    )
+
+    assert list(raw.build_commands) == ["sdist", "wheel", "docs"]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "build_command": "python -m build",
+            "build_commands": {"sdist": {"command": "python -m build --sdist"}},
+        },
+        {"build_commands": {"wheel": {"command": "make", "after": ["sdist"]}}},
+        {
+            "build_commands": {
+                "sdist": {"command": "make sdist", "after": ["wheel"]},
+                "wheel": {"command": "make wheel", "after": ["sdist"]},
+            }
+        },
+        {"build_commands": {"sdist": {"command": ""}}},
+    ],
+)
+def test_raw_config_invalid_build_commands(config: dict[str, Any]):
+    with pytest.raises(ValidationError):
+        RawConfig.model_validate(config)
+
+
 @pytest.mark.parametrize(
     "output_format, insertion_flag",
     [
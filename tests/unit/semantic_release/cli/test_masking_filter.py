@@ -231,3 +231,89 @@ def test_non_strings_are_returned(default_masking_filter, obj):
     )
 
     assert default_masking_filter.mask(rec.getMessage()) == str(obj)
+
+
+def test_records_without_secrets_are_left_as_they_are(default_masking_filter):
+    default_masking_filter.add_mask_for(_secrets[0])
+    args = (15, object())
+    rec = LogRecord(
+        name=__name__,
+        level=logging.DEBUG,
+        pathname=__file__,
+        lineno=10,
+        args=args,
+        msg="commit %d is %s",
+        exc_info=None,
+    )
+
+    assert default_masking_filter.filter(rec)
+    assert rec.msg == "commit %d is %s"
+    assert rec.args is args
+
+
+def test_record_with_secret_is_formatted_and_masked(default_masking_filter):
+    default_masking_filter.add_mask_for(_secrets[0])
+    rec = LogRecord(
+        name=__name__,
+        level=logging.DEBUG,
+        pathname=__file__,
+        lineno=10,
+        args=(15, _secrets[0]),
+        msg="%d%% of %s",
+        exc_info=None,
+    )
+
+    assert default_masking_filter.filter(rec)
+    assert rec.getMessage() == f"15% of {default_masking_filter.REPLACE_STR}"
+
+
+def test_broken_record_args_are_masked(default_masking_filter):
+    default_masking_filter.add_mask_for(_secrets[0])
+    rec = LogRecord(
+        name=__name__,
+        level=logging.DEBUG,
+        pathname=__file__,
+        lineno=10,
+        args=(_secrets[0],),
+        msg="no placeholder for the argument",
+        exc_info=None,
+    )
+
+    assert default_masking_filter.filter(rec)
+    assert rec.args == (default_masking_filter.REPLACE_STR,)
+
+
+def test_masks_are_compiled_once_per_change(default_masking_filter, mocker):
+    compile_masks = mocker.spy(re, "compile")
+
+    default_masking_filter.add_mask_for("first-secret")
+    default_masking_filter.mask("the first-secret")
+    default_masking_filter.mask("the first-secret again")
+    default_masking_filter.add_mask_for("first-secret")
+    assert compile_masks.call_count == 1
+
+    default_masking_filter.add_mask_for("second-secret")
+    assert default_masking_filter.mask("first-secret second-secret") == " ".join(
+        default_masking_filter.REPLACE_STR for _ in range(2)
+    )
+    assert compile_masks.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "masked",
+    [
+        # referring to its own groups, which can't be merged with the other values
+        re.compile(r"(['\"])secret\w+\1"),
+        re.compile(r"(?P<quote>['\"])secret\w+(?P=quote)"),
+        re.compile(r"(?i)'SECRET\w+'"),
+        re.compile(r"'SECRET\w+'", re.IGNORECASE),
+    ],
+)
+def test_patterns_are_masked_alongside_other_values(masked):
+    masker = MaskingFilter(_use_named_masks=True)
+    masker.add_mask_for(masked, "pattern")
+    masker.add_mask_for("token", "literal")
+
+    assert masker.mask("'secret_value' and token") == (
+        "<'pattern' (value removed)> and <'literal' (value removed)>"
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from semantic_release.cli.pipeline import Pipeline
+
+
+def test_pipeline_runs_stages_after_their_dependencies():
+    order: list[str] = []
+
+    def stage(name: str, value: int):
+        def run() -> int:
+            order.append(name)
+            return value
+
+        return run
+
+    pipeline = Pipeline()
+    pipeline.add("changelog", stage("changelog", 1))
+    pipeline.add("stamp", stage("stamp", 2))
+    pipeline.add(
+        "build",
+        lambda: pipeline.results["changelog"] + pipeline.results["stamp"],
+        after=("changelog", "stamp"),
+    )
+
+    assert pipeline.run() == {"changelog": 1, "stamp": 2, "build": 3}
+    assert sorted(order) == ["changelog", "stamp"]
+
+
+def test_pipeline_runs_independent_stages_concurrently():
+    # Every stage waits for the others to start, which only returns if all of the
+    # stages are running at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    pipeline = Pipeline(max_workers=3)
+    for name in ("changelog", "stamp", "release_notes"):
+        pipeline.add(name, barrier.wait)
+
+    assert sorted(pipeline.run()) == ["changelog", "release_notes", "stamp"]
+
+
+def test_pipeline_sequential_runs_stages_in_order():
+    order: list[str] = []
+    pipeline = Pipeline(sequential=True)
+    for name in ("changelog", "stamp", "build", "release_notes"):
+        pipeline.add(name, lambda name=name: order.append(name))
+
+    pipeline.run()
+    assert order == ["changelog", "stamp", "build", "release_notes"]
+
+
+@pytest.mark.parametrize("sequential", (True, False))
+def test_pipeline_skips_only_the_dependents_of_a_failed_stage(sequential: bool):
+    ran: list[str] = []
+
+    def fail() -> None:
+        raise RuntimeError("changelog failed")
+
+    pipeline = Pipeline(sequential=sequential)
+    pipeline.add("changelog", fail)
+    pipeline.add("release_notes", lambda: ran.append("release_notes"))
+    pipeline.add("stamp", lambda: ran.append("stamp"), after=("changelog",))
+    pipeline.add("build", lambda: ran.append("build"), after=("stamp",))
+
+    with pytest.raises(RuntimeError, match="changelog failed"):
+        pipeline.run()
+
+    assert ran == ["release_notes"]
+    assert sorted(pipeline.results) == ["release_notes"]
+
+
+@pytest.mark.parametrize(
+    "name, after",
+    [("stamp", ()), ("build", ("changelog",))],
+)
+def test_pipeline_add_rejects_invalid_stages(name: str, after: tuple[str, ...]):
+    pipeline = Pipeline().add("stamp", lambda: None)
+
+    with pytest.raises(ValueError):
+        pipeline.add(name, lambda: None, after=after)
@@ -1,6 +1,28 @@
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+from unittest import mock
+
 import pytest
+from git import Repo
 
-from semantic_release.cli.commands.version import is_forced_prerelease
+from semantic_release.cli.commands.version import (
+    apply_version_to_source_files,
+    build_distributions,
+    is_forced_prerelease,
+    run_build_commands,
+)
+from semantic_release.cli.config import BuildCommandConfig
+from semantic_release.errors import BuildDistributionsError
+from semantic_release.version.declaration import (
+    GlobVersionDeclaration,
+    PatternVersionDeclaration,
+)
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -21,3 +43,98 @@ from semantic_release.cli.commands.version import is_forced_prerelease
 )
 def test_is_forced_prerelease(force_prerelease, force_level, prerelease, expected):
     assert is_forced_prerelease(force_prerelease, force_level, prerelease) == expected
+
+
+def run_build(command: str, **_: object) -> subprocess.CompletedProcess:
+    if command.startswith("fail"):
+        raise subprocess.CalledProcessError(1, command, output=f"output of {command}")
+    return subprocess.CompletedProcess(command, 0, stdout=f"output of {command}\n")
+
+
+def test_run_build_commands_in_order_of_dependencies():
+    build_commands = {
+        "sdist": BuildCommandConfig(command="make sdist"),
+        "wheel": BuildCommandConfig(command="make wheel"),
+        "docs": BuildCommandConfig(command="make docs", after=("sdist", "wheel")),
+    }
+
+    with mock.patch(
+        "semantic_release.cli.commands.version.shell", side_effect=run_build
+    ) as mocked_shell:
+        run_build_commands(build_commands, {"NEW_VERSION": "1.0.0"}, jobs=2)
+
+    assert mocked_shell.call_args_list[-1] == mock.call(
+        "make docs", env={"NEW_VERSION": "1.0.0"}, check=True, capture_output=True
+    )
+    assert mocked_shell.call_count == 3
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_run_build_commands_raises_the_logs_of_failed_commands(jobs: int):
+    build_commands = {
+        "sdist": BuildCommandConfig(command="fail sdist"),
+        "wheel": BuildCommandConfig(command="make wheel"),
+        "docs": BuildCommandConfig(command="make docs", after=("sdist",)),
+    }
+
+    with mock.patch(
+        "semantic_release.cli.commands.version.shell", side_effect=run_build
+    ) as mocked_shell, pytest.raises(BuildDistributionsError) as excinfo:
+        run_build_commands(build_commands, {}, jobs=jobs)
+
+    assert "Build command 'sdist' failed:\noutput of fail sdist" in str(excinfo.value)
+    # Only the commands which depend on the failed command are skipped
+    assert sorted(call.args[0] for call in mocked_shell.call_args_list) == [
+        "fail sdist",
+        "make wheel",
+    ]
+
+
+def test_build_distributions_injects_new_version(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PATH", "/usr/bin")
+
+    with mock.patch(
+        "semantic_release.cli.commands.version.shell", side_effect=run_build
+    ) as mocked_shell:
+        build_distributions(
+            None,
+            build_command_env={"NEW_VERSION": "1.0.0"},
+            build_commands={"sdist": BuildCommandConfig(command="make sdist")},
+        )
+
+    env = mocked_shell.call_args.kwargs["env"]
+    assert env["NEW_VERSION"] == "1.0.0"
+    assert env["PATH"] == "/usr/bin"
+
+
+def test_apply_version_expands_globs_relative_to_current_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    project_dir = tmp_path / "project"
+    for name in ("__init__.py", "packages/a/__about__.py", "packages/b/__about__.py"):
+        (project_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (project_dir / name).write_text('__version__ = "0.1.0"\n')
+    Repo.init(tmp_path).close()
+    monkeypatch.chdir(project_dir)
+
+    paths = apply_version_to_source_files(
+        repo_dir=tmp_path,
+        version_declarations=[
+            PatternVersionDeclaration.from_variable("__init__.py", "__version__")
+        ],
+        version_declaration_globs=[
+            GlobVersionDeclaration.from_variable(
+                "packages/*/__about__.py", "__version__"
+            )
+        ],
+        version=Version(0, 2, 0),
+    )
+
+    assert sorted(paths) == [
+        "project/__init__.py",
+        "project/packages/a/__about__.py",
+        "project/packages/b/__about__.py",
+    ]
+    assert all(
+        (tmp_path / path).read_text() == '__version__ = "0.2.0"\n' for path in paths
+    )
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import closing
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.hvcs import AsyncRemoteHvcs, Bitbucket, Github
+
+from tests.fixtures.fake_forge import FakeForge
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_async_client_sends_independent_requests_concurrently():
+    tags = [f"v1.{i}.0" for i in range(4)]
+
+    async def create_releases(client: Github) -> list[int | str]:
+        async with AsyncRemoteHvcs(client, max_connections=len(tags)) as hvcs:
+            return await asyncio.gather(
+                *(hvcs.create_or_update_release(tag, f"notes {tag}") for tag in tags)
+            )
+
+    with FakeForge(latency=0.2) as forge:
+        release_ids = asyncio.run(create_releases(forge.client(Github)))
+
+    assert len(tags) == len(set(release_ids))
+    assert sorted(tags) == sorted(
+        release["tag_name"] for release in forge.releases["github"].values()
+    )
+    assert len(tags) == len(forge.requests_to("POST"))
+    assert len(tags) == forge.max_in_flight
+
+
+def test_async_client_bounds_requests_in_flight():
+    max_connections = 2
+    tags = [f"v1.{i}.0" for i in range(6)]
+
+    async def get_release_ids(client: Github) -> list[int | None]:
+        async with AsyncRemoteHvcs(client, max_connections=max_connections) as hvcs:
+            return await asyncio.gather(
+                *(hvcs.get_release_id_by_tag(tag) for tag in tags)
+            )
+
+    with FakeForge() as forge:
+        client = forge.client(Github)
+        created_ids = [client.create_release(tag, "notes") for tag in tags]
+
+        forge.latency = 0.05
+        release_ids = asyncio.run(get_release_ids(forge.client(Github)))
+
+    assert created_ids == release_ids
+    assert max_connections == forge.max_in_flight
+
+
+def test_async_client_shares_connection_pool_of_client():
+    client = Github("git@github.com:owner/repo.git", upload_concurrency=2)
+    adapter = client.session.get_adapter("https://api.github.com")
+    original_pool_manager = adapter.poolmanager
+
+    with mock.patch.object(original_pool_manager, "clear") as mock_clear:
+        async_client = AsyncRemoteHvcs(client, max_connections=8)
+
+    # The connections of the replaced pool manager are closed
+    mock_clear.assert_called_once_with()
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+
+    async_client.close()
+
+    # The session of the client is left as it was
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 10
+
+
+def test_async_client_release_lookup_not_supported():
+    client = Bitbucket("git@bitbucket.org:owner/repo.git")
+
+    async def get_release_id() -> int | None:
+        async with AsyncRemoteHvcs(client) as hvcs:
+            return await hvcs.get_release_id_by_tag("v1.0.0")
+
+    with pytest.warns(UserWarning, match="not supported by Bitbucket"):
+        assert asyncio.run(get_release_id()) is None
+
+
+def test_async_client_shares_connection_pool_behind_response_cache(tmp_path: Path):
+    client = Github("git@github.com:owner/repo.git", http_cache_dir=tmp_path)
+
+    adapter = client.session.get_adapter("https://api.github.com")
+
+    with closing(AsyncRemoteHvcs(client, max_connections=12)):
+        assert tmp_path == adapter.cache.cache_dir
+        assert adapter.inner_adapter.poolmanager.connection_pool_kw["maxsize"] == 12
@@ -0,0 +1,186 @@
+"""Tests of the remote VCS clients against the local stand-in forge server"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.errors import IncompleteReleaseError
+from semantic_release.hvcs import Gitea, Github, Gitlab
+
+from tests.fixtures.fake_forge import FakeForge
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+
+
+A_TAG = "v1.2.3"
+
+
+def make_dists(directory: Path, *names: str, size: int = 32) -> list[str]:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_bytes(name.encode().ljust(size, b"\0"))
+    return [str(directory / name) for name in names]
+
+
+@pytest.mark.parametrize("hvcs_class", (Github, Gitea, Gitlab))
+def test_release_round_trip(
+    fake_forge: FakeForge, hvcs_class: type[RemoteHvcsBase], tmp_path: Path
+):
+    client = fake_forge.client(hvcs_class)
+    dist_glob = str(tmp_path / "dist" / "*")
+    make_dists(tmp_path / "dist", "pkg-1.2.3.tar.gz", "pkg-1.2.3-py3-none-any.whl")
+
+    client.create_or_update_release(A_TAG, "first notes")
+    client.create_or_update_release(A_TAG, "second notes")
+    first_upload = client.upload_dists(A_TAG, dist_glob)
+    # re-running a publish does not upload the same files again
+    second_upload = client.upload_dists(A_TAG, dist_glob)
+
+    assert first_upload == 2
+    assert second_upload == 0
+    assert len(fake_forge.releases[hvcs_class.__name__.lower()]) == 1
+
+
+@pytest.mark.parametrize("hvcs_class", (Github, Gitea))
+def test_upload_dists_replaces_changed_assets(
+    fake_forge: FakeForge, hvcs_class: type[Github | Gitea], tmp_path: Path
+):
+    api = hvcs_class.__name__.lower()
+    client = fake_forge.client(hvcs_class)
+    dist_glob = str(tmp_path / "*")
+    make_dists(tmp_path, "a.whl", "b.whl")
+    client.create_release(A_TAG, "notes")
+    client.upload_dists(A_TAG, dist_glob)
+
+    make_dists(tmp_path, "b.whl", size=64)
+    num_uploads = client.upload_dists(A_TAG, dist_glob)
+
+    release = fake_forge.release_by_tag(api, A_TAG)
+    assert release is not None
+    assert num_uploads == 1
+    assert {asset["name"]: asset["size"] for asset in release["assets"]} == {
+        "a.whl": 32,
+        "b.whl": 64,
+    }
+
+
+@pytest.mark.parametrize("hvcs_class", (Github, Gitea))
+def test_failed_replacement_keeps_existing_asset(
+    fake_forge: FakeForge, hvcs_class: type[Github | Gitea], tmp_path: Path
+):
+    api = hvcs_class.__name__.lower()
+    client = fake_forge.client(hvcs_class)
+    dist_glob = str(tmp_path / "*")
+    make_dists(tmp_path, "a.whl")
+    client.create_release(A_TAG, "notes")
+    client.upload_dists(A_TAG, dist_glob)
+
+    make_dists(tmp_path, "a.whl", size=64)
+    fake_forge.inject_failure(502, method="POST", path="/assets$")
+    num_uploads = client.upload_dists(A_TAG, dist_glob)
+
+    release = fake_forge.release_by_tag(api, A_TAG)
+    assert release is not None
+    assert num_uploads == 0
+    assert not fake_forge.requests_to("DELETE")
+    assert [
+        {"name": asset["name"], "size": asset["size"]} for asset in release["assets"]
+    ] == [{"name": "a.whl", "size": 32}]
+
+
+def test_github_release_assets(fake_forge: FakeForge, tmp_path: Path):
+    client = fake_forge.client(Github, upload_concurrency=2)
+    assets = make_dists(tmp_path, "a.whl", "b.whl", size=100)
+
+    client.create_release(A_TAG, "notes", assets=assets)
+
+    release = fake_forge.release_by_tag("github", A_TAG)
+    assert release is not None
+    assert sorted(asset["name"] for asset in release["assets"]) == ["a.whl", "b.whl"]
+    assert {asset["size"] for asset in release["assets"]} == {100}
+
+
+def test_gitea_multipart_upload_is_unpacked(fake_forge: FakeForge, tmp_path: Path):
+    client = fake_forge.client(Gitea)
+    make_dists(tmp_path, "pkg.whl", size=64)
+
+    client.create_release(A_TAG, "notes")
+    assert client.upload_dists(A_TAG, str(tmp_path / "*.whl")) == 1
+
+    release = fake_forge.release_by_tag("gitea", A_TAG)
+    assert release is not None
+    assert release["assets"][0]["size"] == 64
+
+
+def test_gitlab_assets_are_linked_packages(fake_forge: FakeForge, tmp_path: Path):
+    client = fake_forge.client(Gitlab)
+    assets = make_dists(tmp_path, "pkg.whl", size=64)
+
+    client.create_release(A_TAG, "notes", assets=assets)
+
+    links = fake_forge.releases["gitlab"][A_TAG]["assets"]["links"]
+    assert [link["name"] for link in links] == ["pkg.whl"]
+    assert fake_forge.packages == {f"repo/{A_TAG}/pkg.whl": 64}
+
+
+def test_injected_upload_failure_fails_release(fake_forge: FakeForge, tmp_path: Path):
+    client = fake_forge.client(Github)
+    assets = make_dists(tmp_path, "a.whl", "b.whl")
+    fake_forge.inject_failure(502, method="POST", path="/api/uploads/")
+
+    with pytest.raises(IncompleteReleaseError):
+        client.create_release(A_TAG, "notes", assets=assets)
+
+    assert [r.status for r in fake_forge.requests_to("POST", "/assets$")] == [502, 201]
+
+
+@pytest.mark.parametrize("hvcs_class", (Github, Gitea, Gitlab))
+def test_rate_limited_requests_are_retried(
+    fake_forge: FakeForge, hvcs_class: type[RemoteHvcsBase]
+):
+    fake_forge.rate_limit = 2
+    fake_forge.rate_limit_window = 1.0
+    client = fake_forge.client(hvcs_class)
+    scheduler = client.rate_limit_scheduler
+    assert scheduler is not None
+    # keep the test quick, the forge resets its limit every second
+    scheduler.min_remaining = 0
+
+    release_ids = [
+        client.create_or_update_release(f"v1.0.{i}", "notes") for i in range(3)
+    ]
+
+    assert len(set(release_ids)) == 3
+    assert scheduler.metrics.rate_limited_responses >= 1
+    assert scheduler.metrics.retries >= 1
+    assert len(fake_forge.releases[hvcs_class.__name__.lower()]) == 3
+
+
+def test_uploads_are_concurrent_under_latency(tmp_path: Path):
+    assets = make_dists(tmp_path, *(f"pkg-{i}.whl" for i in range(4)))
+
+    with FakeForge(latency=0.2) as forge:
+        client = forge.client(Github, upload_concurrency=4)
+        client.create_release(A_TAG, "notes", assets=assets)
+
+    assert forge.max_in_flight == 4
+
+
+def test_bandwidth_cap_slows_uploads(tmp_path: Path):
+    assets = make_dists(tmp_path, "pkg.whl", size=20_000)
+
+    with FakeForge(bandwidth=100_000) as forge:
+        client = forge.client(Github)
+        release_id = client.create_release(A_TAG, "notes")
+
+        start = time.perf_counter()
+        client.upload_release_asset(release_id, assets[0])
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.2
@@ -13,6 +13,7 @@ import requests_mock
 from requests import HTTPError, Response, Session
 from requests.auth import _basic_auth_str
 
+from semantic_release.errors import IncompleteReleaseError
 from semantic_release.hvcs.gitea import Gitea
 from semantic_release.hvcs.token_auth import TokenAuth
 
@@ -343,6 +344,47 @@ def test_create_release_fails(
         assert expected_request_body == m.last_request.json()
 
 
+@pytest.mark.parametrize("upload_concurrency", (1, 4))
+@pytest.mark.parametrize("failing_assets", ([], ["dist/pkg-2.whl"]))
+def test_create_release_uploads_assets_concurrently(
+    default_gitea_client: Gitea,
+    upload_concurrency: int,
+    failing_assets: list[str],
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    assets = [f"dist/pkg-{i}.whl" for i in range(6)]
+    default_gitea_client.upload_concurrency = upload_concurrency
+
+    def upload_release_asset(release_id: int, file: str) -> bool:
+        assert mock_release_id == release_id
+        if file in failing_assets:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with requests_mock.Mocker(
+        session=default_gitea_client.session
+    ) as m, mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        m.register_uri("POST", gitea_api_matcher, json={"id": mock_release_id})
+
+        if failing_assets:
+            with pytest.raises(IncompleteReleaseError):
+                default_gitea_client.create_release(tag, RELEASE_NOTES, assets=assets)
+        else:
+            assert mock_release_id == default_gitea_client.create_release(
+                tag, RELEASE_NOTES, assets=assets
+            )
+
+        # Every asset is attempted even when one of the uploads fails
+        assert sorted(mock.call(mock_release_id, asset) for asset in assets) == sorted(
+            mock_upload_release_asset.call_args_list
+        )
+
+
 @pytest.mark.parametrize("token", (None, "super-token"))
 def test_should_create_release_using_token_or_netrc(
     default_gitea_client: Gitea,
@@ -501,6 +543,35 @@ def test_get_release_id_by_tag(
         assert expected_request_url == m.last_request.url
 
 
+def test_list_releases_follows_pagination(default_gitea_client: Gitea):
+    releases_url = "{api_url}/repos/{owner}/{repo_name}/releases".format(
+        api_url=default_gitea_client.api_url,
+        owner=default_gitea_client.owner,
+        repo_name=default_gitea_client.repo_name,
+    )
+    first_page = [{"id": i, "tag_name": f"v1.{i}.0", "body": ""} for i in range(3)]
+    last_page = [{"id": 3, "tag_name": "v0.1.0", "body": ""}]
+
+    with requests_mock.Mocker(session=default_gitea_client.session) as m:
+        m.register_uri(
+            "GET",
+            f"{releases_url}?limit=50",
+            complete_qs=True,
+            json=first_page,
+            headers={"Link": f'<{releases_url}?limit=50&page=2>; rel="next"'},
+        )
+        m.register_uri(
+            "GET", f"{releases_url}?limit=50&page=2", complete_qs=True, json=last_page
+        )
+
+        # Execute method under test
+        releases = default_gitea_client.list_releases()
+
+        # Evaluate (expected -> actual)
+        assert [*first_page, *last_page] == releases
+        assert len(m.request_history) == 2
+
+
 @pytest.mark.parametrize("status_code", [201])
 @pytest.mark.parametrize("mock_release_id", range(3))
 def test_edit_release_notes_succeeds(
@@ -711,9 +782,16 @@ def test_upload_release_asset_succeeds(
     )
     expected_changelog = example_changelog_md.read_bytes()
 
+    uploaded_bodies = []
+
+    def upload_callback(request, _context) -> dict[str, str]:
+        # The body is streamed from the file, so it must be read while it is open
+        uploaded_bodies.append(request.body.read())
+        return {"status": "ok"}
+
     with requests_mock.Mocker(session=default_gitea_client.session) as m:
         m.register_uri(
-            "POST", gitea_api_matcher, json={"status": "ok"}, status_code=status_code
+            "POST", gitea_api_matcher, json=upload_callback, status_code=status_code
         )
         result = default_gitea_client.upload_release_asset(
             release_id=mock_release_id,
@@ -727,7 +805,11 @@ def test_upload_release_asset_succeeds(
         assert expected_num_requests == len(m.request_history)
         assert expected_http_method == m.last_request.method
         assert expected_request_url == m.last_request.url
-        assert expected_changelog in m.last_request.body
+        assert m.last_request.headers["Content-Type"].startswith("multipart/form-data")
+        assert len(uploaded_bodies) == 1
+        assert str(len(uploaded_bodies[0])) == m.last_request.headers["Content-Length"]
+        assert b'name="attachment"' in uploaded_bodies[0]
+        assert expected_changelog in uploaded_bodies[0]
 
 
 @pytest.mark.parametrize("status_code", (400, 500, 503))
@@ -754,6 +836,69 @@ def test_upload_release_asset_fails(
             )
 
 
+@pytest.mark.parametrize("list_status_code", (200, 500))
+def test_upload_dists_skips_existing_assets(
+    default_gitea_client: Gitea,
+    tmp_path: Path,
+    list_status_code: int,
+):
+    tag = "v1.0.0"
+    release_id = 1
+    (tmp_path / "uploaded.whl").write_bytes(b"same")
+    (tmp_path / "changed.whl").write_bytes(b"changed content")
+    api_releases_url = "{api_url}/repos/{owner}/{repo_name}/releases".format(
+        api_url=default_gitea_client.api_url,
+        owner=default_gitea_client.owner,
+        repo_name=default_gitea_client.repo_name,
+    )
+    existing_assets = [
+        {"id": 10, "name": "uploaded.whl", "size": 4},
+        {"id": 11, "name": "changed.whl", "size": 4},
+    ]
+
+    with requests_mock.Mocker(session=default_gitea_client.session) as m:
+        m.register_uri("GET", f"{api_releases_url}/tags/{tag}", json={"id": release_id})
+        m.register_uri(
+            "GET",
+            f"{api_releases_url}/{release_id}/assets",
+            [
+                {"json": existing_assets, "status_code": list_status_code},
+                {
+                    "json": [
+                        *existing_assets,
+                        {"id": 12, "name": "changed.whl.uploading", "size": 15},
+                    ]
+                },
+            ],
+        )
+        m.register_uri("DELETE", gitea_api_matcher, status_code=204)
+        m.register_uri("PATCH", gitea_api_matcher, json={"status": "ok"})
+        m.register_uri(
+            "POST", f"{api_releases_url}/{release_id}/assets", json={"status": "ok"}
+        )
+
+        # Execute method under test
+        num_uploads = default_gitea_client.upload_dists(tag, str(tmp_path / "*.whl"))
+
+        deleted_urls = [req.url for req in m.request_history if req.method == "DELETE"]
+        renames = [
+            (req.url, req.json()) for req in m.request_history if req.method == "PATCH"
+        ]
+
+    if list_status_code == 200:
+        # Only the changed asset is replaced, by the one uploaded under a temporary name
+        assert num_uploads == 1
+        assert [f"{api_releases_url}/{release_id}/assets/11"] == deleted_urls
+        assert [
+            (f"{api_releases_url}/{release_id}/assets/12", {"name": "changed.whl"})
+        ] == renames
+    else:
+        # Without the list of assets every file is uploaded
+        assert num_uploads == 2
+        assert not deleted_urls
+        assert not renames
+
+
 # Note - mocking as the logic for uploading an asset
 # is covered by testing above, no point re-testing.
 def test_upload_dists_when_release_id_not_found(default_gitea_client: Gitea):
@@ -812,6 +957,10 @@ def test_upload_dists_when_release_id_found(
         default_gitea_client.get_release_id_by_tag.__name__,
         return_value=release_id,
     ) as mock_get_release_id_by_tag, mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.list_release_assets.__name__,
+        return_value=[],
+    ), mock.patch.object(
         default_gitea_client,
         default_gitea_client.upload_release_asset.__name__,
         side_effect=upload_statuses,
@@ -4,6 +4,7 @@ import fnmatch
 import glob
 import os
 import re
+from hashlib import sha256
 from typing import TYPE_CHECKING
 from unittest import mock
 from urllib.parse import urlencode
@@ -13,6 +14,7 @@ import requests_mock
 from requests import HTTPError, Response, Session
 from requests.auth import _basic_auth_str
 
+from semantic_release.errors import IncompleteReleaseError
 from semantic_release.hvcs.github import Github
 from semantic_release.hvcs.token_auth import TokenAuth
 
@@ -503,6 +505,47 @@ def test_create_release_fails(
         assert expected_request_body == m.last_request.json()
 
 
+@pytest.mark.parametrize("upload_concurrency", (1, 4))
+@pytest.mark.parametrize("failing_assets", ([], ["dist/pkg-2.whl"]))
+def test_create_release_uploads_assets_concurrently(
+    default_gh_client: Github,
+    upload_concurrency: int,
+    failing_assets: list[str],
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    assets = [f"dist/pkg-{i}.whl" for i in range(6)]
+    default_gh_client.upload_concurrency = upload_concurrency
+
+    def upload_release_asset(release_id: int, file: str) -> bool:
+        assert mock_release_id == release_id
+        if file in failing_assets:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with requests_mock.Mocker(
+        session=default_gh_client.session
+    ) as m, mock.patch.object(
+        default_gh_client,
+        default_gh_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        m.register_uri("POST", github_api_matcher, json={"id": mock_release_id})
+
+        if failing_assets:
+            with pytest.raises(IncompleteReleaseError):
+                default_gh_client.create_release(tag, RELEASE_NOTES, assets=assets)
+        else:
+            assert mock_release_id == default_gh_client.create_release(
+                tag, RELEASE_NOTES, assets=assets
+            )
+
+        # Every asset is attempted even when one of the uploads fails
+        assert sorted(mock.call(mock_release_id, asset) for asset in assets) == sorted(
+            mock_upload_release_asset.call_args_list
+        )
+
+
 @pytest.mark.parametrize("token", (None, "super-token"))
 def test_should_create_release_using_token_or_netrc(
     default_gh_client: Github,
@@ -621,6 +664,42 @@ def test_request_has_no_auth_header_if_no_token_or_netrc():
             assert "Authorization" not in m.last_request.headers
 
 
+def test_list_releases_follows_pagination(default_gh_client: Github):
+    releases_url = "{api_url}/repos/{owner}/{repo_name}/releases".format(
+        api_url=default_gh_client.api_url,
+        owner=default_gh_client.owner,
+        repo_name=default_gh_client.repo_name,
+    )
+    first_page = [{"id": i, "tag_name": f"v1.{i}.0", "body": ""} for i in range(3)]
+    last_page = [{"id": 3, "tag_name": "v0.1.0", "body": ""}]
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.register_uri(
+            "GET",
+            f"{releases_url}?per_page=100",
+            complete_qs=True,
+            json=first_page,
+            headers={"Link": f'<{releases_url}?per_page=100&page=2>; rel="next"'},
+        )
+        m.register_uri(
+            "GET",
+            f"{releases_url}?per_page=100&page=2",
+            complete_qs=True,
+            json=last_page,
+        )
+
+        # Execute method under test
+        releases = default_gh_client.list_releases()
+
+        # Evaluate (expected -> actual)
+        assert [*first_page, *last_page] == releases
+        assert len(m.request_history) == 2
+
+        # The listed releases are remembered for subsequent lookups by tag
+        assert default_gh_client.get_release_id_by_tag("v0.1.0") == 3
+        assert len(m.request_history) == 2
+
+
 @pytest.mark.parametrize("status_code", [201])
 @pytest.mark.parametrize("mock_release_id", range(3))
 def test_edit_release_notes_succeeds(
@@ -928,12 +1007,19 @@ def test_upload_release_asset_succeeds(
         "upload_url": release_upload_url + "{?name,label}",
     }
 
+    uploaded_bodies = []
+
+    def upload_callback(request, _context) -> dict[str, str]:
+        # The body is streamed from the file, so it must be read while it is open
+        uploaded_bodies.append(request.body.read())
+        return {"status": "ok"}
+
     with requests_mock.Mocker(session=default_gh_client.session) as m:
         # mock the responses
         m.register_uri(
             "POST",
             github_upload_matcher,
-            json={"status": "ok"},
+            json=upload_callback,
             status_code=status_code,
         )
         m.register_uri(
@@ -957,7 +1043,8 @@ def test_upload_release_asset_succeeds(
         assert expected_retrieve_upload_url_method == get_req.method
         assert expected_upload_http_method == post_req.method
         assert expected_upload_url == post_req.url
-        assert expected_changelog == post_req.body
+        assert str(len(expected_changelog)) == post_req.headers["Content-Length"]
+        assert [expected_changelog] == uploaded_bodies
 
 
 @pytest.mark.parametrize("status_code", (400, 404, 429, 500, 503))
@@ -1001,6 +1088,245 @@ def test_upload_release_asset_fails(
             )
 
 
+@pytest.mark.parametrize("upload_concurrency", (1, 4))
+def test_create_release_reuses_release_upload_url(
+    default_gh_client: Github,
+    tmp_path: Path,
+    upload_concurrency: int,
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    assets = [tmp_path / f"pkg-{i}.whl" for i in range(3)]
+    for asset in assets:
+        asset.write_bytes(b"dist")
+
+    release_upload_url = f"{github_upload_url}/repos/releases/{mock_release_id}/assets"
+    default_gh_client.upload_concurrency = upload_concurrency
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.register_uri(
+            "POST",
+            github_api_matcher,
+            json={
+                "id": mock_release_id,
+                "tag_name": tag,
+                "upload_url": release_upload_url + "{?name,label}",
+            },
+        )
+        m.register_uri("POST", github_upload_matcher, json={"status": "ok"})
+
+        # Execute method under test
+        default_gh_client.create_release(
+            tag, RELEASE_NOTES, assets=list(map(str, assets))
+        )
+
+        # Evaluate (expected -> actual)
+        # 1 request to create the release and then only 1 per asset
+        assert len(assets) + 1 == len(m.request_history)
+        assert list({req.method for req in m.request_history}) == ["POST"]
+        assert sorted(
+            f"{release_upload_url}?{urlencode({'name': asset.name})}"
+            for asset in assets
+        ) == sorted(req.url for req in m.request_history[1:])
+
+
+def test_upload_dists_reuses_release_metadata(
+    default_gh_client: Github,
+    tmp_path: Path,
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    dists = [tmp_path / f"pkg-{i}.whl" for i in range(3)]
+    for dist in dists:
+        dist.write_bytes(b"dist")
+
+    release_upload_url = f"{github_upload_url}/repos/releases/{mock_release_id}/assets"
+    releases_url = "{api_url}/repos/{owner}/{repo_name}/releases".format(
+        api_url=default_gh_client.api_url,
+        owner=default_gh_client.owner,
+        repo_name=default_gh_client.repo_name,
+    )
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.register_uri(
+            "GET",
+            f"{releases_url}/tags/{tag}",
+            json={
+                "id": mock_release_id,
+                "tag_name": tag,
+                "upload_url": release_upload_url + "{?name,label}",
+            },
+        )
+        m.register_uri("GET", f"{releases_url}/{mock_release_id}/assets", json=[])
+        m.register_uri("POST", github_upload_matcher, json={"status": "ok"})
+
+        # Execute method under test
+        num_uploads = default_gh_client.upload_dists(tag, str(tmp_path / "*.whl"))
+
+        # Evaluate (expected -> actual)
+        # 1 request to find the release, 1 to list its assets and then only 1 per
+        # distribution
+        assert len(dists) == num_uploads
+        assert len(dists) + 2 == len(m.request_history)
+        assert [req.method for req in m.request_history if req.method != "POST"] == [
+            "GET",
+            "GET",
+        ]
+
+        # The release is remembered for subsequent lookups by tag
+        assert mock_release_id == default_gh_client.get_release_id_by_tag(tag)
+        assert len(dists) + 2 == len(m.request_history)
+
+
+def test_upload_dists_of_overlapping_patterns_once(
+    default_gh_client: Github,
+    tmp_path: Path,
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    for name in ("pkg-1.0.0.tar.gz", "pkg-1.0.0-py3-none-any.whl"):
+        (tmp_path / name).write_bytes(b"dist")
+
+    release_upload_url = f"{github_upload_url}/repos/releases/{mock_release_id}/assets"
+    releases_url = "{api_url}/repos/{owner}/{repo_name}/releases".format(
+        api_url=default_gh_client.api_url,
+        owner=default_gh_client.owner,
+        repo_name=default_gh_client.repo_name,
+    )
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.register_uri(
+            "GET",
+            f"{releases_url}/tags/{tag}",
+            json={
+                "id": mock_release_id,
+                "tag_name": tag,
+                "upload_url": release_upload_url + "{?name,label}",
+            },
+        )
+        m.register_uri("GET", f"{releases_url}/{mock_release_id}/assets", json=[])
+        m.register_uri("POST", github_upload_matcher, json={"status": "ok"})
+
+        # Execute method under test
+        num_uploads = default_gh_client.upload_dists(
+            tag, (str(tmp_path / "*"), str(tmp_path / "*.whl"))
+        )
+
+        # Evaluate (expected -> actual)
+        assert num_uploads == 2
+        assert sorted(
+            f"{release_upload_url}?{urlencode({'name': name})}"
+            for name in ("pkg-1.0.0.tar.gz", "pkg-1.0.0-py3-none-any.whl")
+        ) == sorted(req.url for req in m.request_history if req.method == "POST")
+        # The assets of the release are listed once for all of the patterns
+        assert (
+            sum(
+                req.path.endswith("/assets") and req.method == "GET"
+                for req in m.request_history
+            )
+            == 1
+        )
+
+
+def test_upload_dists_skips_existing_assets(
+    default_gh_client: Github,
+    tmp_path: Path,
+):
+    tag = "v1.0.0"
+    mock_release_id = 1
+    dist_contents = {
+        "uploaded.whl": b"same",
+        "different-size.whl": b"longer content",
+        "different-digest.whl": b"diff",
+        "missing.whl": b"new",
+    }
+    for name, content in dist_contents.items():
+        (tmp_path / name).write_bytes(content)
+
+    existing_assets = [
+        {
+            "id": 10,
+            "name": "uploaded.whl",
+            "size": 4,
+            "digest": f"sha256:{sha256(b'same').hexdigest()}",
+        },
+        {"id": 11, "name": "different-size.whl", "size": 4, "digest": None},
+        {
+            "id": 12,
+            "name": "different-digest.whl",
+            "size": 4,
+            "digest": f"sha256:{sha256(b'same').hexdigest()}",
+        },
+    ]
+    release_upload_url = f"{github_upload_url}/repos/releases/{mock_release_id}/assets"
+    api_repo_url = "{api_url}/repos/{owner}/{repo_name}".format(
+        api_url=default_gh_client.api_url,
+        owner=default_gh_client.owner,
+        repo_name=default_gh_client.repo_name,
+    )
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.register_uri(
+            "GET",
+            f"{api_repo_url}/releases/tags/{tag}",
+            json={
+                "id": mock_release_id,
+                "tag_name": tag,
+                "upload_url": release_upload_url + "{?name,label}",
+            },
+        )
+        m.register_uri(
+            "GET",
+            f"{api_repo_url}/releases/{mock_release_id}/assets",
+            [
+                {"json": existing_assets},
+                # The replacements were uploaded under a temporary name
+                {
+                    "json": [
+                        *existing_assets,
+                        {"id": 21, "name": "different-size.whl.uploading"},
+                        {"id": 22, "name": "different-digest.whl.uploading"},
+                        {"id": 23, "name": "missing.whl"},
+                    ]
+                },
+            ],
+        )
+        m.register_uri("DELETE", github_api_matcher, status_code=204)
+        m.register_uri("PATCH", github_api_matcher, json={"status": "ok"})
+        m.register_uri("POST", github_upload_matcher, json={"status": "ok"})
+
+        # Execute method under test
+        num_uploads = default_gh_client.upload_dists(tag, str(tmp_path / "*.whl"))
+
+        # Evaluate (expected -> actual)
+        assert num_uploads == 3
+        assert sorted(
+            f"{release_upload_url}?{urlencode({'name': name})}"
+            for name in (
+                "different-size.whl.uploading",
+                "different-digest.whl.uploading",
+                "missing.whl",
+            )
+        ) == sorted(req.url for req in m.request_history if req.method == "POST")
+        assert sorted(
+            [
+                f"{api_repo_url}/releases/assets/11",
+                f"{api_repo_url}/releases/assets/12",
+            ]
+        ) == sorted(req.url for req in m.request_history if req.method == "DELETE")
+        assert sorted(
+            [
+                (f"{api_repo_url}/releases/assets/21", {"name": "different-size.whl"}),
+                (
+                    f"{api_repo_url}/releases/assets/22",
+                    {"name": "different-digest.whl"},
+                ),
+            ]
+        ) == sorted(
+            (req.url, req.json()) for req in m.request_history if req.method == "PATCH"
+        )
+
+
 # Note - mocking as the logic for uploading an asset
 # is covered by testing above, no point re-testing.
 def test_upload_dists_when_release_id_not_found(default_gh_client):
@@ -1059,6 +1385,10 @@ def test_upload_dists_when_release_id_found(
         default_gh_client.get_release_id_by_tag.__name__,
         return_value=release_id,
     ) as mock_get_release_id_by_tag, mock.patch.object(
+        default_gh_client,
+        default_gh_client.list_release_assets.__name__,
+        return_value=[],
+    ), mock.patch.object(
         default_gh_client,
         default_gh_client.upload_release_asset.__name__,
         side_effect=upload_statuses,
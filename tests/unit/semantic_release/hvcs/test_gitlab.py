@@ -9,7 +9,9 @@ import gitlab.exceptions
 import gitlab.mixins
 import gitlab.v4.objects
 import pytest
+import requests_mock
 
+from semantic_release.errors import IncompleteReleaseError
 from semantic_release.hvcs.gitlab import Gitlab
 
 from tests.const import (
@@ -20,6 +22,7 @@ from tests.const import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Generator
 
 gitlab.Gitlab("")  # instantiation necessary to discover gitlab ProjectManager
@@ -155,7 +158,7 @@ def default_gl_client(
     example_git_https_url: str,
     default_gl_project: gitlab.v4.objects.Project,
 ) -> Generator[Gitlab, None, None]:
-    gitlab_client = Gitlab(remote_url=example_git_https_url)
+    gitlab_client = Gitlab(remote_url=example_git_https_url, use_python_gitlab=True)
 
     # make sure that when project tries to get the project instance, we return the mock
     # that we control
@@ -614,3 +617,172 @@ def test_create_or_update_release_when_create_fails_and_update_fails(
             default_gl_client.create_or_update_release(
                 A_GOOD_TAG, RELEASE_NOTES, prerelease
             )
+
+
+@pytest.fixture
+def rest_gl_client(example_git_https_url: str) -> Generator[Gitlab, None, None]:
+    with mock.patch.dict(os.environ, {}, clear=True):
+        yield Gitlab(remote_url=example_git_https_url, token="abc123")
+
+
+def project_api_url(client: Gitlab) -> str:
+    return f"{client.api_url.url}/projects/{EXAMPLE_REPO_OWNER}%2F{EXAMPLE_REPO_NAME}"
+
+
+def test_rest_create_release_succeeds(rest_gl_client: Gitlab):
+    releases_url = f"{project_api_url(rest_gl_client)}/releases"
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.post(releases_url, json={"tag_name": A_GOOD_TAG}, status_code=201)
+
+        result = rest_gl_client.create_release(A_GOOD_TAG, RELEASE_NOTES)
+
+        assert result == A_GOOD_TAG
+        assert m.call_count == 1
+        assert m.last_request.headers["PRIVATE-TOKEN"] == "abc123"
+        assert m.last_request.json() == {
+            "name": A_GOOD_TAG,
+            "tag_name": A_GOOD_TAG,
+            "tag_message": A_GOOD_TAG,
+            "description": RELEASE_NOTES,
+        }
+
+
+def test_rest_create_release_links_uploaded_assets(
+    rest_gl_client: Gitlab, tmp_path: Path
+):
+    asset = tmp_path / "pkg-1.2.3-py3-none-any.whl"
+    asset.write_bytes(b"wheel")
+    project_url = project_api_url(rest_gl_client)
+    package_file_url = str.join(
+        "/",
+        [
+            f"{project_url}/packages/generic",
+            EXAMPLE_REPO_NAME,
+            A_GOOD_TAG,
+            asset.name,
+        ],
+    )
+    links_url = f"{project_url}/releases/{A_GOOD_TAG}/assets/links"
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.post(f"{project_url}/releases", json={}, status_code=201)
+        m.put(package_file_url, json={"message": "201 Created"}, status_code=201)
+        m.post(links_url, json={"id": 1}, status_code=201)
+
+        rest_gl_client.create_release(A_GOOD_TAG, RELEASE_NOTES, assets=[str(asset)])
+
+        put_request, link_request = m.request_history[1:]
+        assert put_request.url == package_file_url
+        assert put_request.headers["Content-Length"] == str(len(b"wheel"))
+        assert link_request.json() == {
+            "name": asset.name,
+            "url": package_file_url,
+            "link_type": "package",
+        }
+
+
+def test_rest_create_release_fails_on_asset_upload(
+    rest_gl_client: Gitlab, tmp_path: Path
+):
+    asset = tmp_path / "pkg-1.2.3.tar.gz"
+    asset.write_bytes(b"sdist")
+    project_url = project_api_url(rest_gl_client)
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.post(f"{project_url}/releases", json={}, status_code=201)
+        m.put(requests_mock.ANY, status_code=403)
+
+        with pytest.raises(IncompleteReleaseError):
+            rest_gl_client.create_release(
+                A_GOOD_TAG, RELEASE_NOTES, assets=[str(asset)]
+            )
+
+
+def test_rest_create_or_update_release_when_create_fails(rest_gl_client: Gitlab):
+    project_url = project_api_url(rest_gl_client)
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.post(f"{project_url}/releases", status_code=409)
+        m.put(f"{project_url}/releases/{AN_EXISTING_TAG.replace('+', '%2B')}", json={})
+
+        result = rest_gl_client.create_or_update_release(AN_EXISTING_TAG, RELEASE_NOTES)
+
+        assert result == AN_EXISTING_TAG
+        assert m.last_request.json() == {"description": RELEASE_NOTES}
+
+
+def test_rest_create_or_update_release_when_release_is_missing(
+    rest_gl_client: Gitlab,
+):
+    project_url = project_api_url(rest_gl_client)
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.post(f"{project_url}/releases", status_code=409)
+        m.put(f"{project_url}/releases/{A_GOOD_TAG}", status_code=404)
+
+        with pytest.raises(ValueError, match="could not be found"):
+            rest_gl_client.create_or_update_release(A_GOOD_TAG, RELEASE_NOTES)
+
+
+def test_rest_get_release_by_tag(rest_gl_client: Gitlab):
+    project_url = project_api_url(rest_gl_client)
+    release = {"tag_name": A_GOOD_TAG, "name": A_GOOD_TAG, "commit": {"id": "1"}}
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.get(f"{project_url}/releases/{A_GOOD_TAG}", json=release)
+        m.get(
+            f"{project_url}/releases/{A_MISSING_TAG.replace('+', '%2B')}",
+            status_code=404,
+        )
+
+        assert rest_gl_client.get_release_by_tag(A_GOOD_TAG) == release
+        assert rest_gl_client.get_release_by_tag(A_MISSING_TAG) is None
+        # python-gitlab is not needed for any of the requests
+        assert rest_gl_client._python_gitlab_client is None
+
+
+def test_rest_edit_release_notes(rest_gl_client: Gitlab):
+    project_url = project_api_url(rest_gl_client)
+    release = {"tag_name": A_GOOD_TAG, "name": A_GOOD_TAG, "commit": {"id": "1"}}
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.put(f"{project_url}/releases/{A_GOOD_TAG}", json=release)
+
+        assert rest_gl_client.edit_release_notes(release, RELEASE_NOTES) == A_GOOD_TAG
+        assert m.last_request.json() == {"description": RELEASE_NOTES}
+        assert rest_gl_client._python_gitlab_client is None
+
+
+def test_rest_upload_dists_skips_linked_assets(rest_gl_client: Gitlab, tmp_path: Path):
+    (tmp_path / "linked.whl").write_bytes(b"linked")
+    (tmp_path / "new.whl").write_bytes(b"new")
+    project_url = project_api_url(rest_gl_client)
+    release = {"assets": {"links": [{"id": 1, "name": "linked.whl"}]}}
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.get(f"{project_url}/releases/{A_GOOD_TAG}", json=release)
+        m.put(requests_mock.ANY, json={}, status_code=201)
+        m.post(f"{project_url}/releases/{A_GOOD_TAG}/assets/links", json={})
+
+        num_uploads = rest_gl_client.upload_dists(A_GOOD_TAG, str(tmp_path / "*.whl"))
+
+        assert num_uploads == 1
+        uploaded_urls = [r.url for r in m.request_history if r.method == "PUT"]
+        assert [
+            f"{project_url}/packages/generic/{EXAMPLE_REPO_NAME}/{A_GOOD_TAG}/new.whl"
+        ] == uploaded_urls
+
+
+def test_rest_upload_dists_when_release_not_found(
+    rest_gl_client: Gitlab, tmp_path: Path
+):
+    (tmp_path / "new.whl").write_bytes(b"new")
+
+    with requests_mock.Mocker(session=rest_gl_client.session) as m:
+        m.get(
+            f"{project_api_url(rest_gl_client)}/releases/{A_GOOD_TAG}", status_code=404
+        )
+
+        assert rest_gl_client.upload_dists(A_GOOD_TAG, str(tmp_path / "*.whl")) == 0
+        assert m.call_count == 1
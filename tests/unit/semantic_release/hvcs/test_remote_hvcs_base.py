@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from unittest import mock
+
+import pytest
+
+from semantic_release.hvcs import Bitbucket, Gitea, Github, Gitlab
+
+from tests.const import EXAMPLE_REPO_NAME, EXAMPLE_REPO_OWNER
+
+
+@pytest.mark.parametrize("hvcs_client_class", (Bitbucket, Gitea, Github, Gitlab))
+@pytest.mark.parametrize(
+    "hvcs_domain, remote_url",
+    [
+        (None, f"git@example.com:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git"),
+        (
+            "https://example.com:8443/custom/prefix",
+            f"git@example.com:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git",
+        ),
+        # server path prefix chars cover all of the owner & name (lstrip quirk)
+        ("https://example.com/gitea", "git@example.com:tea/gitea.git"),
+        ("https://example.com", "git@example.com:group/sub.group/project.git"),
+    ],
+)
+@pytest.mark.parametrize(
+    "repo_path",
+    [
+        "",
+        "/",
+        "/commit/8a7b8ec",
+        "commit/8a7b8ec",
+        "/compare/v1.0.0...v1.1.0",
+        "/compare/release/v1.0.0...release/v1.1.0",
+        "//issues//./42/",
+        "/-/merge_requests/7",
+        "/branches/compare/v1.0.0%0Dv1.1.0",
+        "/./../pull/3",
+    ],
+)
+def test_create_repo_url_matches_derived_url(
+    hvcs_client_class: type[Bitbucket | Gitea | Github | Gitlab],
+    hvcs_domain: str | None,
+    remote_url: str,
+    repo_path: str,
+):
+    with mock.patch.dict(os.environ, {}, clear=True):
+        client = hvcs_client_class(remote_url=remote_url, hvcs_domain=hvcs_domain)
+
+        expected_url = client._derive_repo_url(repo_path)
+
+        # Execute method under test twice to also evaluate the memoized result
+        assert expected_url == client.create_repo_url(repo_path)
+        assert expected_url == client.create_repo_url(repo_path)
+
+
+def test_create_repo_url_with_query_and_fragment():
+    with mock.patch.dict(os.environ, {}, clear=True):
+        client = Github(
+            remote_url=f"git@github.com:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git"
+        )
+
+    expected_url = (
+        f"https://github.com/{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}/issues"
+        "?q=is:open#top"
+    )
+
+    assert expected_url == client.create_repo_url(
+        "/issues", query="q=is:open", fragment="top"
+    )
+    assert not client._repo_url_cache
+
+
+def test_create_repo_url_resets_on_repository_change():
+    with mock.patch.dict(os.environ, {}, clear=True):
+        client = Github(
+            remote_url=f"git@github.com:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git"
+        )
+
+    assert (
+        f"https://github.com/{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}/commit/abc"
+        == client.create_repo_url("/commit/abc")
+    )
+
+    client._owner = "new_owner"
+
+    assert (
+        f"https://github.com/new_owner/{EXAMPLE_REPO_NAME}/commit/abc"
+        == client.create_repo_url("/commit/abc")
+    )
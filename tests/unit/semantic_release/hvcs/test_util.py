@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from hashlib import sha256
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pytest
+from requests import HTTPError
+
+from semantic_release.hvcs.util import (
+    RateLimitScheduler,
+    UploadProgress,
+    UploadStream,
+    build_requests_session,
+    find_dist_files,
+    plan_asset_uploads,
+    upload_assets_concurrently,
+)
+
+from tests.fixtures.fake_forge import FAKE_FORGE_OWNER, FAKE_FORGE_REPO, FakeForge
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("max_workers", (1, 2, 8))
+def test_upload_assets_concurrently_collects_errors(max_workers: int):
+    assets = [f"dist/pkg-{i}.whl" for i in range(10)]
+    failing_assets = set(assets[1::3])
+
+    def upload_asset(asset: str) -> None:
+        if asset in failing_assets:
+            raise HTTPError(f"failed to upload {asset}")
+
+    results = upload_assets_concurrently(
+        upload_asset, iter(assets), max_workers=max_workers
+    )
+
+    assert assets == list(results.keys())
+    assert failing_assets == {
+        asset for asset, err in results.items() if isinstance(err, HTTPError)
+    }
+    assert all(
+        results[asset] is None for asset in assets if asset not in failing_assets
+    )
+
+
+def test_upload_assets_concurrently_bounds_parallel_uploads():
+    max_workers = 3
+    lock = threading.Lock()
+    in_progress = 0
+    max_in_progress = 0
+
+    def upload_asset(_: str) -> None:
+        nonlocal in_progress, max_in_progress
+        with lock:
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+        time.sleep(0.05)
+        with lock:
+            in_progress -= 1
+
+    results = upload_assets_concurrently(
+        upload_asset, [f"asset-{i}" for i in range(9)], max_workers=max_workers
+    )
+
+    assert len(results) == 9
+    assert max_workers == max_in_progress
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_upload_assets_concurrently_raises_unexpected_errors(max_workers: int):
+    def upload_asset(asset: str) -> None:
+        if asset == "missing.whl":
+            raise FileNotFoundError(asset)
+
+    with pytest.raises(FileNotFoundError):
+        upload_assets_concurrently(
+            upload_asset, ["a.whl", "missing.whl", "b.whl"], max_workers=max_workers
+        )
+
+
+def test_upload_stream_reads_in_blocks(caplog: pytest.LogCaptureFixture):
+    content = bytes(range(256)) * 400
+    stream = UploadStream(
+        BytesIO(content), len(content), UploadProgress("pkg.whl", len(content))
+    )
+
+    assert len(content) == len(stream)
+
+    chunks = []
+    with caplog.at_level(logging.DEBUG, logger="semantic_release.hvcs.util"):
+        while chunk := stream.read(8192):
+            assert len(chunk) <= 8192
+            chunks.append(chunk)
+
+    progress_logs = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Uploading pkg.whl")
+    ]
+
+    assert content == b"".join(chunks)
+    assert len(stream) == 0
+    assert len(progress_logs) == 10
+    assert (
+        progress_logs[-1]
+        == f"Uploading pkg.whl: 100% ({len(content)} of {len(content)} bytes)"
+    )
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def releases_url(forge: FakeForge) -> str:
+    return f"{forge.url}/api/v3/repos/{FAKE_FORGE_OWNER}/{FAKE_FORGE_REPO}/releases"
+
+
+def test_rate_limit_scheduler_retries_after_secondary_limit(fake_forge: FakeForge):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+
+    fake_forge.inject_failure(403, headers={"Retry-After": "30"})
+    fake_forge.inject_failure(429, headers={"Retry-After": "5"})
+
+    assert session.get(releases_url(fake_forge)).status_code == 200
+    assert [request.status for request in fake_forge.requests] == [403, 429, 200]
+    assert clock.sleeps == [30.0, 5.0]
+    assert scheduler.metrics.requests == 3
+    assert scheduler.metrics.rate_limited_responses == 2
+    assert scheduler.metrics.retries == 2
+    assert scheduler.metrics.wait_seconds == 35.0
+
+
+def test_rate_limit_scheduler_waits_for_reset_of_exhausted_limit(
+    fake_forge: FakeForge,
+):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+    reset_at = str(int(clock.now) + 60)
+
+    fake_forge.inject_failure(
+        403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_at}
+    )
+
+    response = session.post(releases_url(fake_forge), json={"tag_name": "v1.0.0"})
+
+    assert response.status_code == 201
+    assert [request.status for request in fake_forge.requests] == [403, 201]
+    assert clock.sleeps == [60.0]
+
+
+def test_rate_limit_scheduler_reads_gitlab_headers(fake_forge: FakeForge):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+    reset_at = str(int(clock.now) + 45)
+
+    # GitLab names the headers without the X- prefix
+    fake_forge.inject_failure(
+        429, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": reset_at}
+    )
+
+    assert session.get(releases_url(fake_forge)).status_code == 200
+    assert [request.status for request in fake_forge.requests] == [429, 200]
+    assert clock.sleeps == [45.0]
+
+
+def test_rate_limit_scheduler_paces_requests_near_the_limit():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(
+        min_remaining=10, clock=clock.time, sleep=clock.sleep
+    )
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+
+    # The forge reports 3 remaining requests after the first one, which resets in
+    # 40 seconds
+    with FakeForge(rate_limit=4, rate_limit_window=40, clock=clock.time) as forge:
+        for _ in range(3):
+            session.get(releases_url(forge))
+
+    # The 3 remaining requests are spread over the 40 seconds until the reset
+    assert [request.status for request in forge.requests] == [200] * 3
+    assert clock.sleeps == [10.0, 10.0]
+    assert scheduler.metrics.throttled_requests == 2
+    assert scheduler.metrics.retries == 0
+
+
+def test_rate_limit_scheduler_ignores_unrelated_errors(fake_forge: FakeForge):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+
+    fake_forge.inject_failure(403, headers={"X-RateLimit-Remaining": "4999"})
+
+    with pytest.raises(HTTPError):
+        session.get(releases_url(fake_forge))
+
+    assert len(fake_forge.requests) == 1
+    assert not clock.sleeps
+    assert scheduler.metrics.rate_limited_responses == 0
+
+
+def test_rate_limit_scheduler_retries_after_github_secondary_limit(
+    fake_forge: FakeForge,
+):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+
+    # Neither a Retry-After header nor an exhausted limit identify the response
+    fake_forge.inject_failure(
+        403,
+        headers={"X-RateLimit-Remaining": "4990"},
+        body={
+            "message": "You have exceeded a secondary rate limit. Please wait a "
+            "few minutes before you try again."
+        },
+    )
+
+    response = session.post(releases_url(fake_forge), json={"tag_name": "v1.0.0"})
+
+    assert response.status_code == 201
+    assert [request.status for request in fake_forge.requests] == [403, 201]
+    assert clock.sleeps == [60.0]
+    assert scheduler.metrics.rate_limited_responses == 1
+
+
+def test_rate_limit_scheduler_gives_up_after_max_retries(fake_forge: FakeForge):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(max_retries=2, clock=clock.time, sleep=clock.sleep)
+    session = build_requests_session(retry=False, rate_limit=scheduler)
+
+    fake_forge.inject_failure(403, headers={"Retry-After": "1"}, times=4)
+
+    with pytest.raises(HTTPError):
+        session.get(releases_url(fake_forge))
+
+    assert len(fake_forge.requests) == 3
+    assert clock.sleeps == [1.0, 1.0]
+
+    # Waits beyond max_wait are never made
+    fake_forge.failures.clear()
+    fake_forge.inject_failure(403, headers={"Retry-After": "3600"})
+
+    with pytest.raises(HTTPError):
+        session.get(releases_url(fake_forge))
+
+    assert len(fake_forge.requests) == 4
+    assert clock.sleeps == [1.0, 1.0]
+
+
+def test_find_dist_files_dedupes_overlapping_patterns(tmp_path: Path):
+    dist_dir = tmp_path / "dist"
+    (dist_dir / "nested").mkdir(parents=True)
+    dist_names = ("pkg-1.0.0.tar.gz", "pkg-1.0.0-py3-none-any.whl")
+    for name in dist_names:
+        (dist_dir / name).write_bytes(b"dist")
+    dist_files = sorted(str(dist_dir / name) for name in dist_names)
+
+    # Directories are left out, files matched by several patterns are found once
+    assert dist_files == sorted(find_dist_files(str(dist_dir / "*")))
+    assert dist_files == sorted(
+        find_dist_files(
+            [str(dist_dir / "*"), str(dist_dir / "*.whl"), str(tmp_path / "**/*.whl")]
+        )
+    )
+
+
+def test_plan_asset_uploads(tmp_path: Path):
+    files = {
+        "same.whl": b"content",
+        "same-without-digest.whl": b"content",
+        "resized.whl": b"new content",
+        "rebuilt.whl": b"CONTENT",
+        "missing.whl": b"content",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_bytes(content)
+
+    digest = f"sha256:{sha256(b'content').hexdigest()}"
+    existing_assets = [
+        {"id": 1, "name": "same.whl", "size": 7, "digest": digest},
+        {"id": 2, "name": "same-without-digest.whl", "size": 7},
+        {"id": 3, "name": "resized.whl", "size": 7, "digest": digest},
+        {"id": 4, "name": "rebuilt.whl", "size": 7, "digest": digest},
+        {"id": 5, "name": "unrelated.whl", "size": 7},
+    ]
+
+    uploads, replaced_asset_ids = plan_asset_uploads(
+        [str(tmp_path / name) for name in files], existing_assets
+    )
+
+    assert [
+        str(tmp_path / "resized.whl"),
+        str(tmp_path / "rebuilt.whl"),
+        str(tmp_path / "missing.whl"),
+    ] == uploads
+    assert replaced_asset_ids == {
+        str(tmp_path / "resized.whl"): 3,
+        str(tmp_path / "rebuilt.whl"): 4,
+    }
+
+
+def test_conditional_get_cache_revalidates_across_sessions(tmp_path: Path):
+    cache_dir = tmp_path / "http-cache"
+
+    with FakeForge(rate_limit=5000) as forge:
+        url = releases_url(forge)
+        first_response = build_requests_session(cache_dir=cache_dir).get(url)
+        # A new session, as used by a subsequent command of the same pipeline
+        second_response = build_requests_session(cache_dir=cache_dir).get(url)
+
+    assert [request.status for request in forge.requests] == [200, 304]
+    assert first_response.json() == []
+    assert second_response.status_code == 200
+    assert second_response.json() == []
+    # The headers of the revalidation are merged into the cached response
+    assert second_response.headers["X-RateLimit-Remaining"] == "4998"
+    assert second_response.headers["Content-Type"] == "application/json"
+
+
+def test_conditional_get_cache_separates_credentials(
+    fake_forge: FakeForge, tmp_path: Path
+):
+    url = releases_url(fake_forge)
+    session = build_requests_session(cache_dir=tmp_path)
+
+    session.get(url, headers={"Authorization": "token first"})
+    session.get(url, headers={"Authorization": "token second"})
+    session.get(url, headers={"Authorization": "token first"})
+
+    assert [request.status for request in fake_forge.requests] == [200, 200, 304]
+    assert all(
+        "token" not in path.read_text(errors="ignore") for path in tmp_path.iterdir()
+    )
+
+
+def test_conditional_get_cache_ignores_other_methods(
+    fake_forge: FakeForge, tmp_path: Path
+):
+    session = build_requests_session(cache_dir=tmp_path)
+
+    session.post(releases_url(fake_forge), json={"tag_name": "v1.0.0"})
+    session.post(releases_url(fake_forge), json={"tag_name": "v1.1.0"})
+
+    assert [request.status for request in fake_forge.requests] == [201, 201]
+    assert not list(tmp_path.iterdir())
+
+
+def test_rate_limit_scheduler_logs_metrics(caplog: pytest.LogCaptureFixture):
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(clock=clock.time, sleep=clock.sleep)
+
+    with caplog.at_level(logging.DEBUG):
+        scheduler.log_metrics()
+        assert not caplog.records
+
+        scheduler.before_request()
+        scheduler.wait_for_retry(2.0)
+        scheduler.log_metrics()
+
+    assert caplog.records[-1].levelno == logging.DEBUG
+    assert caplog.records[-1].getMessage() == (
+        "Rate limiting of the requests to the remote VCS: RateLimitMetrics("
+        "requests=1, throttled_requests=0, rate_limited_responses=0, retries=1, "
+        "wait_seconds=2.00)"
+    )
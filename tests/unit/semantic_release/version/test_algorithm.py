@@ -1,15 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 from git import Commit, Repo, TagReference
 
+from semantic_release.commit_parser import AngularCommitParser
 from semantic_release.enums import LevelBump
 from semantic_release.version.algorithm import (
     _bfs_for_latest_version_in_history,
     _increment_version,
+    next_version,
     tags_and_versions,
 )
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
+from tests.util import add_text_to_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_bfs_for_latest_version_in_history():
     # Setup fake git graph
@@ -395,3 +406,36 @@ def test_increment_version_no_major_on_zero(
         allow_zero_version=True,
     )
     assert expected_version == str(actual)
+
+
+def test_next_version_with_path_filters(tmp_path: Path):
+    parser = AngularCommitParser()
+    translator = VersionTranslator()
+
+    with Repo.init(tmp_path) as repo:
+        for message, filename in (
+            ("feat: add a", "a.py"),
+            ("chore(release): 1.0.0", "CHANGELOG.md"),
+        ):
+            add_text_to_file(repo, filename)
+            repo.index.commit(message)
+        repo.create_tag("v1.0.0")
+        for message, filename in (("feat: add b", "b.py"), ("fix: fix a", "a.py")):
+            add_text_to_file(repo, filename)
+            repo.index.commit(message)
+
+        assert Version.parse("1.1.0") == next_version(repo, translator, parser)
+        assert Version.parse("1.0.1") == next_version(
+            repo, translator, parser, path_filters=("a.py",)
+        )
+
+        # the tags of prereleases are found although their commits aren't parsed
+        add_text_to_file(repo, "CHANGELOG.md")
+        repo.index.commit("chore(release): 1.0.1-rc.1")
+        repo.create_tag("v1.0.1-rc.1")
+        add_text_to_file(repo, "a.py")
+        repo.index.commit("fix: fix a again")
+
+        assert Version.parse("1.0.1-rc.2") == next_version(
+            repo, translator, parser, prerelease=True, path_filters=("a.py",)
+        )
@@ -1,14 +1,20 @@
 import difflib
+import os
 from pathlib import Path
 from textwrap import dedent
 from unittest import mock
 
 import pytest
+from git import Repo
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
 from semantic_release.version.declaration import (
     PatternVersionDeclaration,
     TomlVersionDeclaration,
+    VariableVersionScanner,
+    find_declaration_files,
+    is_glob_pattern,
+    stamp_version,
 )
 from semantic_release.version.version import Version
 
@@ -136,3 +142,230 @@ def test_setup_cfg_no_version(tmp_path):
 def test_version_decl_error_on_missing_file(decl_cls):
     with pytest.raises(FileNotFoundError):
         decl_cls("/this/is/definitely/a/missing/path/asdfghjkl", "random search text")
+
+
+def test_stamp_version_applies_every_declaration_of_a_file(tmp_path):
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text(
+        dedent(
+            """\
+            [project]
+            version = "0.1.0"
+
+            [tool.example]
+            version = "0.1.0"
+            banner = "example v0.1.0"
+            """
+        )
+    )
+    declarations = [
+        TomlVersionDeclaration(pyproject_toml, "project.version"),
+        TomlVersionDeclaration(pyproject_toml, "tool.example.version"),
+        PatternVersionDeclaration(
+            pyproject_toml, r"banner = \"example v(?P<version>.*)\""
+        ),
+    ]
+    # previously parsed content must not clobber the other declarations
+    for declaration in declarations:
+        declaration.parse()
+
+    with mock.patch("os.replace", wraps=os.replace) as mock_replace:
+        paths = stamp_version(declarations, Version(1, 0, 0))
+
+    assert paths == [pyproject_toml.resolve()]
+    assert mock_replace.call_count == 1
+    assert pyproject_toml.read_text() == dedent(
+        """\
+        [project]
+        version = "1.0.0"
+
+        [tool.example]
+        version = "1.0.0"
+        banner = "example v1.0.0"
+        """
+    )
+    assert all(decl.parse() == {Version(1, 0, 0)} for decl in declarations)
+
+
+def test_stamp_version_updates_separate_files(tmp_path):
+    files = [tmp_path / f"pkg_{i}" / "__init__.py" for i in range(4)]
+    for file in files:
+        file.parent.mkdir()
+        file.write_text('__version__ = "0.1.0"\n')
+        file.chmod(0o640)
+
+    stamp_version(
+        [
+            PatternVersionDeclaration(file, r'__version__ = "(?P<version>.*)"')
+            for file in files
+        ],
+        Version(0, 2, 0),
+    )
+
+    assert [file.read_text() for file in files] == ['__version__ = "0.2.0"\n'] * 4
+    assert all(file.stat().st_mode & 0o777 == 0o640 for file in files)
+    # No temporary files are left behind
+    assert sorted(tmp_path.rglob("*")) == sorted([*files, *(f.parent for f in files)])
+
+
+def test_stamp_version_keeps_file_when_write_fails(tmp_path):
+    init_py = tmp_path / "__init__.py"
+    init_py.write_text('__version__ = "0.1.0"\n')
+    decl = PatternVersionDeclaration(init_py, r'__version__ = "(?P<version>.*)"')
+
+    with mock.patch("os.replace", side_effect=OSError), pytest.raises(OSError):
+        stamp_version([decl], Version(0, 2, 0))
+
+    assert init_py.read_text() == '__version__ = "0.1.0"\n'
+    assert list(tmp_path.iterdir()) == [init_py]
+
+
+VARIABLES_CONTENT = dedent(
+    """\
+    __version__ = "1.0.0"
+    VERSION = '1.0.0'
+    "version": "1.0.0-rc.1",
+    other_version = "9.9.9"
+    """
+)
+
+
+def test_variable_scanner_matches_single_variable_declarations(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text(VARIABLES_CONTENT)
+    variables = ["__version__", "VERSION", "version"]
+    declarations = [
+        PatternVersionDeclaration.from_variable(source, variable)
+        for variable in variables
+    ]
+    scanner = VariableVersionScanner(variables)
+
+    expected_content = VARIABLES_CONTENT
+    for decl in declarations:
+        expected_content = decl.replace_in(expected_content, Version(2, 0, 0))
+
+    assert scanner.replace(VARIABLES_CONTENT, Version(2, 0, 0)) == expected_content
+    assert 'other_version = "9.9.9"' in expected_content
+
+
+def test_variable_scanner_skips_content_without_variables():
+    scanner = VariableVersionScanner(["__version__", "VERSION"])
+    scanner.search_re = mock.Mock()
+
+    content = 'name = "example"\n'
+    assert scanner.replace(content, Version(2, 0, 0)) == content
+    scanner.search_re.subn.assert_not_called()
+
+
+def test_stamp_version_scans_version_variables_once_per_file(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text(VARIABLES_CONTENT)
+    declarations = [
+        PatternVersionDeclaration.from_variable(source, variable)
+        for variable in ("__version__", "VERSION", "version")
+    ]
+
+    with mock.patch.object(
+        VariableVersionScanner,
+        VariableVersionScanner.replace.__name__,
+        autospec=True,
+        side_effect=lambda _, content, __: content,
+    ) as mock_replace:
+        stamp_version(declarations, Version(2, 0, 0))
+
+    mock_replace.assert_called_once()
+
+
+def test_stamp_version_keeps_configured_order_of_declarations(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text(VARIABLES_CONTENT)
+    declarations = [
+        PatternVersionDeclaration.from_variable(source, "__version__"),
+        PatternVersionDeclaration.from_variable(source, "VERSION"),
+        PatternVersionDeclaration(source, r'other_version = "(?P<version>.*)"'),
+        PatternVersionDeclaration.from_variable(source, "version"),
+    ]
+    applied = []
+
+    def record(name, content):
+        applied.append(name)
+        return content
+
+    with mock.patch.object(
+        VariableVersionScanner,
+        VariableVersionScanner.replace.__name__,
+        autospec=True,
+        side_effect=lambda scanner, content, _: record(scanner.variables, content),
+    ), mock.patch.object(
+        PatternVersionDeclaration,
+        PatternVersionDeclaration.replace_in.__name__,
+        autospec=True,
+        side_effect=lambda decl, content, _: record(decl.search_text, content),
+    ):
+        stamp_version(declarations, Version(2, 0, 0))
+
+    assert applied == [
+        ("__version__", "VERSION"),
+        r'other_version = "(?P<version>.*)"',
+        ("version",),
+    ]
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("src/pkg/__init__.py", False),
+        ("packages/*/__about__.py", True),
+        ("packages/**/package.json", True),
+        ("pkg-v?.toml", True),
+        ("pkg-[ab].toml", True),
+    ],
+)
+def test_is_glob_pattern(path: str, expected: bool):
+    assert expected == is_glob_pattern(path)
+
+
+def test_is_glob_pattern_of_existing_path_with_brackets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pkg[extra]").mkdir()
+    (tmp_path / "pkg[extra]" / "version.py").write_text('__version__ = "1.0.0"\n')
+
+    assert not is_glob_pattern("pkg[extra]/version.py")
+    assert is_glob_pattern("pkg[extra]/*.py")
+
+
+def test_find_declaration_files(tmp_path):
+    files = {
+        "packages/a/__about__.py": '__version__ = "1.0.0"\n',
+        "packages/b/nested/__about__.py": '__version__ = "1.0.0"\n',
+        "packages/c/__about__.py": '__author__ = "me"\n',
+        "packages/d/__about__.py": "",
+        "build/packages/a/__about__.py": '__version__ = "1.0.0"\n',
+        "__about__.py": '__version__ = "1.0.0"\n',
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content)
+    (tmp_path / ".gitignore").write_text("build/\n")
+
+    with Repo.init(tmp_path) as repo:
+        # tracked & untracked files are found alike
+        repo.index.add(["packages/a/__about__.py"])
+
+    pattern = "packages/**/__about__.py"
+
+    assert sorted(find_declaration_files(tmp_path, pattern)) == [
+        tmp_path / name
+        for name in (
+            "packages/a/__about__.py",
+            "packages/b/nested/__about__.py",
+            "packages/c/__about__.py",
+            "packages/d/__about__.py",
+        )
+    ]
+    assert sorted(find_declaration_files(tmp_path, pattern, "__version__")) == [
+        tmp_path / "packages/a/__about__.py",
+        tmp_path / "packages/b/nested/__about__.py",
+    ]
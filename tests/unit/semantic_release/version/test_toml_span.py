@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+import pytest
+import tomlkit
+
+from semantic_release.version.declaration import TomlVersionDeclaration
+from semantic_release.version.toml_span import find_string_value_span
+from semantic_release.version.version import Version
+
+PYPROJECT_TOML = dedent(
+    """\
+    # a comment with [tool.poetry] in it
+    [project]
+    name = "example"
+    dependencies = [
+        "requests[socks] >= 2.0",  # version = "0.0.0"
+        'tomlkit ~= 0.11',
+    ]
+    description = \"\"\"
+    [tool.poetry]
+    version = "0.0.0"
+    \"\"\"
+
+    [tool . "poetry"]
+    version   =   '1.2.3'   # keep this comment
+    extras = { all = ["a", "b"] }
+
+    [tool.example]
+    nested.version = "4.5.6"
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "key, expected_value",
+    [
+        ("project.name", "example"),
+        ("tool.poetry.version", "1.2.3"),
+        ("tool.example.nested.version", "4.5.6"),
+    ],
+)
+def test_find_string_value_span(key: str, expected_value: str):
+    span = find_string_value_span(PYPROJECT_TOML, key)
+
+    assert span is not None
+    assert PYPROJECT_TOML[span[0] : span[1]] == expected_value
+    assert expected_value == _get(tomlkit.loads(PYPROJECT_TOML), key)
+
+
+@pytest.mark.parametrize(
+    "content, key",
+    [
+        # missing key
+        (PYPROJECT_TOML, "tool.poetry.name"),
+        # inline table
+        ('tool = { poetry = { version = "1.0.0" } }\n', "tool.poetry.version"),
+        ('[tool]\npoetry = { version = "1.0.0" }\n', "tool.poetry.version"),
+        # array of tables
+        ('[[tool.poetry]]\nversion = "1.0.0"\n', "tool.poetry.version"),
+        # not a plain string
+        ("[tool.poetry]\nversion = 1\n", "tool.poetry.version"),
+        ('[tool.poetry]\nversion = "1.0\\u0030"\n', "tool.poetry.version"),
+        ('[tool.poetry]\nversion = """1.0.0"""\n', "tool.poetry.version"),
+    ],
+)
+def test_find_string_value_span_leaves_unsupported_syntax(content: str, key: str):
+    assert find_string_value_span(content, key) is None
+
+
+def test_toml_declaration_edits_value_in_place(tmp_path):
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text(PYPROJECT_TOML)
+    decl = TomlVersionDeclaration(pyproject_toml, "tool.poetry.version")
+
+    new_content = decl.replace(Version(2, 0, 0))
+
+    assert decl.parse() == {Version(1, 2, 3)}
+    assert new_content == PYPROJECT_TOML.replace(
+        "version   =   '1.2.3'", "version   =   '2.0.0'"
+    )
+
+
+def test_toml_declaration_falls_back_to_tomlkit(tmp_path):
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text('[tool]\npoetry = { version = "1.0.0" }\n')
+    decl = TomlVersionDeclaration(pyproject_toml, "tool.poetry.version")
+
+    assert decl.parse() == {Version(1, 0, 0)}
+    assert decl.replace(Version(1, 1, 0)) == '[tool]\npoetry = { version = "1.1.0" }\n'
+
+
+def _get(document: dict, key: str) -> str:
+    value = document
+    for part in key.split("."):
+        value = value[part]
+    return str(value)